@@ -0,0 +1,197 @@
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from data_fetchers.minute_bar_store import MinuteBarStore, MinuteBars, BAR_COLUMNS
+from data_fetchers.memmap_columns import column_file
+from data_fetchers.cpi_fetcher import fetch_cpi_rows
+from data_fetchers.fed_fetcher import fetch_fed_rows
+from logic.impact.intraday import (
+    INTRADAY_WINDOWS, MAX_STALE, SESSION_OPEN, SESSION_CLOSE, intraday_returns, release_timestamps,
+)
+
+NY = "America/New_York"
+
+def synthetic_bars(start: str, end: str, seed: int = 0, extended: bool = False) -> pd.DataFrame:
+    """
+    Random-walk 1-minute OHLCV bars on every weekday in [start, end): 09:30-16:00 New York,
+    or 04:00-20:00 with extended=True. Indexed by UTC bar start.
+    """
+    days = pd.bdate_range(start, end, inclusive="left")
+    first, last = (pd.Timedelta(hours=4), pd.Timedelta(hours=20)) if extended else (SESSION_OPEN, SESSION_CLOSE)
+    offsets = pd.timedelta_range(first, last, freq="min", closed="left")
+    wall = (days.values[:, None] + offsets.values[None, :]).reshape(-1)
+    index = pd.DatetimeIndex(wall).tz_localize(NY).tz_convert("UTC")
+
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 5e-4, len(index))))
+    open_ = np.concatenate([[100.0], close[:-1]])
+    wick = np.abs(rng.normal(0, 2e-4, (2, len(index))))
+    return pd.DataFrame({
+        "Open": open_,
+        "High": np.maximum(open_, close) * (1 + wick[0]),
+        "Low": np.minimum(open_, close) * (1 - wick[1]),
+        "Close": close,
+        "Volume": rng.integers(100, 50_000, len(index)).astype("float64"),
+    }, index=index)
+
+def _ny(day: str, clock: str) -> pd.Timestamp:
+    return pd.Timestamp(f"{day} {clock}", tz=NY)
+
+def naive_returns(release_ts, frame: pd.DataFrame, windows: dict, max_stale: int = MAX_STALE) -> np.ndarray:
+    """Row-by-row reference for intraday_returns on a bar frame."""
+    idx = frame.index
+    out = np.full((len(release_ts), len(windows)), np.nan)
+    for r, ts in enumerate(release_ts):
+        if pd.isna(ts):
+            continue
+        day = ts.tz_convert(NY).normalize().tz_localize(None)
+        open_t = (day + SESSION_OPEN).tz_localize(NY)
+        close_t = (day + SESSION_CLOSE).tz_localize(NY)
+
+        def price(end):
+            if end == "open":
+                bars = frame[(idx >= open_t) & (idx < close_t)]
+                return bars["Open"].iloc[0] if len(bars) else np.nan
+            if end == "close":
+                bars = frame[(idx >= open_t) & (idx < close_t)]
+                return bars["Close"].iloc[-1] if len(bars) else np.nan
+            t = ts + pd.Timedelta(minutes=end)
+            bars = frame[idx < t]
+            if not len(bars) or t - (bars.index[-1] + pd.Timedelta(minutes=1)) > pd.Timedelta(minutes=max_stale):
+                return np.nan
+            return bars["Close"].iloc[-1]
+
+        for k, (start, end) in enumerate(windows.values()):
+            out[r, k] = price(end) / price(start) - 1
+    return out
+
+def fixture_checks() -> int:
+    """Hand-built bars with known answers."""
+    checks = 0
+    day = "2024-03-12"   # CPI day, EDT
+    minutes = pd.date_range(_ny(day, "09:30"), _ny(day, "16:00"), freq="min", inclusive="left")
+    flat = pd.DataFrame({c: 100.0 for c in ("Open", "High", "Low", "Close")} | {"Volume": 1.0}, index=minutes)
+    step = flat.copy()
+    step.loc[step.index >= _ny(day, "10:00"), ["Open", "High", "Low", "Close"]] = 101.0
+    bars = MinuteBars.from_frame(step)
+
+    ret = intraday_returns(pd.Series([_ny(day, "10:00")]), bars)
+    assert np.allclose(ret, [[0.01, 0.01, 0.01]]), ret
+    checks += 1
+
+    # 08:30 release with regular-hours bars: no minute prices, session window still priced
+    ret = intraday_returns(pd.Series([_ny(day, "08:30")]), bars)
+    assert np.isnan(ret[0, :2]).all() and np.isclose(ret[0, 2], 0.01), ret
+    checks += 1
+
+    # Gap: the -5m anchor (09:55) would be priced by the 09:34 bar, 20 minutes stale -> NaN
+    gappy = MinuteBars.from_frame(step[(step.index < _ny(day, "09:35")) | (step.index >= _ny(day, "10:30"))])
+    ret = intraday_returns(pd.Series([_ny(day, "10:00")]), gappy)
+    assert np.isnan(ret[0, 0]) and np.isclose(ret[0, 2], 0.01), ret
+    assert np.isclose(intraday_returns(pd.Series([_ny(day, "10:00")]), gappy, max_stale=30)[0, 0], 0.0)
+    checks += 1
+
+    # Unknown release time, and a day with no bars
+    ret = intraday_returns(pd.Series([pd.NaT, _ny("2024-03-13", "10:00")]), bars)
+    assert np.isnan(ret).all(), ret
+    checks += 1
+
+    # Page clock (GMT-4) -> New York: 08:30 in summer, 09:30 in winter are both 08:30 ET
+    ts = release_timestamps(["Aug 01, 2025  (Jul)", "Jan 10, 2025  (Dec)", "Sep 17, 2025", "Sep 17, 2025"],
+                            ["08:30", "09:30", "14:00", ""])
+    assert list(ts[:3].dt.strftime("%H:%M")) == ["08:30", "08:30", "14:00"] and pd.isna(ts[3]), ts
+    checks += 1
+    return checks
+
+def store_checks(tmp: str) -> int:
+    """Round trip, in-place append, overlapping append and recovery from a torn append."""
+    store = MinuteBarStore(os.path.join(tmp, "bars"))
+    bars = synthetic_bars("2024-01-01", "2024-02-01", seed=1)
+    head, tail = bars.iloc[:5000], bars.iloc[5000:]
+
+    assert store.write("ivv", head) == 5000 and store.tickers() == ["IVV"]
+    assert store.append("IVV", tail) == len(tail)
+    got = store.read("IVV")
+    assert isinstance(got.close, np.memmap) and len(got) == len(bars)
+    expect = bars.astype("float32").astype("float64")
+    expect.index = expect.index.as_unit("ns")
+    pd.testing.assert_frame_equal(got.frame(), expect.rename_axis("Minute"), check_freq=False)
+
+    # Corrected bars inside the stored range: merged, new values win
+    fix = bars.iloc[100:110].assign(Close=1.0)
+    store.append("IVV", fix)
+    assert (store.read("IVV").frame()["Close"].iloc[100:110] == 1.0).all()
+
+    # Torn append: one column longer than the rest is ignored, then trimmed by the next append
+    path = os.path.join(store.path("IVV"), column_file("close", BAR_COLUMNS["close"]))
+    with open(path, "ab") as f:
+        f.write(np.ones(7, BAR_COLUMNS["close"]).tobytes())
+    assert len(store.read("IVV")) == len(bars)
+    more = synthetic_bars("2024-02-01", "2024-02-02", seed=2)
+    store.append("IVV", more)
+    assert len(store.read("IVV")) == len(bars) + len(more)
+    assert os.path.getsize(path) == (len(bars) + len(more)) * BAR_COLUMNS["close"].itemsize
+    return 4
+
+def release_times() -> pd.Series:
+    """Actual CPI and Fed release timestamps from the saved pages."""
+    rows = fetch_cpi_rows() + fetch_fed_rows()
+    return release_timestamps([r.date for r in rows], [r.time for r in rows])
+
+def _time(fn, runs: int):
+    best, out = float("inf"), None
+    for _ in range(runs):
+        t = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t)
+    return best, out
+
+def main():
+    ap = argparse.ArgumentParser(description="Intraday reaction windows: fixture checks and minute-bar store/engine cost")
+    ap.add_argument("--years", type=int, default=20, help="years of synthetic 1-minute bars (extended hours)")
+    ap.add_argument("--events", type=int, default=10_000, help="synthetic release times to price")
+    ap.add_argument("--naive", type=int, default=200, help="events checked against the row-by-row reference")
+    ap.add_argument("--runs", type=int, default=3)
+    args = ap.parse_args()
+
+    print(f"fixtures: {fixture_checks()} checks ok")
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"store:    {store_checks(tmp)} checks ok")
+
+        start = pd.Timestamp("2025-01-01") - pd.DateOffset(years=args.years)
+        bars = synthetic_bars(start, "2025-01-01", extended=True)
+        store = MinuteBarStore(os.path.join(tmp, "bars"))
+        t_write, _ = _time(lambda: store.write("IVV", bars), 1)
+        size = sum(os.path.getsize(os.path.join(store.path("IVV"), column_file(c, dt))) for c, dt in BAR_COLUMNS.items())
+
+        rng = np.random.default_rng(0)
+        picks = rng.choice(len(bars), args.events)
+        events = pd.Series(bars.index[picks].tz_convert(NY)).sort_values(ignore_index=True)
+        real = release_times()
+        real = real[(real >= bars.index[0]) & (real < bars.index[-1])].reset_index(drop=True)
+
+        t_open, mapped = _time(lambda: store.read("IVV"), args.runs)
+        t_vec, ret = _time(lambda: intraday_returns(events, store.read("IVV")), args.runs)
+        sample = events.iloc[:args.naive]
+        t_naive, ref = _time(lambda: naive_returns(sample, mapped.frame(), INTRADAY_WINDOWS), 1)
+        np.testing.assert_allclose(ret[:args.naive], ref, rtol=1e-12, equal_nan=True)
+        real_ret = intraday_returns(real, mapped)
+        np.testing.assert_allclose(real_ret, naive_returns(real, mapped.frame(), INTRADAY_WINDOWS), rtol=1e-12, equal_nan=True)
+
+    print(f"\nbars: {len(bars):,} ({args.years} years, 04:00-20:00)   on disk: {size / 1e6:.1f} MB   write: {t_write:.2f} s")
+    print(f"open (memmap): {t_open * 1e3:.2f} ms")
+    print(f"{'events':>10}{'engine ms':>11}{'naive ms':>10}{'per event us (engine / naive)':>33}")
+    print(f"{args.events:>10,}{t_vec * 1e3:>11.1f}{'':>10}{t_vec / args.events * 1e6:>15.2f}")
+    print(f"{args.naive:>10,}{'':>11}{t_naive * 1e3:>10.0f}{'':>18}{t_naive / args.naive * 1e6:>15.0f}")
+    priced = np.isfinite(real_ret).mean(axis=0) * 100
+    print(f"\nreal CPI/Fed releases in range: {len(real)}; priced: "
+          + ", ".join(f"{w} {p:.0f}%" for w, p in zip(INTRADAY_WINDOWS, priced)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import argparse
+import contextlib
+import dataclasses
+import io
+import shutil
+import tempfile
+import time
+
+import pandas as pd
+import main as summaries
+from data_fetchers.cpi_fetcher import fetch_cpi_rows
+from logic.impact.event_db import EventDatabase, WITH_RETURNS_PATHS
+from logic.impact.online_stats import OnlineEventStats
+from models.cpi_report_row import CpiReportRow
+from scripts import cpi_returns_demo
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# A CPI release the saved pages do not have, on a session data/ivv_prices.csv covers
+NEW_CPI = CpiReportRow(date="Aug 05, 2025  (Jul)", reference_month="Jul", actual="2.9%",
+                       previous="2.7%", consensus="2.7%", forecast="2.7%", time="08:30")
+
+def _assert_tables_equal(got: dict, want: dict) -> None:
+    assert got.keys() == want.keys(), (got.keys(), want.keys())
+    for name in want:
+        pd.testing.assert_frame_equal(got[name], want[name], check_exact=False, rtol=1e-9)
+
+def _rescan(db: EventDatabase) -> dict:
+    return OnlineEventStats.from_rows(db._stored_rows()).tables()
+
+def _add_latest(db: EventDatabase, row, export: bool = False) -> dict | None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        return summaries.add_latest("cpi_summary.csv", lambda: row, fetch_cpi_rows,
+                               summaries._spec("CPI")["summarizer"], "CPI", "published_date", store=db, export=export)
+
+def add_latest_checks(tmp: str) -> int:
+    """add_latest on a seeded database changes live_tables(), and they match a full rescan."""
+    db = EventDatabase(os.path.join(tmp, "stockwatch.db"))
+    db.seed_event_returns(WITH_RETURNS_PATHS)
+    before = db.live_tables()
+    n_cpi = len(db.events("cpi"))
+
+    assert _add_latest(db, NEW_CPI) is not None
+    after = db.live_tables()
+    assert len(db.events("cpi")) == n_cpi + 1
+    n_pos = lambda tables: tables["surprise_buckets"].set_index("event_type").loc["cpi", "N_pos"]
+    assert n_pos(after) == n_pos(before) + 1, (n_pos(before), n_pos(after))
+    _assert_tables_equal(after, _rescan(db))
+
+    # Re-polling the same release replaces it; a revised print moves it between buckets
+    _add_latest(db, NEW_CPI)
+    assert len(db.events("cpi")) == n_cpi + 1
+    _assert_tables_equal(db.live_tables(), after)
+    revised = dataclasses.replace(NEW_CPI, actual="2.5%")
+    _add_latest(db, revised)
+    assert n_pos(db.live_tables()) == n_pos(before)
+    _assert_tables_equal(db.live_tables(), _rescan(db))
+
+    # Not priced yet (session after the price file): stored as a summary only
+    future = dataclasses.replace(NEW_CPI, date="Dec 10, 2030  (Nov)", reference_month="Nov")
+    _add_latest(db, future)
+    assert len(db.events("cpi")) == n_cpi + 1
+    db.close()
+    return 5
+
+def rerun_checks() -> int:
+    """A live release survives the CPI returns stage rerunning from data/cpi_summary.csv."""
+    released = lambda db: "2025-08-05" in set(db.events("cpi")["release_date"].astype(str).str[:10])
+    with EventDatabase() as db:   # data/stockwatch.db, the database the stage opens
+        db.seed_event_returns(WITH_RETURNS_PATHS)
+        _add_latest(db, NEW_CPI)
+        n_cpi = len(db.events("cpi"))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        stage_rows = len(cpi_returns_demo.stage()[cpi_returns_demo.OUT_PATH])
+    with EventDatabase() as db:
+        assert stage_rows == n_cpi - 1 and len(db.events("cpi")) == n_cpi and released(db), (stage_rows, n_cpi)
+        _assert_tables_equal(db.live_tables(), _rescan(db))
+
+        # Once a rewrite includes the release it is an ordinary row again, dropped by the next stage run
+        live = db.live_tables()
+        db.write_event_returns(db.events("cpi"))
+        assert db.conn.execute("SELECT COUNT(*) FROM live_events").fetchone()[0] == 0
+        _assert_tables_equal(db.live_tables(), live)
+    with contextlib.redirect_stdout(io.StringIO()):
+        cpi_returns_demo.stage()
+    with EventDatabase() as db:
+        assert len(db.events("cpi")) == n_cpi - 1 and not released(db)
+        _assert_tables_equal(db.live_tables(), _rescan(db))
+    return 3
+
+def export_checks(tmp: str) -> int:
+    """add_latest rewrites cpi_summary.csv (CRLF, as csv.DictWriter writes) only when the summary changed."""
+    with EventDatabase(os.path.join(tmp, "export.db")) as db:
+        _add_latest(db, NEW_CPI, export=True)
+        with open("cpi_summary.csv", "rb") as f:
+            first = f.read()
+        lines = first.split(b"\r\n")
+        assert lines[-1] == b"" and not any(b"\n" in line for line in lines), "expected CRLF rows"
+        assert len(lines) - 2 == db.count("cpi")
+
+        stamp = os.stat("cpi_summary.csv").st_mtime_ns
+        os.utime("cpi_summary.csv", ns=(stamp - 10**9, stamp - 10**9))
+        _add_latest(db, NEW_CPI, export=True)
+        assert os.stat("cpi_summary.csv").st_mtime_ns == stamp - 10**9, "unchanged poll rewrote the CSV"
+
+        _add_latest(db, dataclasses.replace(NEW_CPI, actual="2.5%"), export=True)
+        with open("cpi_summary.csv", "rb") as f:
+            revised = f.read()
+        assert revised != first and len(revised.split(b"\r\n")) == len(lines)
+    return 3
+
+def _time(fn, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best
+
+def main():
+    ap = argparse.ArgumentParser(description="Live event statistics after add_latest: checks and upsert vs full rewrite cost")
+    ap.add_argument("--runs", type=int, default=5)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # add_latest prices against data/ivv_prices.csv relative to the working directory
+        os.makedirs(os.path.join(tmp, "data"))
+        for path in [summaries.IVV_PRICES, "data/cpi_summary.csv", *WITH_RETURNS_PATHS.values()]:
+            shutil.copy(os.path.join(ROOT, path), os.path.join(tmp, path))
+        os.chdir(tmp)
+        print(f"add_latest: {add_latest_checks(tmp)} checks ok")
+        print(f"rerun:      {rerun_checks()} checks ok")
+        print(f"export:     {export_checks(tmp)} checks ok")
+
+        db = EventDatabase(os.path.join(tmp, "timing.db"))
+        db.seed_event_returns(WITH_RETURNS_PATHS)
+        cpi = db.events("cpi")
+        one = cpi.tail(1)
+        t_upsert = _time(lambda: db.upsert_event_returns(one), args.runs)
+        t_rewrite = _time(lambda: db.write_event_returns(cpi), args.runs)
+        t_live = _time(db.live_tables, args.runs)
+        db.close()
+
+    print(f"\nupsert one event:        {t_upsert * 1e3:8.2f} ms")
+    print(f"rewrite cpi ({len(cpi)} rows):  {t_rewrite * 1e3:8.2f} ms")
+    print(f"live_tables():           {t_live * 1e3:8.2f} ms")
+
+if __name__ == "__main__":
+    main()
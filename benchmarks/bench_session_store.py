@@ -0,0 +1,100 @@
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from data_fetchers.price_cache import write_price_cache
+from data_fetchers.session_store import SessionStore
+from logic.impact.returns import load_prices, attach_returns_df, session_closes
+from logic.impact.price_panel import PricePanel
+from logic.impact.loaders import load_cpi, load_jobs, load_unemp, load_fed
+
+DATA = os.path.join(os.path.dirname(__file__), "..", "data")
+
+def synthetic_sessions(years: int, seed: int) -> pd.DataFrame:
+    """Random-walk daily OHLCV on every weekday of the last `years` years."""
+    days = pd.bdate_range(end="2025-08-01", periods=252 * years)
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(days))))
+    return pd.DataFrame({"Open": close * (1 + rng.normal(0, 0.002, len(days))), "High": close * 1.01,
+                         "Low": close * 0.99, "Close": close, "Volume": rng.integers(1e5, 1e7, len(days)) * 1.0},
+                        index=pd.DatetimeIndex(days, name="Date"))
+
+def _rss_mb() -> float:
+    """Resident set size from /proc (NaN where unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except (OSError, ValueError):
+        return float("nan")
+
+def _time(fn, runs: int):
+    best, out = float("inf"), None
+    for _ in range(runs):
+        t = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t)
+    return best, out
+
+def main():
+    ap = argparse.ArgumentParser(description="Session price store: open/load cost vs the price cache CSVs")
+    ap.add_argument("--tickers", type=int, default=50)
+    ap.add_argument("--years", type=int, default=30)
+    ap.add_argument("--runs", type=int, default=3)
+    args = ap.parse_args()
+
+    tickers = [f"T{i:03d}" for i in range(args.tickers)]
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SessionStore(os.path.join(tmp, "sessions"))
+        csvs = {}
+        for i, t in enumerate(tickers):
+            csvs[t] = os.path.join(tmp, f"{t.lower()}_prices.csv")
+            write_price_cache(csvs[t], synthetic_sessions(args.years, i))
+        t_sync, _ = _time(lambda: [store.sync(t, csvs[t]) for t in tickers], 1)
+
+        rss0 = _rss_mb()
+        t_open, mapped = _time(lambda: {t: store.read(t) for t in tickers}, args.runs)
+        rss_open = _rss_mb() - rss0
+        t_csv, frames = _time(lambda: {t: load_prices(csvs[t]) for t in tickers}, 1)
+        t_resync, _ = _time(lambda: [store.sync(t, csvs[t]) for t in tickers], args.runs)
+
+        # Returns from the mapped columns: same output as from the parsed CSV, closes not copied
+        events = pd.concat([load(os.path.join(DATA, f"{name}_summary.csv"))[["event_type", "release_date"]]
+                            for load, name in ((load_cpi, "cpi"), (load_jobs, "jobs"), (load_unemp, "unemp"), (load_fed, "fed"))],
+                           ignore_index=True)
+        first = tickers[0]
+        from_csv = attach_returns_df(events, frames[first])
+        from_store = attach_returns_df(events, mapped[first])
+        for col in ("t0", "t1"):   # the CSV parse gives microsecond timestamps, the store nanosecond ones
+            from_csv[col] = from_csv[col].dt.as_unit("ns")
+        pd.testing.assert_frame_equal(from_csv, from_store)
+        assert np.shares_memory(session_closes(mapped[first])[1], mapped[first].close)
+        t_ret_csv, _ = _time(lambda: attach_returns_df(events, load_prices(csvs[first])), args.runs)
+        t_ret_store, _ = _time(lambda: attach_returns_df(events, store.read(first)), args.runs)
+
+        panel_frames = PricePanel.from_frames(frames)
+        t_panel, panel = _time(lambda: PricePanel.from_store(tickers, store), args.runs)
+        np.testing.assert_array_equal(panel.closes, panel_frames.closes)
+
+        # Appending one new session to a ticker
+        one = synthetic_sessions(1, 99).iloc[:1]
+        one.index = [pd.Timestamp("2025-08-04")]
+        t_append, _ = _time(lambda: store.append(first, one), 1)
+        assert len(store.read(first)) == len(mapped[first]) + 1
+
+    sessions = len(mapped[first])
+    print(f"{args.tickers} tickers x {args.years} years ({sessions:,} sessions each)")
+    print(f"initial sync from CSV:       {t_sync * 1e3:9.1f} ms")
+    print(f"load all (CSV, load_prices): {t_csv * 1e3:9.1f} ms")
+    print(f"open all (memmap):           {t_open * 1e3:9.2f} ms   resident +{rss_open:.2f} MB")
+    print(f"re-sync unchanged CSVs:      {t_resync * 1e3:9.2f} ms")
+    print(f"panel from store:            {t_panel * 1e3:9.2f} ms")
+    print(f"append one session:          {t_append * 1e3:9.2f} ms")
+    print(f"returns for {len(events)} events: CSV {t_ret_csv * 1e3:.1f} ms, store {t_ret_store * 1e3:.1f} ms")
+
+if __name__ == "__main__":
+    main()
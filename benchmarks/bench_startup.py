@@ -0,0 +1,71 @@
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import argparse
+import subprocess
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# name -> interpreter arguments, run from the repo root
+ENTRY_POINTS = {
+    "stockwatch --help": ["stockwatch.py", "--help"],
+    "main.py --help": ["main.py", "--help"],
+    "import main": ["-c", "import main"],
+    "run_pipeline --help": ["scripts/run_pipeline.py", "--help"],
+    "event_analysis --help": ["scripts/event_analysis.py", "--help"],
+}
+
+# Must stay out of the light entry points (first three above)
+HEAVY = ("pandas", "numpy", "requests", "bs4")
+
+def import_times(stderr: str) -> list[tuple[str, int, int]]:
+    """-X importtime lines -> [(module, self us, cumulative us)] with top-level imports only."""
+    out = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|")
+        if not name[1:].startswith(" "):   # nested imports are indented two more spaces per level
+            out.append((name.strip(), int(self_us), int(cum_us)))
+    return out
+
+def measure(args: list[str], runs: int) -> tuple[float, str]:
+    """Best wall time of `python <args>` over runs, and the -X importtime output of the last run."""
+    best, err = float("inf"), ""
+    for _ in range(runs):
+        t = time.perf_counter()
+        proc = subprocess.run([sys.executable, "-X", "importtime", *args], cwd=ROOT,
+                              capture_output=True, text=True, env={**os.environ, "PYTHONPATH": ROOT})
+        best = min(best, time.perf_counter() - t)
+        err = proc.stderr
+    return best, err
+
+def loaded(stderr: str) -> set[str]:
+    names = set()
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "imported package" not in line:
+            names.add(line.split("|")[2].strip())
+    return names
+
+def main():
+    ap = argparse.ArgumentParser(description="CLI startup: wall time and import cost per entry point (-X importtime)")
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--top", type=int, default=5, help="slowest top-level imports to list per entry point")
+    args = ap.parse_args()
+
+    baseline, base_err = measure(["-c", "pass"], args.runs)
+    startup = loaded(base_err)   # site, encodings, ...: paid by every interpreter
+    print(f"interpreter alone: {baseline * 1e3:.0f} ms\n")
+    for k, (name, argv) in enumerate(ENTRY_POINTS.items()):
+        wall, err = measure(argv, args.runs)
+        mods = [t for t in import_times(err) if t[0] not in startup]
+        heavy = [m for m in HEAVY if m in loaded(err)]
+        if k < 3:
+            assert not heavy, f"{name} imports {heavy}"
+        print(f"{name:<24}{wall * 1e3:7.0f} ms   heavy modules: {', '.join(heavy) or 'none'}")
+        for mod, _, cum in sorted(mods, key=lambda t: -t[2])[:args.top]:
+            print(f"    {mod:<36}{cum / 1e3:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import argparse
+import tempfile
+import time
+
+import pandas as pd
+from utils.storage import read_table, to_typed, parquet_available
+
+TIDY_CSV = os.path.join(os.path.dirname(__file__), "..", "data", "all_events_tidy.csv")
+
+def build_tidy(scale: int) -> pd.DataFrame:
+    """The committed tidy table repeated `scale` times, with release dates shifted so rows stay distinct."""
+    base = to_typed(pd.read_csv(TIDY_CSV))
+    span = base["release_date"].max() - base["release_date"].min() + pd.Timedelta(days=1)
+    parts = []
+    for k in range(scale):
+        part = base.copy()
+        part["release_date"] = part["release_date"] + k * span
+        parts.append(part)
+    return pd.concat(parts, ignore_index=True)
+
+def _time(fn, runs: int):
+    best, out = float("inf"), None
+    for _ in range(runs):
+        t = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t)
+    return best, out
+
+def _mb(n_bytes: float) -> float:
+    return n_bytes / 1e6
+
+def main():
+    ap = argparse.ArgumentParser(description="Tidy dataset load time / memory: CSV (+ typing) vs parquet")
+    ap.add_argument("--scale", type=int, default=200, help="times to repeat the committed tidy table")
+    ap.add_argument("--runs", type=int, default=3)
+    args = ap.parse_args()
+    if not parquet_available():
+        sys.exit("pyarrow is not installed; nothing to compare against CSV")
+
+    df = build_tidy(args.scale)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "all_events_tidy.csv")
+        pq_path = os.path.join(tmp, "all_events_tidy.parquet")
+        df.to_csv(csv_path, index=False)
+        to_typed(df).to_parquet(pq_path, index=False)
+
+        t_raw, raw = _time(lambda: pd.read_csv(csv_path), args.runs)
+        # What every consumer had to do before: read the text, then re-parse dates and values
+        t_csv, from_csv = _time(lambda: to_typed(pd.read_csv(csv_path)), args.runs)
+        t_pq, from_pq = _time(lambda: read_table(csv_path), args.runs)
+        pd.testing.assert_frame_equal(from_csv, from_pq, check_categorical=False, rtol=1e-12)
+
+        print(f"rows: {len(df):,}")
+        print(f"{'':<22}{'file MB':>9}{'load ms':>10}{'frame MB':>10}")
+        print(f"{'csv (untyped)':<22}{_mb(os.path.getsize(csv_path)):>9.1f}{t_raw * 1e3:>10.1f}"
+              f"{_mb(raw.memory_usage(deep=True).sum()):>10.1f}")
+        print(f"{'csv + typing':<22}{_mb(os.path.getsize(csv_path)):>9.1f}{t_csv * 1e3:>10.1f}"
+              f"{_mb(from_csv.memory_usage(deep=True).sum()):>10.1f}")
+        print(f"{'parquet (typed)':<22}{_mb(os.path.getsize(pq_path)):>9.1f}{t_pq * 1e3:>10.1f}"
+              f"{_mb(from_pq.memory_usage(deep=True).sum()):>10.1f}")
+        print(f"typed load speedup: {t_csv / t_pq:.1f}x")
+
+if __name__ == "__main__":
+    main()
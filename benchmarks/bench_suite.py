@@ -0,0 +1,197 @@
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import re
+import resource
+import subprocess
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+DATA = os.path.join(ROOT, "data")
+FETCHERS_DIR = os.path.join(ROOT, "data_fetchers")
+SCALES = (1, 10, 100, 1000)
+
+# Saved page -> parser used by its fetch_*_rows (called directly so the row cache is bypassed)
+PAGES = {
+    "cpi_investing.html": "data_fetchers.cpi_fetcher:_parse_cpi_html",
+    "nfp_investing.html": "data_fetchers.jobs_fetcher:_parse_jobs_html",
+    "fed_investing.html": "data_fetchers.fed_fetcher:_parse_fed_html",
+    "unemp_investing.html": "data_fetchers.unemp_fetcher:_parse_unemp_html",
+}
+
+def _rss_mb() -> float:
+    """Resident set size from /proc (NaN where unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except (OSError, ValueError):
+        return float("nan")
+
+def _peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3   # KB on Linux
+
+def scaled_page(html_file: str, scale: int) -> str:
+    """A saved snapshot with its table body rows repeated `scale` times."""
+    with open(os.path.join(FETCHERS_DIR, html_file), "r", encoding="utf-8") as f:
+        html = f.read()
+    m = re.search(r"<tbody>(.*)</tbody>", html, re.S)
+    return html[:m.start(1)] + m.group(1) * scale + html[m.end(1):]
+
+def _repeat(df, scale: int):
+    import pandas as pd
+    return pd.concat([df] * scale, ignore_index=True)
+
+# ------------------------------
+# Cases: setup(scale, tmp) -> (op, input rows)
+# ------------------------------
+
+def setup_parse(scale: int, tmp: str):
+    from utils.lazy import resolve
+    jobs = []
+    for html_file, parser in PAGES.items():
+        path = os.path.join(tmp, html_file)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(scaled_page(html_file, scale))
+        jobs.append((resolve(parser), path))
+    n = sum(len(parse(path)) for parse, path in jobs)
+    return (lambda: [parse(path) for parse, path in jobs]), n
+
+def setup_summarize(scale: int, tmp: str):
+    import main
+    specs = [main._spec(label) for label in main.INDICATORS]
+    items = [(spec["fetch_historic_func"]() * scale, spec["summarizer"]) for spec in specs]
+    return (lambda: [main._pairwise_summaries(rows, summarizer) for rows, summarizer in items]), \
+        sum(len(rows) for rows, _ in items)
+
+def setup_returns(scale: int, tmp: str):
+    import pandas as pd
+    from logic.impact.loaders import load_cpi, load_jobs, load_unemp, load_fed
+    from logic.impact.returns import load_prices, attach_returns_df
+    events = pd.concat([load(os.path.join(DATA, f"{name}_summary.csv"))[["event_type", "release_date"]]
+                        for load, name in ((load_cpi, "cpi"), (load_jobs, "jobs"), (load_unemp, "unemp"), (load_fed, "fed"))],
+                       ignore_index=True)
+    events = _repeat(events, scale)
+    prices = load_prices(os.path.join(DATA, "ivv_prices.csv"))
+    return (lambda: attach_returns_df(events, prices)), len(events)
+
+def setup_tidy(scale: int, tmp: str):
+    from utils.storage import read_table, write_table
+    from scripts.combine_all_events_tidy import load_and_tidy_all
+    paths = {}
+    for key in ("cpi", "jobs", "unemp", "fed"):
+        paths[f"{key}_path"] = os.path.join(tmp, f"{key}_with_returns.csv")
+        write_table(_repeat(read_table(os.path.join(DATA, f"{key}_with_returns.csv")), scale), paths[f"{key}_path"])
+    n = sum(len(read_table(p)) for p in paths.values())
+    return (lambda: load_and_tidy_all(**paths, read=read_table)), n
+
+def setup_analysis(scale: int, tmp: str, resamples: int = 1000):
+    from utils.storage import read_table
+    from scripts.event_analysis import stage
+    tidy = _repeat(read_table(os.path.join(DATA, "all_events_tidy.csv")), scale)
+
+    def op():
+        with contextlib.redirect_stdout(io.StringIO()):   # stage prints every report
+            return stage(read=lambda path: tidy.copy(), n_resamples=resamples)
+    return op, len(tidy)
+
+CASES = {
+    "parse": setup_parse,           # fetch_*_rows HTML parsing
+    "summarize": setup_summarize,   # main._pairwise_summaries
+    "returns": setup_returns,       # attach_returns_df
+    "tidy": setup_tidy,             # combine_all_events_tidy.load_and_tidy_all
+    "analysis": setup_analysis,     # event_analysis (the stage main() writes out)
+}
+
+def run_case(case: str, scale: int, runs: int, resamples: int) -> dict:
+    """Set one case up at `scale` and time it in this process (best of runs)."""
+    import numpy, pandas   # loaded lazily by the code under test; keep the import out of the timing
+    with tempfile.TemporaryDirectory() as tmp:
+        kwargs = {"resamples": resamples} if case == "analysis" else {}
+        op, rows = CASES[case](scale, tmp, **kwargs)
+        rss_setup = _rss_mb()
+        best = float("inf")
+        for _ in range(runs):
+            t = time.perf_counter()
+            op()
+            best = min(best, time.perf_counter() - t)
+    return {"case": case, "scale": scale, "rows": rows, "wall_s": round(best, 6),
+            "rows_per_s": round(rows / best, 1) if best > 0 else None,
+            "setup_rss_mb": round(rss_setup, 1), "peak_rss_mb": round(_peak_rss_mb(), 1)}
+
+# ------------------------------
+# Driver
+# ------------------------------
+
+def _child(case: str, scale: int, runs: int, resamples: int, timeout: float) -> dict:
+    """Run one case in a fresh interpreter so peak RSS belongs to that case alone."""
+    cmd = [sys.executable, os.path.abspath(__file__), "--child", case, str(scale),
+           "--runs", str(runs), "--resamples", str(resamples)]
+    try:
+        proc = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {"case": case, "scale": scale, "error": f"timed out after {timeout:.0f} s"}
+    if proc.returncode:
+        return {"case": case, "scale": scale, "error": proc.stderr.strip().splitlines()[-1:]}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results: list[dict], baseline_path: str) -> None:
+    """Print wall-time ratios against an earlier --out file (>1 means slower now)."""
+    with open(baseline_path) as f:
+        before = {(r["case"], r["scale"]): r for r in json.load(f)["results"] if "wall_s" in r}
+    print(f"{'case':<12}{'scale':>7}{'before s':>11}{'now s':>11}{'ratio':>8}", file=sys.stderr)
+    for r in results:
+        old = before.get((r["case"], r["scale"]))
+        if old and "wall_s" in r:
+            print(f"{r['case']:<12}{r['scale']:>7}{old['wall_s']:>11.4f}{r['wall_s']:>11.4f}"
+                  f"{r['wall_s'] / old['wall_s']:>8.2f}", file=sys.stderr)
+
+def main():
+    ap = argparse.ArgumentParser(description="Parse -> summarize -> returns -> tidy -> analysis at scaled input sizes; JSON results")
+    ap.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    ap.add_argument("--scales", nargs="+", type=int, default=list(SCALES), help="multiples of the current data size")
+    ap.add_argument("--runs", type=int, default=3, help="best-of runs per case (scales above 100 run once)")
+    ap.add_argument("--resamples", type=int, default=1000, help="bootstrap/permutation resamples in the analysis case")
+    ap.add_argument("--timeout", type=float, default=1800, help="seconds per case and scale")
+    ap.add_argument("--out", help="write the JSON here as well as to stdout")
+    ap.add_argument("--compare", metavar="JSON", help="print wall-time ratios against an earlier --out file")
+    ap.add_argument("--child", nargs=2, metavar=("CASE", "SCALE"), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        case, scale = args.child[0], int(args.child[1])
+        print(json.dumps(run_case(case, scale, args.runs, args.resamples)))
+        return
+
+    results = []
+    for case in args.cases:
+        for scale in args.scales:
+            r = _child(case, scale, args.runs if scale <= 100 else 1, args.resamples, args.timeout)
+            results.append(r)
+            status = r.get("error") or f"{r['wall_s']:.3f} s, {r['rows_per_s']:,.0f} rows/s, peak {r['peak_rss_mb']:.0f} MB"
+            print(f"{case:<10} x{scale:<5} {status}", file=sys.stderr, flush=True)
+
+    report = {"commit": _commit(), "python": platform.python_version(), "cpus": os.cpu_count(),
+              "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"), "resamples": args.resamples, "results": results}
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    main()
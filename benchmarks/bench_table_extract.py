@@ -0,0 +1,74 @@
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import argparse
+import re
+import time
+
+from bs4 import BeautifulSoup
+from data_fetchers.investing_table import iter_event_rows
+
+FETCHERS_DIR = os.path.join(os.path.dirname(__file__), "..", "data_fetchers")
+SNAPSHOTS = {
+    "cpi": ("cpi_investing.html", "eventHistoryTable733"),
+    "jobs": ("nfp_investing.html", "eventHistoryTable227"),
+    "fed": ("fed_investing.html", "eventHistoryTable168"),
+    "unemp": ("unemp_investing.html", "eventHistoryTable300"),
+}
+
+# Stand-in for the rest of a live Investing.com page (nav, scripts, sidebars)
+FILLER_BLOCK = (
+    '<div class="sideBlock"><ul>'
+    + "".join(f'<li><a href="/news/{i}">Headline {i}</a><span class="date">Aug 01</span></li>' for i in range(40))
+    + "</ul><table class=\"genTbl\"><tr><td>1</td><td>2</td></tr></table></div>\n"
+)
+
+def build_page(html_file: str, repeat: int, filler_mb: float) -> str:
+    """Blow a saved snapshot up to a multi-MB page: tbody rows x repeat, wrapped in filler markup."""
+    with open(os.path.join(FETCHERS_DIR, html_file), "r", encoding="utf-8") as f:
+        html = f.read()
+    m = re.search(r"<tbody>(.*)</tbody>", html, re.S)
+    page = html[:m.start(1)] + m.group(1) * repeat + html[m.end(1):]
+    filler = FILLER_BLOCK * max(1, int(filler_mb * 1_000_000 / len(FILLER_BLOCK)))
+    return f"<html><body>{filler}{page}{filler}</body></html>"
+
+def bs4_rows(html: str, table_id: str) -> list:
+    """The previous fetcher path: full html.parser tree, then walk the table."""
+    soup = BeautifulSoup(html, "html.parser")
+    table = soup.find("table", id=table_id)
+    out = []
+    for tr in (table.find("tbody") or table).find_all("tr"):
+        tds = tr.find_all("td")
+        if len(tds) >= 5:
+            out.append(tuple(td.get_text(strip=True) for td in tds[:5]))
+    return out
+
+def _time(fn, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best
+
+def main():
+    ap = argparse.ArgumentParser(description="Per-row parse cost: targeted extractor vs BeautifulSoup html.parser")
+    ap.add_argument("--repeat", type=int, default=20, help="times to repeat each table's rows")
+    ap.add_argument("--filler-mb", type=float, default=2.0, help="MB of unrelated markup around the table")
+    ap.add_argument("--runs", type=int, default=3)
+    args = ap.parse_args()
+
+    print(f"{'event':<7}{'page MB':>9}{'rows':>8}{'bs4 us/row':>12}{'fast us/row':>13}{'speedup':>9}")
+    for name, (html_file, table_id) in SNAPSHOTS.items():
+        html = build_page(html_file, args.repeat, args.filler_mb)
+        fast = [tuple(r) for r in iter_event_rows(html, table_id)]
+        slow = bs4_rows(html, table_id)
+        assert [tuple(c.replace("\xa0", "") for c in r) for r in slow] == fast, f"{name}: row mismatch"
+
+        t_slow = _time(lambda: bs4_rows(html, table_id), args.runs)
+        t_fast = _time(lambda: list(iter_event_rows(html, table_id)), args.runs)
+        n = len(fast)
+        print(f"{name:<7}{len(html) / 1e6:>9.2f}{n:>8}{t_slow / n * 1e6:>12.1f}{t_fast / n * 1e6:>13.1f}{t_slow / t_fast:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
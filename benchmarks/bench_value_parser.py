@@ -0,0 +1,140 @@
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import argparse
+import random
+import time
+
+import numpy as np
+import pandas as pd
+from utils.value_parser import parse_value, parse_series, parse_values, missing_mask
+
+# Display formats the fetchers and summary generators produce, with the value each encodes
+FORMATS = [
+    lambda x: (f"{x:+.1f}pp", round(x, 1)),
+    lambda x: (f"{x:.2f}%", round(x, 2)),
+    lambda x: (f"{x:+.2f}%", round(x, 2)),
+    lambda x: (f"{int(x * 100)}K", float(int(x * 100))),
+    lambda x: (f"{int(x * 10000):,}K", float(int(x * 10000))),
+    lambda x: (f"{x:.2f}M", round(x, 2) * 1000),
+]
+MISSING = ["", "N/A", "n/a", "  ", None, np.nan]
+
+# Pinned behavior: input -> value (None: not a value). Covers every unit, the missing
+# markers, and the inputs the old per-indicator parsers accepted by accident.
+EXPECTED = [
+    ("2.7%", 2.7), ("4.50%", 4.5), ("+1.2%", 1.2), ("+0.1pp", 0.1), ("-0.3pp", -0.3),
+    ("73K", 73.0), ("12k", 12.0), ("-7,604K", -7604.0), ("  12K ", 12.0),
+    ("1.5M", 1500.0), ("-2.25M", -2250.0), ("1.5m", 1500.0),   # M is scaled to thousands
+    ("1,234", 1234.0), ("3", 3.0), ("0", 0.0), (3, 3.0), (2.5, 2.5),
+    ("", None), ("  ", None), ("N/A", None), ("n/a", None), (None, None), (np.nan, None),
+    ("nan", None), ("inf", None), ("-inf", None), ("1e3", None),   # accepted by float() before
+    ("pp", None), ("K", None), ("%", None), ("--5", None), ("+-1", None), ("1.2.3", None),
+    ("5K%", None), ("0.25B", None), ("(5K)", None), ("2.5 pct", None), ("Jul", None), (True, None),
+]
+
+JUNK = ["abc", "K", "%", "--5", "1.2.3", "5K%", "nan", "inf", "1e3", "+-1", "pp", "2.5 pct", "Jul", "Aug 01, 2025"]
+
+def round_trip_check(n: int, rng: random.Random) -> int:
+    """Format random numbers in every display format; both parsers must give the value back."""
+    texts, expected = [], []
+    for _ in range(n):
+        x = rng.uniform(-50, 50)
+        text, value = rng.choice(FORMATS)(x)
+        got = parse_value(text)
+        assert got is not None and abs(got - value) <= 1e-9 * max(1.0, abs(value)), (text, got, value)
+        texts.append(text)
+        expected.append(got)
+    col = parse_series(pd.Series(texts, dtype=object))
+    assert col.tolist() == expected, "parse_series disagrees with parse_value on round-trip values"
+    return n
+
+def expected_check() -> list[str]:
+    """EXPECTED through parse_value, parse_series and parse_values; returns one line per mismatch."""
+    inputs = [v for v, _ in EXPECTED]
+    col = parse_series(pd.Series(inputs, dtype=object)).tolist()
+    bad = []
+    for (v, want), got_col, got_list in zip(EXPECTED, col, parse_values(inputs)):
+        got = parse_value(v)
+        if got != want:
+            bad.append(f"parse_value({v!r}) = {got!r}, expected {want!r}")
+        if (None if np.isnan(got_col) else got_col) != want:
+            bad.append(f"parse_series([{v!r}]) = {got_col!r}, expected {want!r}")
+        if got_list != want:
+            bad.append(f"parse_values([{v!r}]) = {got_list!r}, expected {want!r}")
+    return bad
+
+def fuzz_check(n: int, rng: random.Random) -> int:
+    """Random junk, missing markers, numbers and mutated values: scalar and column forms must agree."""
+    alphabet = "0123456789+-.,%KkMmp /NA"
+    values = []
+    for _ in range(n):
+        r = rng.random()
+        if r < 0.1:
+            values.append(rng.choice(MISSING))
+        elif r < 0.2:
+            values.append(rng.choice(JUNK))
+        elif r < 0.25:
+            values.append(rng.choice([3, -2.5, 0, float("inf"), 1e300]))
+        elif r < 0.6:
+            values.append(rng.choice(FORMATS)(rng.uniform(-1e3, 1e3))[0])
+        else:
+            values.append("".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8))))
+    col = pd.Series(values, dtype=object)
+    parsed = parse_series(col)
+    scalar = [parse_value(v) for v in values]
+    for v, got, want in zip(values, parsed.tolist(), scalar):
+        assert (want is None and np.isnan(got)) or got == want, (v, got, want)
+    # Missing markers never parse; present junk is not missing
+    miss = missing_mask(col)
+    assert parsed[miss].isna().all()
+    return n
+
+def build_column(n: int, distinct: int, rng: random.Random) -> pd.Series:
+    """n display values drawn from `distinct` strings plus "N/A" (release tables repeat heavily)."""
+    pool = [rng.choice(FORMATS)(rng.uniform(-50, 50))[0] for _ in range(distinct)] + ["N/A"]
+    idx = np.random.default_rng(0).integers(0, len(pool), n)
+    return pd.Series(np.array(pool, dtype=object)[idx])
+
+def _time(fn, runs: int):
+    best, out = float("inf"), None
+    for _ in range(runs):
+        t = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t)
+    return best, out
+
+def main():
+    ap = argparse.ArgumentParser(description="Value parser: fuzz/round-trip checks and column parse throughput")
+    ap.add_argument("--rows", type=int, default=1_000_000)
+    ap.add_argument("--distinct", type=int, nargs="+", default=[1_000, 100_000, 1_000_000],
+                    help="distinct display strings in the benchmark column")
+    ap.add_argument("--checks", type=int, default=50_000, help="values per fuzz / round-trip check")
+    ap.add_argument("--runs", type=int, default=3)
+    ap.add_argument("--checks-only", action="store_true", help="run the checks and skip the timing (exit 1 on a mismatch)")
+    args = ap.parse_args()
+
+    bad = expected_check()
+    for line in bad:
+        print(f"❌ {line}")
+    if bad:
+        sys.exit(1)
+    print(f"expected:   {len(EXPECTED)} values ok")
+
+    rng = random.Random(0)
+    print(f"round-trip: {round_trip_check(args.checks, rng):,} values ok")
+    print(f"fuzz:       {fuzz_check(args.checks, rng):,} values ok")
+    if args.checks_only:
+        return
+
+    print(f"\nrows: {args.rows:,}")
+    print(f"{'distinct':>10}{'apply ms':>11}{'parse_series ms':>17}{'speedup':>9}")
+    for distinct in args.distinct:
+        col = build_column(args.rows, min(distinct, args.rows), rng)
+        t_apply, by_apply = _time(lambda: col.apply(parse_value).astype("float64"), 1)
+        t_vec, by_vec = _time(lambda: parse_series(col), args.runs)
+        pd.testing.assert_series_equal(by_apply, by_vec, check_names=False)
+        print(f"{distinct:>10,}{t_apply * 1e3:>11.0f}{t_vec * 1e3:>17.0f}{t_apply / t_vec:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
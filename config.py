@@ -0,0 +1,37 @@
+# config.py
+import os
+
+# Storage for pipeline artifacts (summaries, *_with_returns, tidy tables, out_* reports):
+# "parquet" keeps typed columns (needs pyarrow), "csv" keeps the plain text files only
+STORAGE_FORMAT = os.environ.get("STOCKWATCH_STORAGE_FORMAT", "parquet")
+
+# With parquet storage, also write the CSV next to each artifact as a human-readable export
+CSV_EXPORT = os.environ.get("STOCKWATCH_CSV_EXPORT", "1") != "0"
+
+# SQLite event database (summaries, raw rows, price sessions, event returns); the CSVs are exports of it
+DB_PATH = os.environ.get("STOCKWATCH_DB", "data/stockwatch.db")
+
+# UTC offset of the release times on the saved Investing.com pages: they show a fixed GMT-4 clock
+# (CPI at 08:30 in summer and 09:30 in winter), so times are converted from it, not from New York time
+INVESTING_UTC_OFFSET = os.environ.get("STOCKWATCH_INVESTING_UTC_OFFSET", "-04:00")
+
+# Memory-mapped minute bars (data_fetchers/minute_bar_store.py), one directory per ticker
+MINUTE_BAR_DIR = os.environ.get("STOCKWATCH_MINUTE_BARS", "data/minute_bars")
+
+# Memory-mapped daily session prices (data_fetchers/session_store.py), synced from the price cache CSVs
+SESSION_DIR = os.environ.get("STOCKWATCH_SESSIONS", "data/sessions")
+
+# Saved Investing.com pages the historic fetchers parse; point it at generated fixtures
+# (scripts/generate_fixtures.py) to run everything against synthetic data
+HTML_DIR = os.environ.get("STOCKWATCH_HTML_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data_fetchers"))
+
+# Parsed-row artifacts (data_fetchers/row_cache.py); unset keeps them in a .row_cache folder next to each page
+ROW_CACHE_DIR = os.environ.get("STOCKWATCH_ROW_CACHE")
+
+# Conditional-GET cache of the latest-release pages (data_fetchers/http_cache.py), one JSON entry per URL
+HTTP_CACHE_DIR = os.environ.get("STOCKWATCH_HTTP_CACHE",
+                                os.path.join(os.path.dirname(os.path.abspath(__file__)), "data_fetchers", ".http_cache"))
+
+# Stage metrics (utils/metrics.py): JSON-lines event log, and a Prometheus text file written at exit; unset = off
+METRICS_LOG = os.environ.get("STOCKWATCH_METRICS_LOG")
+METRICS_PROM = os.environ.get("STOCKWATCH_METRICS_PROM")
@@ -1,74 +1,42 @@
 # data_fetchers/cpi_fetcher.py
 
 import os
-import re
-from bs4 import BeautifulSoup
+import config
 from models.cpi_report_row import CpiReportRow
+from data_fetchers.row_cache import cached_rows
+from data_fetchers.investing_table import read_event_rows, extract_reference_month
+
+def _parse_cpi_html(html_path: str) -> list[CpiReportRow]:
+    # Be specific to avoid grabbing the wrong table
+    rows = read_event_rows(html_path, "eventHistoryTable733", fallback_first_table=True)
+
+    results: list[CpiReportRow] = []
+    for release_date, time_text, actual_value, forecast, previous in rows:
+        # Skip upcoming forecast row with no actual value
+        if not actual_value or actual_value.upper() == "N/A":
+            continue
+
+        results.append(
+            CpiReportRow(
+                date=release_date,
+                reference_month=extract_reference_month(release_date),
+                actual=actual_value,
+                previous=previous,
+                consensus=forecast,
+                forecast=forecast,
+                time=time_text,
+            )
+        )
 
-def _extract_reference_month(release_date_text: str) -> str:
-    """
-    Extracts the month inside parentheses from strings like:
-    'Aug 12, 2025  (Jul)' -> 'Jul'
-    Returns '' if not found.
-    """
-    m = re.search(r"\(([^)]+)\)", release_date_text or "")
-    return m.group(1).strip() if m else ""
-
-def _clean_cell_text(el) -> str:
-    """Get stripped text, return '' for blanks like &nbsp;"""
-    if el is None:
-        return ""
-    t = el.get_text(strip=True)
-    return t if t != "\xa0" else ""
+    return results
 
-def fetch_cpi_rows() -> list[CpiReportRow]:
+def fetch_cpi_rows(html_path: str | None = None) -> list[CpiReportRow]:
     try:
-        # Path to local HTML (same folder as this file)
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        html_path = os.path.join(current_dir, "cpi_investing.html")
-
-        with open(html_path, "r", encoding="utf-8") as f:
-            soup = BeautifulSoup(f.read(), "html.parser")
-
-        # Be specific to avoid grabbing the wrong table
-        table = soup.find("table", id="eventHistoryTable733") or soup.find("table")
-        if not table:
-            raise RuntimeError("CPI table not found in HTML.")
-
-        tbody = table.find("tbody") or table
-        rows = tbody.find_all("tr")
-
-        results: list[CpiReportRow] = []
-        for row in rows:
-            cols = row.find_all("td")
-            if len(cols) < 5:
-                continue
-
-            actual_value = _clean_cell_text(cols[2])
-
-            # Skip upcoming forecast row with no actual value
-            if not actual_value or actual_value.upper() == "N/A":
-                continue
-
-            release_date = _clean_cell_text(cols[0])
-            forecast = _clean_cell_text(cols[3])
-            previous = _clean_cell_text(cols[4])
-
-            reference_month = _extract_reference_month(release_date)
-
-            results.append(
-                CpiReportRow(
-                    date=release_date,
-                    reference_month=reference_month,
-                    actual=actual_value,
-                    previous=previous,
-                    consensus=forecast,
-                    forecast=forecast,
-                )
-            )
-
+        # Local saved page (config.HTML_DIR) unless a path is given, e.g. a generated fixture
+        html_path = html_path or os.path.join(config.HTML_DIR, "cpi_investing.html")
 
-        return results
+        # Only re-parses when the saved snapshot has changed
+        return cached_rows(html_path, _parse_cpi_html, CpiReportRow)
 
     except Exception as e:
         print(f"❌ Error reading local HTML file: {e}")
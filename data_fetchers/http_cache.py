@@ -0,0 +1,97 @@
+# data_fetchers/http_cache.py
+
+import hashlib
+import os
+import re
+import time
+from dataclasses import asdict
+from typing import Callable, Optional, Type, TypeVar
+
+import config
+from data_fetchers.http_client import DEFAULT_TIMEOUT, http_get
+from data_fetchers.row_cache import load_json, write_json_atomic
+from utils.metrics import timed
+
+T = TypeVar("T")
+
+# One JSON entry per URL (git-ignored by default): validators, body hash, TTL and the parsed row;
+# config.HTTP_CACHE_DIR (STOCKWATCH_HTTP_CACHE) moves them
+CACHE_DIR = config.HTTP_CACHE_DIR
+
+# Seconds a cached row is served without touching the network. 0: every poll
+# revalidates (a 304 costs one round trip and no parse), so a new release is seen
+# on the first poll after it lands. Cache-Control: max-age or the caller's ttl override it.
+DEFAULT_TTL = 0.0
+
+def _entry_path(url: str) -> str:
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+def _max_age(resp) -> Optional[float]:
+    m = re.search(r"max-age=(\d+)", resp.headers.get("Cache-Control", ""))
+    return float(m.group(1)) if m else None
+
+def _row_from_entry(entry: dict, row_cls: Type[T]) -> Optional[T]:
+    return row_cls(**entry["row"]) if entry.get("row") else None
+
+def cached_latest_row(url: str,
+                      parse: Callable[[str], Optional[T]],
+                      row_cls: Type[T],
+                      ttl: Optional[float] = None,
+                      timeout: float = DEFAULT_TIMEOUT) -> Optional[T]:
+    """
+    Poll-friendly fetch + parse of one Investing.com event page.
+
+      - within the entry's TTL: return the cached row, no request at all
+      - otherwise send If-None-Match / If-Modified-Since from the last response;
+        on 304, or a 200 whose body hash is unchanged, return the cached row
+        without parsing
+      - only a changed body is parsed, and the new row replaces the entry
+
+    ttl (seconds) is stored per URL; when None, the max-age of the latest
+    response is used, or DEFAULT_TTL (0, always revalidate) without one.
+    HTTP errors raise like fetch_html does.
+    """
+    path = _entry_path(url)
+    entry = load_json(path)
+    if entry and entry.get("url") != url:
+        entry = None
+    now = time.time()
+
+    fresh_for = ttl if ttl is not None else (entry or {}).get("ttl", 0)
+    if entry and now - entry.get("fetched_at", 0) < fresh_for:
+        return _row_from_entry(entry, row_cls)
+
+    headers = {}
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry and entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+
+    resp = http_get(url, headers=headers, timeout=timeout)
+
+    if resp.status_code == 304 and entry:
+        entry["fetched_at"] = now
+        entry["ttl"] = ttl if ttl is not None else (_max_age(resp) or DEFAULT_TTL)
+        write_json_atomic(path, entry)
+        return _row_from_entry(entry, row_cls)
+
+    resp.raise_for_status()
+
+    digest = hashlib.sha256(resp.content).hexdigest()
+    if entry and entry.get("sha256") == digest:
+        row = _row_from_entry(entry, row_cls)
+    else:
+        with timed("parse", page=url) as m:
+            row = parse(resp.text)
+            m["rows"], m["bytes"] = int(row is not None), len(resp.content)
+
+    write_json_atomic(path, {
+        "url": url,
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+        "sha256": digest,
+        "fetched_at": now,
+        "ttl": ttl if ttl is not None else (_max_age(resp) or DEFAULT_TTL),
+        "row": asdict(row) if row is not None else None,
+    })
+    return row
@@ -0,0 +1,62 @@
+# data_fetchers/http_client.py
+
+import threading
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from utils.metrics import timed
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/115.0 Safari/537.36"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+}
+DEFAULT_TIMEOUT = 12
+
+# At most this many in-flight requests per host, however many threads ask
+PER_HOST_LIMIT = 4
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+_host_slots: dict[str, threading.BoundedSemaphore] = {}
+
+def get_session() -> requests.Session:
+    """
+    Process-wide keep-alive session shared by all the latest-row fetchers,
+    so repeated polls and concurrent fetches reuse pooled connections.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            s = requests.Session()
+            s.headers.update(DEFAULT_HEADERS)
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=PER_HOST_LIMIT)
+            s.mount("http://", adapter)
+            s.mount("https://", adapter)
+            _session = s
+        return _session
+
+def _host_slot(url: str) -> threading.BoundedSemaphore:
+    host = urlsplit(url).netloc
+    with _session_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.BoundedSemaphore(PER_HOST_LIMIT)
+        return slot
+
+def http_get(url: str, headers: dict | None = None, timeout: float = DEFAULT_TIMEOUT) -> requests.Response:
+    """GET over the pooled session, respecting the per-host limit. Does not raise on HTTP errors."""
+    parts = urlsplit(url)
+    with _host_slot(url), timed("http_fetch", host=parts.netloc, path=parts.path) as m:
+        resp = get_session().get(url, headers=headers, timeout=timeout)
+        m["code"], m["bytes"] = resp.status_code, len(resp.content)
+    return resp
+
+def fetch_html(url: str, timeout: float = DEFAULT_TIMEOUT) -> str:
+    """GET a page and return its text, raising on HTTP errors."""
+    resp = http_get(url, timeout=timeout)
+    resp.raise_for_status()
+    return resp.text
@@ -0,0 +1,135 @@
+# data_fetchers/investing_table.py
+
+import os
+import re
+from html.parser import HTMLParser
+from typing import Iterator, NamedTuple, Optional
+from utils.metrics import timed
+
+class EventRow(NamedTuple):
+    date: str       # e.g. "Aug 12, 2025  (Jul)"
+    time: str       # e.g. "08:30"
+    actual: str     # '' for upcoming placeholders
+    forecast: str
+    previous: str
+
+def extract_reference_month(date_text: str) -> str:
+    """
+    Extracts the month inside parentheses, e.g.:
+    'Aug 12, 2025  (Jul)' -> 'Jul'
+    Returns '' if not found.
+    """
+    m = re.search(r"\(([^)]+)\)", date_text or "")
+    return m.group(1).strip() if m else ""
+
+def month_from_date(date_text: str) -> str:
+    """
+    'Jul 30, 2025 ' -> 'Jul'
+    """
+    m = re.match(r"\s*([A-Za-z]{3})\s+\d{1,2},\s+\d{4}", (date_text or "").strip())
+    return m.group(1) if m else ""
+
+def clean_cell_text(text: Optional[str]) -> str:
+    """Return stripped cell text, treating non-breaking spaces (&nbsp;) as blanks."""
+    if text is None:
+        return ""
+    t = text.strip()
+    return t if t and t != "\xa0" else ""
+
+class _RowTokenizer(HTMLParser):
+    """
+    Streaming tokenizer for one <table>: collects <td> text per <tr>
+    and queues finished rows. No tree is built.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows: list[list[str]] = []
+        self._cells: Optional[list[str]] = None
+        self._parts: Optional[list[str]] = None
+        self._in_text = False  # True while consecutive data chunks belong to one text node
+
+    def handle_starttag(self, tag, attrs):
+        self._in_text = False
+        if tag == "tr":
+            self._cells = []
+        elif tag == "td" and self._cells is not None:
+            self._parts = []
+
+    def handle_endtag(self, tag):
+        self._in_text = False
+        if tag == "td" and self._parts is not None:
+            # Same as bs4 get_text(strip=True): strip each fragment, join with ''
+            self._cells.append("".join(p.strip() for p in self._parts))
+            self._parts = None
+        elif tag == "tr" and self._cells is not None:
+            self.rows.append(self._cells)
+            self._cells = None
+
+    def handle_data(self, data):
+        if self._parts is None:
+            return
+        # A text node can arrive in several pieces when it straddles a feed() chunk
+        if self._in_text:
+            self._parts[-1] += data
+        else:
+            self._parts.append(data)
+            self._in_text = True
+
+def _table_bounds(html: str, table_id: Optional[str]) -> tuple[int, int] | None:
+    """Locate the [start, end) slice of the target <table> without parsing the page."""
+    if table_id:
+        m = re.search(r"""id\s*=\s*["']%s["']""" % re.escape(table_id), html)
+        if not m:
+            return None
+        start = html.rfind("<table", 0, m.start())
+    else:
+        start = html.find("<table")
+    if start < 0:
+        return None
+    end = html.find("</table>", start)
+    end = len(html) if end < 0 else end + len("</table>")
+    return start, end
+
+def iter_event_rows(html: str,
+                    table_id: Optional[str],
+                    fallback_first_table: bool = False,
+                    chunk_size: int = 1 << 16) -> Iterator[EventRow]:
+    """
+    Yield (date, time, actual, forecast, previous) for each row of the
+    Investing.com event history table with the given id (e.g. 'eventHistoryTable733').
+
+    Only the target table is tokenized, and rows are yielded as soon as they
+    are complete, so callers that only need the top row stop early.
+    Rows with fewer than 5 cells (header/icon rows) are skipped.
+    Raises LookupError if the table is not present.
+    """
+    bounds = _table_bounds(html, table_id)
+    if bounds is None and fallback_first_table:
+        bounds = _table_bounds(html, None)
+    if bounds is None:
+        raise LookupError(f"Table not found ({table_id}).")
+
+    start, end = bounds
+    tokenizer = _RowTokenizer()
+    pos = start
+    while pos < end:
+        nxt = min(pos + chunk_size, end)
+        tokenizer.feed(html[pos:nxt])
+        if nxt == end:
+            tokenizer.close()
+        pos = nxt
+
+        for cells in tokenizer.rows:
+            if len(cells) >= 5:
+                yield EventRow(*(clean_cell_text(c) for c in cells[:5]))
+        tokenizer.rows.clear()
+
+def read_event_rows(html_path: str, table_id: Optional[str], fallback_first_table: bool = False) -> list[EventRow]:
+    """Read a saved Investing.com page and return all rows of the target table."""
+    with timed("parse", page=os.path.basename(html_path)) as m:
+        with open(html_path, "r", encoding="utf-8") as f:
+            html = f.read()
+        rows = list(iter_event_rows(html, table_id, fallback_first_table=fallback_first_table))
+        m["rows"], m["bytes"] = len(rows), len(html)
+    return rows
@@ -1,55 +1,119 @@
 # data_fetchers/ivv_fetcher.py
 import os
 from datetime import datetime
+from typing import Callable
 import pandas as pd
-import yfinance as yf
+from data_fetchers.price_cache import (
+    read_price_cache, write_price_cache, append_price_cache, normalize_prices,
+)
 
-def get_ivv_prices(start: str = "2018-01-01",
-                   end: str | None = None,
-                   cache_path: str = "data/ivv_prices.csv") -> pd.DataFrame:
+# (ticker, start, end) -> daily OHLCV frame indexed by session date; `end` is exclusive
+PriceProvider = Callable[[str, str, str], pd.DataFrame]
+
+# Relative Close difference on the re-fetched last cached session that means the
+# provider has re-adjusted its history (dividend or split since the cache was written)
+ADJUSTMENT_TOLERANCE = 1e-4
+
+def yfinance_provider(ticker: str, start: str, end: str) -> pd.DataFrame:
+    """Default provider: auto-adjusted daily bars from yfinance (imported only when used)."""
+    import yfinance as yf
+    return yf.download(ticker, start=start, end=end, auto_adjust=True, progress=False)
+
+def frame_provider(history: pd.DataFrame) -> PriceProvider:
     """
-    Download (or load cached) IVV daily prices (auto-adjusted).
+    Offline stand-in provider serving slices of an in-memory OHLCV frame.
+    provider.calls records every (ticker, start, end) requested.
+    """
+    history = normalize_prices(history)
+
+    def provider(ticker: str, start: str, end: str) -> pd.DataFrame:
+        provider.calls.append((ticker, start, end))
+        return history[(history.index >= start) & (history.index < end)]
+
+    provider.calls = []
+    return provider
+
+def _day(d: pd.Timestamp, days: int = 0) -> str:
+    return (d + pd.Timedelta(days=days)).date().isoformat()
+
+def _readjusted(cached_close: float, fresh_close: float) -> bool:
+    if pd.isna(cached_close) or pd.isna(fresh_close) or cached_close == 0:
+        return False
+    return abs(fresh_close / cached_close - 1) > ADJUSTMENT_TOLERANCE
+
+def get_prices(ticker: str,
+               start: str = "2018-01-01",
+               end: str | None = None,
+               cache_path: str | None = None,
+               provider: PriceProvider | None = None) -> pd.DataFrame:
+    """
+    Daily prices (auto-adjusted) for any ticker, served from an incremental cache.
+    Cached at data/<ticker>_prices.csv unless cache_path is given.
+
+    Only sessions missing from the cache are requested from the provider: the
+    tail from the last cached session on (the daily case) and, if `start` is earlier
+    than the cache, the head before it. A pure tail is appended to the file; a
+    head fill or a legacy-format cache rewrites it once in the clean format.
+
+    Adjusted closes move back in time after every dividend or split, so the tail
+    request includes the last cached session. If the provider's close for it differs
+    from the cached one (beyond ADJUSTMENT_TOLERANCE), the cached history is on an
+    old adjustment basis and the whole range is downloaded again and rewritten.
     Index is normalized to America/New_York midnight.
     """
-    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    if cache_path is None:
+        cache_path = f"data/{ticker.lower()}_prices.csv"
+    os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+    provider = provider or yfinance_provider
 
     if end is None:
         end = datetime.utcnow().date().isoformat()
 
-    # Load cache if it exists and already covers the requested window
+    cached = None
+    needs_rewrite = True
     if os.path.isfile(cache_path):
         try:
-            cached = pd.read_csv(cache_path, parse_dates=["Date"])
-            cached["Date"] = (
-                cached["Date"]
-                .dt.tz_localize("UTC")
-                .dt.tz_convert("America/New_York")
-                .dt.normalize()
-            )
-            cached.set_index("Date", inplace=True)
-            if cached.index.min().date().isoformat() <= start and cached.index.max().date().isoformat() >= end:
-                return cached
+            cached = read_price_cache(cache_path)
+            needs_rewrite = cached.attrs.get("legacy_format", False)
         except Exception:
-            pass  # fall through to re-download if cache is broken
+            cached = None  # broken cache: rebuild from scratch
+
+    if cached is None or cached.empty:
+        head = normalize_prices(provider(ticker, start, end))
+        tail = normalize_prices(None)
+        cached = normalize_prices(None)
+    else:
+        first, last = cached.index.min(), cached.index.max()
+        tail = normalize_prices(provider(ticker, _day(last), end)) if _day(last, 1) < end else normalize_prices(None)
+        if last in tail.index and _readjusted(cached.at[last, "Close"], tail.at[last, "Close"]):
+            # Stale adjustment basis: refetch everything rather than splice two bases together
+            head = normalize_prices(provider(ticker, min(start, _day(first)), end))
+            tail = normalize_prices(None)
+            cached = normalize_prices(None)
+            needs_rewrite = True
+        else:
+            head = normalize_prices(provider(ticker, start, _day(first))) if start < _day(first) else normalize_prices(None)
+            tail = tail[tail.index > last]
+            needs_rewrite = needs_rewrite or not head.empty
 
-    # Download fresh
-    df = yf.download("IVV", start=start, end=end, auto_adjust=True, progress=False)
+    df = normalize_prices(pd.concat([head, cached, tail]))
     if df.empty:
-        raise RuntimeError("No IVV data downloaded.")
+        raise RuntimeError(f"No {ticker} data downloaded.")
+
+    if needs_rewrite:
+        write_price_cache(cache_path, df)
+    elif not tail.empty:
+        append_price_cache(cache_path, tail)
 
     # Normalize index to NY time midnight for easy merging with event dates
-    df.index = (
-        pd.to_datetime(df.index)
-        .tz_localize("UTC")
-        .tz_convert("America/New_York")
-        .normalize()
-    )
-
-    # Save cache
-    out = df.reset_index().rename(columns={"index": "Date"})
-    out.to_csv(cache_path, index=False)
-
-    return df
+    df.index = df.index.tz_localize("America/New_York")
+    return df[(df.index >= pd.Timestamp(start, tz="America/New_York"))]
+
+def get_ivv_prices(start: str = "2018-01-01",
+                   end: str | None = None,
+                   cache_path: str = "data/ivv_prices.csv",
+                   provider: PriceProvider | None = None) -> pd.DataFrame:
+    return get_prices("IVV", start=start, end=end, cache_path=cache_path, provider=provider)
 
 if __name__ == "__main__":
     ivv = get_ivv_prices()
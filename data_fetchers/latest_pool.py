@@ -0,0 +1,43 @@
+# data_fetchers/latest_pool.py
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional
+
+from data_fetchers.cpi_latest_fetcher import fetch_latest_cpi_row
+from data_fetchers.jobs_latest_fetcher import fetch_latest_job_row
+from data_fetchers.fed_latest_fetcher import fetch_latest_fed_row
+from data_fetchers.unemp_latest_fetcher import fetch_latest_unemp_row
+
+# label -> live fetcher; labels match the ones main.py logs with
+LATEST_FETCHERS: Dict[str, Callable] = {
+    "CPI": fetch_latest_cpi_row,
+    "Jobs": fetch_latest_job_row,
+    "Fed": fetch_latest_fed_row,
+    "Unemployment": fetch_latest_unemp_row,
+}
+
+def fetch_all_latest(labels: Optional[Iterable[str]] = None,
+                     urls: Optional[Dict[str, str]] = None,
+                     ttl: Optional[float] = None,
+                     max_workers: int = 4) -> Dict[str, object]:
+    """
+    Fetch the latest row for each indicator in parallel over the shared
+    keep-alive session (see http_client), so wall time is roughly the slowest
+    round trip instead of the sum of all of them.
+
+    urls optionally overrides the page per label (e.g. a local stand-in server);
+    ttl is passed through to the response cache (0 forces revalidation).
+    Returns {label: row or None}, in the order requested.
+    """
+    labels = list(labels) if labels is not None else list(LATEST_FETCHERS)
+    urls = urls or {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {}
+        for label in labels:
+            kwargs = {"ttl": ttl}
+            if label in urls:
+                kwargs["url"] = urls[label]
+            futures[label] = pool.submit(LATEST_FETCHERS[label], **kwargs)
+        # Each fetcher already returns None on failure, so result() does not raise
+        return {label: fut.result() for label, fut in futures.items()}
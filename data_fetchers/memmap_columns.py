@@ -0,0 +1,72 @@
+# data_fetchers/memmap_columns.py
+"""
+Directories of flat binary column files, one file per column, opened with np.memmap.
+
+The minute-bar and session price stores are both built on this. Each column's
+file is raw little-endian values named '<column>.<kind><itemsize>', for example
+minute.i4 or close.f8. There is no header, so a file can be appended to in
+place and mapped at offset 0.
+
+  map_columns     map every column read-only (nothing is read until touched)
+  write_columns   replace the whole directory (temp directory + swap)
+  append_columns  append rows in place
+
+A crash part-way through append_columns can leave columns of different lengths.
+map_columns uses the common length, and the next append_columns truncates the
+longer columns back to it first.
+"""
+
+import os
+import shutil
+import threading
+import numpy as np
+
+def column_file(col: str, dtype: np.dtype) -> str:
+    dtype = np.dtype(dtype)
+    return f"{col}.{dtype.kind}{dtype.itemsize}"
+
+def has_columns(path: str, dtypes: dict) -> bool:
+    return all(os.path.isfile(os.path.join(path, column_file(c, dt))) for c, dt in dtypes.items())
+
+def stored_length(path: str, dtypes: dict) -> int:
+    """Rows every column has (0 if the directory is missing or incomplete)."""
+    if not has_columns(path, dtypes):
+        return 0
+    return min(os.path.getsize(os.path.join(path, column_file(c, dt))) // np.dtype(dt).itemsize
+               for c, dt in dtypes.items())
+
+def map_columns(path: str, dtypes: dict) -> dict[str, np.ndarray]:
+    """Read-only np.memmap per column, cut to the common length (empty arrays if none stored)."""
+    n = stored_length(path, dtypes)
+    if not n:
+        # np.memmap cannot map an empty file
+        return {c: np.empty(0, dt) for c, dt in dtypes.items()}
+    return {c: np.memmap(os.path.join(path, column_file(c, dt)), dtype=dt, mode="r", shape=(n,))
+            for c, dt in dtypes.items()}
+
+def write_columns(path: str, columns: dict[str, np.ndarray]) -> int:
+    """
+    Replace the directory with these columns. The files are written to a temp directory
+    that is then swapped in, so readers never see a partial set. Open maps keep the old
+    (unlinked) files.
+    """
+    tag = f"{os.getpid()}.{threading.get_ident()}"
+    tmp, old = f"{path}.{tag}.tmp", f"{path}.{tag}.old"
+    shutil.rmtree(old, ignore_errors=True)   # left over from a crashed write
+    os.makedirs(tmp, exist_ok=True)
+    for col, arr in columns.items():
+        arr.tofile(os.path.join(tmp, column_file(col, arr.dtype)))
+    if os.path.isdir(path):
+        os.replace(path, old)
+    os.replace(tmp, path)
+    shutil.rmtree(old, ignore_errors=True)
+    return min(len(a) for a in columns.values())
+
+def append_columns(path: str, columns: dict[str, np.ndarray], n_stored: int) -> int:
+    """Append rows after the first n_stored rows of every column (callers drop their maps first)."""
+    for col, arr in columns.items():
+        with open(os.path.join(path, column_file(col, arr.dtype)), "r+b") as f:
+            f.truncate(n_stored * arr.dtype.itemsize)   # undo any half-finished append
+            f.seek(0, os.SEEK_END)
+            f.write(arr.tobytes())
+    return min(len(a) for a in columns.values())
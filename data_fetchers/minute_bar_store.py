@@ -0,0 +1,143 @@
+# data_fetchers/minute_bar_store.py
+"""
+Minute bars as flat binary columns, read back with np.memmap.
+
+Each ticker is a directory under config.MINUTE_BAR_DIR with one file per column:
+
+  minute.i4                 int32    bar start, minutes since 1970-01-01 00:00 UTC (sorted, unique)
+  open/high/low/close.f4    float32  (rounding is below 1e-7 relative, far under one tick)
+  volume.u4                 uint32   (missing volume is stored as 0)
+
+That is 24 bytes per bar. A year of regular-hours 1-minute bars (~98k) is about
+2.4 MB, and twenty years including extended hours is about 110 MB. Reading a
+ticker maps the files, so nothing is loaded up front and a lookup
+(np.searchsorted on minute) touches only the pages it visits.
+
+Bars after the last stored minute are appended to the column files in place.
+Anything else (back-fills, corrections) rewrites the ticker directory. The file
+layout and crash handling are in data_fetchers/memmap_columns.py.
+"""
+
+import os
+import numpy as np
+import pandas as pd
+import config
+from data_fetchers.price_cache import PRICE_COLUMNS
+from data_fetchers.memmap_columns import has_columns, map_columns, write_columns, append_columns
+
+# column -> dtype of its file (see memmap_columns)
+BAR_COLUMNS = {
+    "minute": np.dtype("<i4"),
+    "open": np.dtype("<f4"),
+    "high": np.dtype("<f4"),
+    "low": np.dtype("<f4"),
+    "close": np.dtype("<f4"),
+    "volume": np.dtype("<u4"),
+}
+
+def _empty() -> pd.DataFrame:
+    return pd.DataFrame(columns=PRICE_COLUMNS, index=pd.DatetimeIndex([], tz="UTC", name="Minute"), dtype="float64")
+
+def normalize_bars(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Provider output -> clean bar shape: UTC DatetimeIndex named Minute (floored to the
+    minute; naive timestamps are taken as UTC), float64 OHLCV columns, sorted, one row
+    per minute (last wins), rows without a Close dropped.
+    """
+    if df is None or df.empty:
+        return _empty()
+    df = df.copy()
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.get_level_values(0)
+    idx = pd.DatetimeIndex(pd.to_datetime(df.index))
+    idx = idx.tz_localize("UTC") if idx.tz is None else idx.tz_convert("UTC")
+    df.index = idx.floor("min").rename("Minute")
+    df = df.reindex(columns=PRICE_COLUMNS).astype("float64")
+    df = df[~df.index.duplicated(keep="last")].sort_index()
+    return df[df["Close"].notna()]
+
+def _columns_from_frame(df: pd.DataFrame) -> dict[str, np.ndarray]:
+    """Clean bar frame -> column arrays in the on-disk dtypes."""
+    minute = df.index.as_unit("ns").asi8 // 60_000_000_000
+    if len(minute) and (minute.min() < np.iinfo("<i4").min or minute.max() > np.iinfo("<i4").max):
+        raise ValueError("bar timestamps outside the int32 minute range")
+    cols = {"minute": minute.astype("<i4")}
+    for name in ("open", "high", "low", "close"):
+        cols[name] = df[name.capitalize()].to_numpy(dtype="<f4")
+    volume = df["Volume"].fillna(0).clip(0, np.iinfo("<u4").max)
+    cols["volume"] = volume.to_numpy().round().astype("<u4")
+    return cols
+
+def _minute(ts) -> int:
+    """Timestamp (naive = UTC) -> minutes since the epoch."""
+    t = pd.Timestamp(ts)
+    t = t.tz_localize("UTC") if t.tz is None else t.tz_convert("UTC")
+    return int(t.value // 60_000_000_000)
+
+class MinuteBars:
+    """
+    One ticker's bars as parallel column arrays (np.memmap views when read from
+    the store, plain arrays when built from a frame), sorted by minute.
+    """
+
+    def __init__(self, columns: dict[str, np.ndarray]):
+        n = min(len(a) for a in columns.values())
+        for col in BAR_COLUMNS:
+            setattr(self, col, columns[col][:n])
+
+    def __len__(self) -> int:
+        return len(self.minute)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "MinuteBars":
+        """In-memory bars from an OHLCV frame indexed by timestamp (see normalize_bars)."""
+        return cls(_columns_from_frame(normalize_bars(df)))
+
+    def frame(self, start=None, end=None) -> pd.DataFrame:
+        """Bars in [start, end) as a clean bar frame (copies only that range)."""
+        lo = 0 if start is None else int(np.searchsorted(self.minute, _minute(start), side="left"))
+        hi = len(self) if end is None else int(np.searchsorted(self.minute, _minute(end), side="left"))
+        idx = pd.to_datetime(np.asarray(self.minute[lo:hi], dtype="int64") * 60_000_000_000, unit="ns", utc=True)
+        out = pd.DataFrame({c.capitalize(): np.asarray(getattr(self, c)[lo:hi], dtype="float64")
+                            for c in ("open", "high", "low", "close", "volume")},
+                           index=pd.DatetimeIndex(idx, name="Minute"))
+        return out[PRICE_COLUMNS]
+
+class MinuteBarStore:
+    def __init__(self, root: str | None = None):
+        self.root = root or config.MINUTE_BAR_DIR
+
+    def path(self, ticker: str) -> str:
+        return os.path.join(self.root, ticker.upper())
+
+    def tickers(self) -> list[str]:
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(d for d in os.listdir(self.root) if has_columns(os.path.join(self.root, d), BAR_COLUMNS))
+
+    def read(self, ticker: str) -> MinuteBars:
+        """Map a ticker's bars read-only; an unknown ticker gives empty bars."""
+        return MinuteBars(map_columns(self.path(ticker), BAR_COLUMNS))
+
+    def write(self, ticker: str, df: pd.DataFrame) -> int:
+        """Replace a ticker's bars (readers never see a partial set)."""
+        return write_columns(self.path(ticker), _columns_from_frame(normalize_bars(df)))
+
+    def append(self, ticker: str, df: pd.DataFrame) -> int:
+        """
+        Add bars to a ticker. Bars after the last stored minute are appended in place;
+        if any fall at or before it, the stored and new bars are merged (new bars win)
+        and the ticker is rewritten. Returns the number of bars written.
+        """
+        bars = normalize_bars(df)
+        if bars.empty:
+            return 0
+        stored = self.read(ticker)
+        if not len(stored):
+            return self.write(ticker, bars)
+        if _columns_from_frame(bars.iloc[:1])["minute"][0] <= stored.minute[-1]:
+            return self.write(ticker, pd.concat([stored.frame(), bars]))
+
+        n = len(stored)
+        del stored   # drop the maps before resizing the files
+        return append_columns(self.path(ticker), _columns_from_frame(bars), n)
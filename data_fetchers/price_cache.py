@@ -0,0 +1,69 @@
+# data_fetchers/price_cache.py
+
+import os
+import pandas as pd
+
+PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+def _empty() -> pd.DataFrame:
+    return pd.DataFrame(columns=PRICE_COLUMNS, index=pd.DatetimeIndex([], name="Date"), dtype="float64")
+
+def normalize_prices(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Provider output -> clean cache shape: naive session-date index named Date,
+    single-level float64 OHLCV columns, sorted, one row per session.
+    """
+    if df is None or df.empty:
+        return _empty()
+    df = df.copy()
+    if isinstance(df.columns, pd.MultiIndex):
+        # yfinance returns (Price, Ticker) columns; this is what used to write the stray ',IVV,IVV,...' row
+        df.columns = df.columns.get_level_values(0)
+    idx = pd.DatetimeIndex(pd.to_datetime(df.index))
+    if idx.tz is not None:
+        idx = idx.tz_convert("America/New_York").tz_localize(None)
+    df.index = idx.normalize().rename("Date")
+    df = df.reindex(columns=PRICE_COLUMNS).astype("float64")
+    df = df[~df.index.duplicated(keep="last")].sort_index()
+    return df
+
+def read_price_cache(path: str) -> pd.DataFrame:
+    """
+    Read a price cache CSV into the clean shape (see normalize_prices).
+
+    Clean files have one header row and plain YYYY-MM-DD dates. Legacy files
+    (yfinance two-row header, '-05:00' offsets) are also accepted: those dates
+    were written by localizing each session date as UTC and converting to
+    New York, which lands on the previous calendar day, so one day is added back.
+    """
+    raw = pd.read_csv(path, dtype=str)
+    if raw.empty:
+        return _empty()
+    dates = raw["Date"].fillna("")
+    legacy = dates.str.contains(r"[+-]\d{2}:\d{2}$", regex=True).any()
+
+    parsed = pd.to_datetime(dates.where(dates != ""), errors="coerce", utc=legacy)
+    if legacy:
+        parsed = parsed.dt.tz_convert("America/New_York").dt.tz_localize(None).dt.normalize() + pd.Timedelta(days=1)
+
+    # Legacy header rows have no date; dropping them leaves only numeric text,
+    # and astype (unlike to_numeric) parses it back to the exact float written
+    keep = parsed.notna().to_numpy()
+    df = raw.drop(columns=["Date"])[keep].astype("float64")
+    df.index = pd.DatetimeIndex(parsed[keep], name="Date")
+    df = df[df["Close"].notna()]
+    df = normalize_prices(df)
+    df.attrs["legacy_format"] = bool(legacy)  # callers rewrite these in the clean format
+    return df
+
+def write_price_cache(path: str, df: pd.DataFrame) -> None:
+    """Rewrite the whole cache (temp file + rename, so readers never see a partial file)."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    normalize_prices(df).to_csv(tmp, date_format="%Y-%m-%d")
+    os.replace(tmp, path)
+
+def append_price_cache(path: str, df: pd.DataFrame) -> None:
+    """Append new sessions to an existing clean cache without rewriting it."""
+    with open(path, "a", newline="", encoding="utf-8") as f:
+        normalize_prices(df).to_csv(f, header=False, date_format="%Y-%m-%d")
@@ -0,0 +1,98 @@
+# data_fetchers/row_cache.py
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, fields
+from typing import Callable, List, Type, TypeVar
+import config
+
+T = TypeVar("T")
+
+# Persisted parse results live in a .row_cache folder next to each saved page (git-ignored),
+# or all in config.ROW_CACHE_DIR when set
+CACHE_DIR = config.ROW_CACHE_DIR
+
+# In-process memo: (abs html path, row type) -> (mtime_ns, size, sha256, rows)
+_memo: dict = {}
+
+def _file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _artifact_path(html_path: str, row_cls: type) -> str:
+    """
+    One artifact per (html file, row type), e.g.
+    .row_cache/cpi_investing.html.1a2b3c4d5e.CpiReportRow.json
+    The short path hash keeps same-named snapshots in different folders apart.
+    """
+    path_tag = hashlib.sha1(html_path.encode("utf-8")).hexdigest()[:10]
+    name = f"{os.path.basename(html_path)}.{path_tag}.{row_cls.__name__}.json"
+    return os.path.join(CACHE_DIR or os.path.join(os.path.dirname(html_path), ".row_cache"), name)
+
+def load_json(path: str) -> dict | None:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_json_atomic(path: str, payload: dict) -> None:
+    """Write via temp file + rename so a crashed run never leaves half an artifact."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f)
+    os.replace(tmp, path)
+
+def cached_rows(html_path: str, parse: Callable[[str], List[T]], row_cls: Type[T]) -> List[T]:
+    """
+    Return parse(html_path), re-parsing only when the snapshot has actually changed.
+
+    Lookup order:
+      1. in-process memo, valid while (mtime, size) are unchanged
+      2. on-disk artifact, valid if (mtime, size) match or the content sha256 matches,
+         and the row model still has the same fields
+      3. parse the HTML and refresh both layers
+    Exceptions from parse() propagate and nothing is cached.
+    """
+    html_path = os.path.abspath(html_path)
+    st = os.stat(html_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+
+    memo_key = (html_path, row_cls.__name__)
+    hit = _memo.get(memo_key)
+    if hit and hit[:2] == stamp:
+        return list(hit[3])
+
+    artifact_path = _artifact_path(html_path, row_cls)
+    artifact = load_json(artifact_path)
+    field_names = [f.name for f in fields(row_cls)]
+    if artifact and artifact.get("fields") != field_names:
+        artifact = None  # row model changed since the artifact was written
+
+    digest = None
+    rows = None
+    if artifact and (artifact.get("mtime_ns"), artifact.get("size")) == stamp:
+        digest = artifact.get("sha256")
+        rows = [row_cls(**r) for r in artifact.get("rows", [])]
+    else:
+        digest = _file_digest(html_path)
+        if artifact and artifact.get("sha256") == digest:
+            # Touched but not edited: keep rows, just refresh the stat stamp
+            rows = [row_cls(**r) for r in artifact.get("rows", [])]
+        else:
+            rows = parse(html_path)
+        write_json_atomic(artifact_path, {
+            "mtime_ns": stamp[0],
+            "size": stamp[1],
+            "sha256": digest,
+            "fields": field_names,
+            "rows": [asdict(r) for r in rows],
+        })
+
+    _memo[memo_key] = (stamp[0], stamp[1], digest, rows)
+    return list(rows)
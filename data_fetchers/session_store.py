@@ -0,0 +1,150 @@
+# data_fetchers/session_store.py
+"""
+Daily session prices as memory-mapped columns, one directory per ticker under
+config.SESSION_DIR (layout in data_fetchers/memmap_columns.py):
+
+  session.i4                            int32    New York session date, days since 1970-01-01 (sorted, unique)
+  open/high/low/close/volume.f8         float64  same values as the price cache CSV
+
+Opening a ticker maps six files and reads nothing. 30 years of sessions is
+about 7.5k rows, or 340 KB per ticker. The returns code reads the session and
+close columns directly (see logic.impact.returns.session_closes), so nothing
+is parsed, converted or copied per run.
+
+The store is filled from the price cache CSVs (sync). A CSV is re-read only
+when its (mtime, size) stamp changes. New sessions are then appended in place,
+and anything else rewrites the ticker.
+"""
+
+import os
+import threading
+import numpy as np
+import pandas as pd
+import config
+from data_fetchers.price_cache import PRICE_COLUMNS, normalize_prices, read_price_cache
+from data_fetchers.memmap_columns import has_columns, map_columns, write_columns, append_columns
+from data_fetchers.row_cache import load_json, write_json_atomic
+
+# column -> dtype of its file
+SESSION_COLUMNS = {
+    "session": np.dtype("<i4"),
+    "open": np.dtype("<f8"),
+    "high": np.dtype("<f8"),
+    "low": np.dtype("<f8"),
+    "close": np.dtype("<f8"),
+    "volume": np.dtype("<f8"),
+}
+
+# Per-ticker record of the CSV the columns were last synced from
+_SOURCE_FILE = "source.json"
+
+# Serializes sync() within a process (the pipeline runs the returns stages on a thread pool)
+_sync_lock = threading.Lock()
+
+def _columns_from_frame(df: pd.DataFrame) -> dict[str, np.ndarray]:
+    """Clean price frame (normalize_prices) -> column arrays; sessions without a Close are dropped."""
+    df = df[df["Close"].notna()]
+    cols = {"session": df.index.values.astype("datetime64[D]").astype("<i4")}
+    for col in PRICE_COLUMNS:
+        cols[col.lower()] = df[col].to_numpy(dtype="<f8")
+    return cols
+
+class SessionPrices:
+    """One ticker's sessions as parallel column arrays (np.memmap views when read from the store)."""
+
+    def __init__(self, columns: dict[str, np.ndarray]):
+        n = min(len(a) for a in columns.values())
+        for col in SESSION_COLUMNS:
+            setattr(self, col, columns[col][:n])
+
+    def __len__(self) -> int:
+        return len(self.session)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "SessionPrices":
+        """In-memory sessions from a daily OHLCV frame (see normalize_prices)."""
+        return cls(_columns_from_frame(normalize_prices(df)))
+
+    @property
+    def dates(self) -> pd.DatetimeIndex:
+        """Session dates as New York midnight timestamps."""
+        return pd.DatetimeIndex(np.asarray(self.session).astype("datetime64[D]")).tz_localize("America/New_York")
+
+    def frame(self) -> pd.DataFrame:
+        """Clean price-cache shape: naive session-date index named Date, float64 OHLCV."""
+        return pd.DataFrame({c: np.asarray(getattr(self, c.lower())) for c in PRICE_COLUMNS},
+                            index=pd.DatetimeIndex(np.asarray(self.session).astype("datetime64[D]"), name="Date"))
+
+    def prices(self) -> pd.DataFrame:
+        """Date (NY midnight) + Close, the shape load_prices and EventDatabase.prices return."""
+        return pd.DataFrame({"Date": self.dates, "Close": np.asarray(self.close)})
+
+class SessionStore:
+    def __init__(self, root: str | None = None):
+        self.root = root or config.SESSION_DIR
+
+    def path(self, ticker: str) -> str:
+        return os.path.join(self.root, ticker.upper())
+
+    def tickers(self) -> list[str]:
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(d for d in os.listdir(self.root) if has_columns(os.path.join(self.root, d), SESSION_COLUMNS))
+
+    def read(self, ticker: str) -> SessionPrices:
+        """Map a ticker's sessions read-only; an unknown ticker gives empty sessions."""
+        return SessionPrices(map_columns(self.path(ticker), SESSION_COLUMNS))
+
+    def write(self, ticker: str, df: pd.DataFrame) -> int:
+        """Replace a ticker's sessions (readers never see a partial set)."""
+        return write_columns(self.path(ticker), _columns_from_frame(normalize_prices(df)))
+
+    def append(self, ticker: str, df: pd.DataFrame) -> int:
+        """
+        Add sessions to a ticker. Sessions after the last stored one are appended in place;
+        if any fall on or before it, stored and new sessions are merged (new ones win)
+        and the ticker is rewritten. Returns the number of sessions written.
+        """
+        new = normalize_prices(df)
+        new = new[new["Close"].notna()]
+        if new.empty:
+            return 0
+        stored = self.read(ticker)
+        if not len(stored):
+            return self.write(ticker, new)
+        if _columns_from_frame(new.iloc[:1])["session"][0] <= stored.session[-1]:
+            return self.write(ticker, pd.concat([stored.frame(), new]))
+
+        n = len(stored)
+        del stored   # drop the maps before resizing the files
+        return append_columns(self.path(ticker), _columns_from_frame(new), n)
+
+    def sync(self, ticker: str, csv_path: str) -> SessionPrices:
+        """
+        Bring a ticker up to date with its price cache CSV and map it. The CSV is read
+        only when it changed since the last sync; a CSV that only gained sessions at the
+        end is appended, anything else rewrites the ticker.
+        """
+        with _sync_lock:
+            return self._sync(ticker, csv_path)
+
+    def _sync(self, ticker: str, csv_path: str) -> SessionPrices:
+        st = os.stat(csv_path)
+        stamp = {"csv": os.path.abspath(csv_path), "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+        source_path = os.path.join(self.path(ticker), _SOURCE_FILE)
+        if load_json(source_path) == stamp and has_columns(self.path(ticker), SESSION_COLUMNS):
+            return self.read(ticker)
+
+        prices = read_price_cache(csv_path)
+        stored = self.read(ticker)
+        n = len(stored)
+        kept = (0 < n <= len(prices)
+                and np.array_equal(_columns_from_frame(prices.iloc[:n])["session"], stored.session)
+                and np.array_equal(prices["Close"].to_numpy()[:n], stored.close))
+        del stored   # drop the maps before the files change
+        if not kept:
+            self.write(ticker, prices)
+        elif len(prices) > n:
+            self.append(ticker, prices.iloc[n:])
+        write_json_atomic(source_path, stamp)
+        return self.read(ticker)
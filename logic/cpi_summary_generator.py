@@ -2,34 +2,11 @@
 
 from models.cpi_report_row import CpiReportRow
 from typing import Dict, Any, List, Optional
+from utils.value_parser import parse_value, parse_values
 
-def _parse_percent(val: str) -> Optional[float]:
-    """
-    Convert '2.7%' -> 2.7 (float), blank/None -> None.
-    """
-    if not val:
-        return None
-    try:
-        return float(val.replace("%", "").strip())
-    except ValueError:
-        return None
-
-def generate_cpi_summary(cpi_rows: List[CpiReportRow]) -> Dict[str, Any]:
-    """
-    Generate a CPI summary comparing the latest and previous months.
-    Assumes rows are sorted newest -> oldest.
-    """
-    if not cpi_rows or len(cpi_rows) < 2:
-        raise Exception("Need at least two rows of CPI data.")
-
-    latest = cpi_rows[0]
-    previous = cpi_rows[1]
-
-    # Parse values
-    actual = _parse_percent(latest.actual)
-    consensus = _parse_percent(latest.consensus)
-    previous_actual = _parse_percent(previous.actual)
-
+def _cpi_summary(latest: CpiReportRow, previous: CpiReportRow, actual: Optional[float],
+                 consensus: Optional[float], previous_actual: Optional[float]) -> Dict[str, Any]:
+    """Summary of one release from its parsed values; the single and batch forms both end here."""
     # Calculate surprise and change
     surprise = (actual - consensus) if actual is not None and consensus is not None else None
     change = (actual - previous_actual) if actual is not None and previous_actual is not None else None
@@ -70,3 +47,31 @@ def generate_cpi_summary(cpi_rows: List[CpiReportRow]) -> Dict[str, Any]:
         "change_from_previous": f"{change:+.1f}pp" if change is not None else "N/A",
         "meta_commentary": commentary
     }
+
+
+def generate_cpi_summary(cpi_rows: List[CpiReportRow]) -> Dict[str, Any]:
+    """
+    Generate a CPI summary comparing the latest and previous months.
+    Assumes rows are sorted newest -> oldest.
+    """
+    if not cpi_rows or len(cpi_rows) < 2:
+        raise Exception("Need at least two rows of CPI data.")
+
+    latest = cpi_rows[0]
+    previous = cpi_rows[1]
+    return _cpi_summary(latest, previous, parse_value(latest.actual), parse_value(latest.consensus),
+                        parse_value(previous.actual))
+
+
+def generate_cpi_summaries(cpi_rows: List[CpiReportRow]) -> List[Dict[str, Any]]:
+    """
+    Batch generate_cpi_summary over every [i, i+1] window of newest -> oldest rows:
+    entry i equals generate_cpi_summary(cpi_rows[i:i+2]). Each column is parsed once.
+    """
+    if len(cpi_rows) < 2:
+        return []
+
+    actual = parse_values([r.actual for r in cpi_rows])
+    consensus = parse_values([r.consensus for r in cpi_rows[:-1]])
+    return [_cpi_summary(latest, previous, actual[i], consensus[i], actual[i + 1])
+            for i, (latest, previous) in enumerate(zip(cpi_rows, cpi_rows[1:]))]
@@ -2,33 +2,11 @@
 
 from typing import List, Dict, Any, Optional
 from models.fed_rate_row import FedRateRow
+from utils.value_parser import parse_value, parse_values
 
-def _parse_pct(val: Optional[str]) -> Optional[float]:
-    if not val:
-        return None
-    try:
-        return float(val.replace("%", "").strip())
-    except Exception:
-        return None
-
-def generate_fed_rate_summary(rate_rows: List[FedRateRow]) -> Dict[str, Any]:
-    """
-    Expects newest -> oldest rows.
-    Uses previous row's *actual* as prior policy rate when available.
-    """
-    if not rate_rows or len(rate_rows) < 2:
-        raise ValueError("Need at least two rows of data")
-
-    latest = rate_rows[0]
-    prev = rate_rows[1]
-
-    actual = _parse_pct(latest.actual)                 # e.g., 4.50
-    forecast = _parse_pct(latest.forecast)             # e.g., 4.50
-    prev_actual = _parse_pct(prev.actual)              # preferred "previous" comparator
-    # Fallback to the "Previous" column on latest row if prev.actual is missing
-    if prev_actual is None:
-        prev_actual = _parse_pct(latest.previous)
-
+def _fed_rate_summary(latest: FedRateRow, actual: Optional[float], forecast: Optional[float],
+                      prev_actual: Optional[float]) -> Dict[str, Any]:
+    """Summary of one decision from its parsed values; the single and batch forms both end here."""
     # Compute deltas
     change_val = (actual - prev_actual) if (actual is not None and prev_actual is not None) else None
     surprise_val = (actual - forecast) if (actual is not None and forecast is not None) else None
@@ -72,3 +50,38 @@ def generate_fed_rate_summary(rate_rows: List[FedRateRow]) -> Dict[str, Any]:
         "surprise": surprise_out,
         "meta_commentary": commentary
     }
+
+
+def generate_fed_rate_summary(rate_rows: List[FedRateRow]) -> Dict[str, Any]:
+    """
+    Expects newest -> oldest rows.
+    Uses previous row's *actual* as prior policy rate when available.
+    """
+    if not rate_rows or len(rate_rows) < 2:
+        raise ValueError("Need at least two rows of data")
+
+    latest = rate_rows[0]
+    prev = rate_rows[1]
+
+    prev_actual = parse_value(prev.actual)             # preferred "previous" comparator
+    # Fallback to the "Previous" column on latest row if prev.actual is missing
+    if prev_actual is None:
+        prev_actual = parse_value(latest.previous)
+    return _fed_rate_summary(latest, parse_value(latest.actual), parse_value(latest.forecast), prev_actual)
+
+
+def generate_fed_rate_summaries(rate_rows: List[FedRateRow]) -> List[Dict[str, Any]]:
+    """
+    Batch generate_fed_rate_summary over every [i, i+1] window of newest -> oldest rows:
+    entry i equals generate_fed_rate_summary(rate_rows[i:i+2]), with each column parsed once.
+    """
+    if len(rate_rows) < 2:
+        return []
+
+    actual = parse_values([r.actual for r in rate_rows])
+    forecast = parse_values([r.forecast for r in rate_rows[:-1]])
+    stated_prev = parse_values([r.previous for r in rate_rows[:-1]])
+
+    # Prior rate: the next-older row's actual, else the latest row's "Previous" column
+    prior = [a if a is not None else p for a, p in zip(actual[1:], stated_prev)]
+    return [_fed_rate_summary(latest, actual[i], forecast[i], prior[i]) for i, latest in enumerate(rate_rows[:-1])]
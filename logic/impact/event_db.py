@@ -0,0 +1,423 @@
+# logic/impact/event_db.py
+"""
+Embedded event database: the summary store's SQLite file plus
+
+  raw_rows        fetcher rows, keyed (event_type, date)
+  price_sessions  daily OHLCV, keyed (ticker, session_date)
+  event_returns   the *_with_returns rows of every event type in one table
+  event_stats     running bucket statistics over event_returns (logic/impact/online_stats.py),
+                  updated with each write so the analysis tables are available without a rescan
+  live_events     event_returns rows upserted by main.add_latest that the summary files the
+                  returns stages read do not have yet; write_event_returns keeps them
+
+raw_rows and event_returns are indexed on (event_type, release_date) and on
+reference_month, so the query methods read only the rows they return.
+Query results come back typed like utils.storage.read_table.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+from collections import Counter
+from utils.lazy import lazy_import
+from utils.metrics import timed
+from logic.impact.online_stats import OnlineEventStats, RunningStats, stat_inputs
+from utils.summary_store import SummaryStore, release_day
+
+# Deferred so that main.py's raw-row and summary writes start without pandas
+pd = lazy_import("pandas")
+
+# Canonical order; multi-type results are concatenated in this order (as combine_all_returns did)
+EVENT_TYPES = ("cpi", "jobs", "unemployment", "fed")
+
+# Per-type artifacts written by the scripts/*_returns_demo.py stages
+WITH_RETURNS_PATHS = {
+    "cpi": "data/cpi_with_returns.csv",
+    "jobs": "data/jobs_with_returns.csv",
+    "unemployment": "data/unemp_with_returns.csv",
+    "fed": "data/fed_with_returns.csv",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS raw_rows (
+    event_type      TEXT NOT NULL,
+    release_date    TEXT,           -- ISO day parsed from date
+    reference_month TEXT,
+    date            TEXT NOT NULL,  -- as shown on the page, e.g. "Aug 01, 2025  (Jul)"
+    actual          TEXT,
+    previous        TEXT,
+    consensus       TEXT,
+    forecast        TEXT,
+    release_time    TEXT,           -- page clock, e.g. "08:30" (config.INVESTING_UTC_OFFSET)
+    PRIMARY KEY (event_type, date)
+);
+CREATE INDEX IF NOT EXISTS raw_rows_type_date ON raw_rows (event_type, release_date);
+CREATE INDEX IF NOT EXISTS raw_rows_month ON raw_rows (reference_month);
+
+CREATE TABLE IF NOT EXISTS price_sessions (
+    ticker       TEXT NOT NULL,
+    session_date TEXT NOT NULL,     -- YYYY-MM-DD
+    open REAL, high REAL, low REAL, close REAL, volume REAL,
+    PRIMARY KEY (ticker, session_date)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS event_returns (
+    event_type      TEXT NOT NULL,
+    release_date    TEXT,           -- "2025-08-01 00:00:00-04:00"; sorts by day
+    reference_month TEXT            -- reference_month, or latest_reference_month for jobs
+);
+CREATE INDEX IF NOT EXISTS event_returns_type_date ON event_returns (event_type, release_date);
+CREATE INDEX IF NOT EXISTS event_returns_month ON event_returns (reference_month);
+
+-- column order of each event type's frame, so queries return exactly what was written
+CREATE TABLE IF NOT EXISTS event_columns (
+    event_type   TEXT PRIMARY KEY,
+    columns_json TEXT NOT NULL
+);
+
+-- OnlineEventStats state, one RunningStats per (table, bucket, column)
+CREATE TABLE IF NOT EXISTS event_stats (
+    tbl        TEXT NOT NULL,
+    bucket     TEXT NOT NULL,
+    col        TEXT NOT NULL,
+    state_json TEXT NOT NULL,
+    PRIMARY KEY (tbl, bucket, col)
+) WITHOUT ROWID;
+
+-- (event_type, release_date) of live releases from upsert_event_returns, kept by
+-- write_event_returns until a full rewrite of that type includes them
+CREATE TABLE IF NOT EXISTS live_events (
+    event_type   TEXT NOT NULL,
+    release_date TEXT NOT NULL,
+    PRIMARY KEY (event_type, release_date)
+) WITHOUT ROWID;
+
+-- files already loaded (price caches), so unchanged ones are not re-read
+CREATE TABLE IF NOT EXISTS sources (
+    name     TEXT PRIMARY KEY,
+    mtime_ns INTEGER,
+    size     INTEGER
+);
+"""
+
+_RAW_FIELDS = ("actual", "previous", "consensus", "forecast")
+_RAW_INSERT = ("INSERT OR REPLACE INTO raw_rows (event_type, release_date, reference_month, date, "
+               f"{', '.join(_RAW_FIELDS)}, release_time) VALUES ({', '.join('?' * (len(_RAW_FIELDS) + 5))})")
+
+def _q(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+def _day_bounds(start, end) -> tuple[str | None, str | None]:
+    """Inclusive [start, end] dates -> ('YYYY-MM-DD', next day) string bounds for release_date columns."""
+    lo = pd.Timestamp(start).date().isoformat() if start is not None else None
+    hi = (pd.Timestamp(end) + pd.Timedelta(days=1)).date().isoformat() if end is not None else None
+    return lo, hi
+
+def _sql_values(df: pd.DataFrame) -> list[tuple]:
+    """Frame -> row tuples SQLite accepts: timestamps as text, missing as NULL."""
+    out = df.copy()
+    for col in out.columns:
+        if isinstance(out[col].dtype, pd.DatetimeTZDtype) or pd.api.types.is_datetime64_dtype(out[col].dtype):
+            out[col] = out[col].astype(str).where(out[col].notna())
+    out = out.astype(object).where(out.notna(), None)
+    return list(out.itertuples(index=False, name=None))
+
+class EventDatabase(SummaryStore):
+    def __init__(self, path: str | None = None):
+        super().__init__(path)
+        self.conn.executescript(_SCHEMA)
+        # Databases from before release times were kept
+        if "release_time" not in {r[1] for r in self.conn.execute("PRAGMA table_info(raw_rows)")}:
+            with self.conn:
+                self.conn.execute("ALTER TABLE raw_rows ADD COLUMN release_time TEXT")
+
+    # ---- writers ----
+
+    @staticmethod
+    def _raw_record(event_type: str, row) -> tuple:
+        d = dataclasses.asdict(row) if dataclasses.is_dataclass(row) else dict(row)
+        ref = d.get("reference_month") or d.get("reference")
+        return (event_type, release_day(d["date"]), ref, d["date"], *(d.get(f) for f in _RAW_FIELDS), d.get("time") or None)
+
+    def write_raw_rows(self, event_type: str, rows: list) -> None:
+        """Replace event_type's fetcher rows (CpiReportRow, JobReportRow, ... or dicts)."""
+        with timed("store_write", table="raw_rows", event_type=event_type, rows=len(rows)), self.conn:
+            self.conn.execute("DELETE FROM raw_rows WHERE event_type = ?", (event_type,))
+            self.conn.executemany(_RAW_INSERT, [self._raw_record(event_type, r) for r in rows])
+
+    def upsert_raw_row(self, event_type: str, row) -> None:
+        with timed("store_write", table="raw_rows", event_type=event_type, rows=1), self.conn:
+            self.conn.execute(_RAW_INSERT, self._raw_record(event_type, row))
+
+    def sync_prices(self, ticker: str, csv_path: str) -> int:
+        """Load a price cache CSV into price_sessions, unless this file version is already loaded."""
+        st = os.stat(csv_path)
+        name = f"prices:{ticker}:{os.path.abspath(csv_path)}"
+        seen = self.conn.execute("SELECT mtime_ns, size FROM sources WHERE name = ?", (name,)).fetchone()
+        if seen == (st.st_mtime_ns, st.st_size):
+            return 0
+
+        from data_fetchers.price_cache import read_price_cache, PRICE_COLUMNS
+        prices = read_price_cache(csv_path)
+        records = [(ticker, d.date().isoformat(), *vals)
+                   for d, vals in zip(prices.index, prices[PRICE_COLUMNS].itertuples(index=False, name=None))]
+        with timed("store_write", table="price_sessions", ticker=ticker, rows=len(records)), self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO price_sessions VALUES (?, ?, ?, ?, ?, ?, ?)", records)
+            self.conn.execute("INSERT OR REPLACE INTO sources VALUES (?, ?, ?)", (name, st.st_mtime_ns, st.st_size))
+        return len(records)
+
+    def _event_columns(self) -> list[str]:
+        return [r[1] for r in self.conn.execute("PRAGMA table_info(event_returns)")]
+
+    def _add_event_columns(self, events: pd.DataFrame) -> None:
+        existing = set(self._event_columns())
+        for col in events.columns:
+            if col not in existing:
+                kind = "REAL" if pd.api.types.is_numeric_dtype(events[col].dtype) else "TEXT"
+                self.conn.execute(f"ALTER TABLE event_returns ADD COLUMN {_q(col)} {kind}")
+
+    @staticmethod
+    def _with_reference_month(rows: pd.DataFrame) -> pd.DataFrame:
+        if "reference_month" not in rows.columns:
+            rows = rows.copy()
+            rows["reference_month"] = rows["latest_reference_month"] if "latest_reference_month" in rows.columns else None
+        return rows
+
+    def write_event_returns(self, events: pd.DataFrame) -> None:
+        """
+        Replace the rows of every event type present in `events` (a *_with_returns frame,
+        or several concatenated). New columns are added to the table as needed.
+        Live releases (upsert_event_returns) that `events` does not include are kept, so a
+        returns stage rerun from data/*_summary.csv does not drop what add_latest stored.
+        """
+        if events.empty:
+            return
+        types = events["event_type"].astype(str)
+        single = types.nunique() == 1
+
+        with timed("store_write", table="event_returns", rows=len(events)), self.conn:
+            # Take the write lock before reading the schema, so concurrent writers add each column once
+            self.conn.execute("BEGIN IMMEDIATE")
+            self._add_event_columns(events)
+
+            stats = self._load_stats()
+            for event_type, group in events.groupby(types, sort=False):
+                # A concatenated frame carries every type's columns; keep the ones this type fills
+                cols = list(group.columns) if single else [
+                    c for c in group.columns if c in ("event_type", "release_date") or group[c].notna().any()]
+                rows = self._with_reference_month(group[cols])
+                values = _sql_values(rows)
+                # Live releases this frame now covers are ordinary rows again; the rest stay
+                at = list(rows.columns).index("release_date")
+                dates = [(event_type, v[at]) for v in values if v[at] is not None]
+                self.conn.executemany("DELETE FROM live_events WHERE event_type = ? AND release_date = ?", dates)
+                kept = {r[0] for r in self.conn.execute(
+                    "SELECT release_date FROM live_events WHERE event_type = ?", (event_type,))}
+                self._update_stats(stats, event_type, [dict(zip(rows.columns, v)) for v in values], kept)
+                self.conn.execute(
+                    "DELETE FROM event_returns WHERE event_type = ? AND (release_date IS NULL OR release_date NOT IN "
+                    "(SELECT release_date FROM live_events WHERE event_type = ?))", (event_type, event_type))
+                self.conn.executemany(
+                    f"INSERT INTO event_returns ({', '.join(map(_q, rows.columns))}) "
+                    f"VALUES ({', '.join('?' * len(rows.columns))})",
+                    values,
+                )
+                self.conn.execute("INSERT OR REPLACE INTO event_columns VALUES (?, ?)", (event_type, json.dumps(cols)))
+            self._save_stats(stats)
+
+    def upsert_event_returns(self, events: pd.DataFrame) -> None:
+        """
+        Insert or replace single events, keyed by (event_type, release_date), leaving the
+        type's other rows alone; the running statistics are revised in the same transaction.
+        This is how main.add_latest makes a new release show up in live_tables() at once.
+        The events are marked live, so write_event_returns keeps them until it is given them.
+        """
+        if events.empty:
+            return
+        with timed("store_write", table="event_returns", rows=len(events)), self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self._add_event_columns(events)
+            rows = self._with_reference_month(events)
+            cols = list(rows.columns)
+            stats = self._load_stats()
+            for values in _sql_values(rows):
+                record = dict(zip(cols, values))
+                key = (str(record["event_type"]), record["release_date"])
+                for old in self._stored_rows(*key):
+                    stats.remove(stat_inputs(old))
+                stats.insert(stat_inputs(record))
+                self.conn.execute("DELETE FROM event_returns WHERE event_type = ? AND release_date = ?", key)
+                self.conn.execute(
+                    f"INSERT INTO event_returns ({', '.join(map(_q, cols))}) VALUES ({', '.join('?' * len(cols))})",
+                    values,
+                )
+                self.conn.execute("INSERT OR IGNORE INTO event_columns VALUES (?, ?)", (key[0], json.dumps(cols)))
+                self.conn.execute("INSERT OR IGNORE INTO live_events VALUES (?, ?)", key)
+            self._save_stats(stats)
+
+    # ---- running statistics ----
+
+    def _stored_rows(self, event_type: str | None = None, release_date: str | None = None) -> list[dict]:
+        """event_returns rows as dicts (only the columns the statistics read)."""
+        have = set(self._event_columns())
+        wanted = ["event_type", "release_date", "surprise", "revision_change", "same_day_return", "next_day_return",
+                  "ivv_same_day_return", "ivv_next_day_return"]
+        cols = [c for c in wanted if c in have]
+        sql = f"SELECT {', '.join(map(_q, cols))} FROM event_returns"
+        args: tuple = ()
+        if event_type is not None:
+            sql += " WHERE event_type = ?"
+            args = (event_type,)
+            if release_date is not None:
+                sql += " AND release_date = ?"
+                args += (release_date,)
+        return [dict(zip(cols, r)) for r in self.conn.execute(sql, args)]
+
+    def _load_stats(self) -> OnlineEventStats:
+        """Persisted statistics; built from event_returns the first time (databases written before they existed)."""
+        rows = self.conn.execute("SELECT tbl, bucket, col, state_json FROM event_stats").fetchall()
+        if rows:
+            return OnlineEventStats({(t, b, c): RunningStats.from_dict(json.loads(j)) for t, b, c, j in rows})
+        return OnlineEventStats.from_rows(self._stored_rows())
+
+    def _update_stats(self, stats: OnlineEventStats, event_type: str, new_rows: list[dict], kept=()) -> None:
+        """
+        Apply the difference between event_type's stored rows (except those released on a
+        `kept` date, which stay as they are) and new_rows (changed events only).
+        """
+        old = Counter(stat_inputs(r) for r in self._stored_rows(event_type) if r["release_date"] not in kept)
+        new = Counter(stat_inputs({**r, "event_type": event_type}) for r in new_rows)
+        for inputs in (old - new).elements():
+            stats.remove(inputs)
+        for inputs in (new - old).elements():
+            stats.insert(inputs)
+
+    def _save_stats(self, stats: OnlineEventStats) -> None:
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO event_stats VALUES (?, ?, ?, ?)",
+            [(*key, json.dumps(stats.stats[key].to_dict())) for key in stats.touched],
+        )
+        stats.touched.clear()
+
+    def event_stats(self) -> OnlineEventStats:
+        """Running bucket statistics over every stored event (see online_stats.py)."""
+        return self._load_stats()
+
+    def live_tables(self) -> dict[str, pd.DataFrame]:
+        """The event_analysis bucket tables from the running statistics, without reading any events."""
+        return self._load_stats().tables()
+
+    def seed_event_returns(self, paths: dict[str, str]) -> list[str]:
+        """Import {event_type: *_with_returns CSV} for event types the database has no rows for yet."""
+        from utils.storage import read_table
+        seeded = []
+        for event_type, path in paths.items():
+            if event_type not in self.event_types() and os.path.isfile(path):
+                df = read_table(path)
+                df["event_type"] = event_type
+                self.write_event_returns(df)
+                seeded.append(event_type)
+        return seeded
+
+    def reader(self):
+        """read(path) for pipeline stages: *_with_returns paths come from event_returns, others from read_table."""
+        from utils.storage import read_table
+        by_path = {path: event_type for event_type, path in WITH_RETURNS_PATHS.items()}
+
+        def read(path: str) -> pd.DataFrame:
+            event_type = by_path.get(path)
+            if event_type in self.event_types():
+                return self.events(event_type)
+            return read_table(path)
+        return read
+
+    # ---- queries ----
+
+    def event_types(self) -> list[str]:
+        have = {r[0] for r in self.conn.execute("SELECT event_type FROM event_columns")}
+        return [t for t in EVENT_TYPES if t in have] + sorted(have - set(EVENT_TYPES))
+
+    def _where(self, event_type: str, start, end, reference_month) -> tuple[str, list]:
+        clauses, args = ["event_type = ?"], [event_type]
+        lo, hi = _day_bounds(start, end)
+        if lo is not None:
+            clauses.append("release_date >= ?")
+            args.append(lo)
+        if hi is not None:
+            clauses.append("release_date < ?")
+            args.append(hi)
+        if reference_month is not None:
+            clauses.append("reference_month = ?")
+            args.append(reference_month)
+        return " AND ".join(clauses), args
+
+    def events(self,
+               event_type: str | list[str] | None = None,
+               start=None,
+               end=None,
+               reference_month: str | None = None) -> pd.DataFrame:
+        """
+        Event-return rows for one or more event types (default: all), optionally limited to
+        release dates in [start, end] and/or one reference month. Each type's rows come back
+        in the order they were written, with that type's columns; types are concatenated in
+        EVENT_TYPES order.
+        """
+        types = self.event_types() if event_type is None else (
+            [event_type] if isinstance(event_type, str) else list(event_type))
+        frames = []
+        for t in types:
+            hit = self.conn.execute("SELECT columns_json FROM event_columns WHERE event_type = ?", (t,)).fetchone()
+            if hit is None:
+                continue
+            cols = json.loads(hit[0])
+            where, args = self._where(t, start, end, reference_month)
+            frames.append(pd.read_sql_query(
+                f"SELECT {', '.join(map(_q, cols))} FROM event_returns WHERE {where} ORDER BY rowid",
+                self.conn, params=args,
+            ))
+        if not frames:
+            return pd.DataFrame()
+        from utils.storage import to_typed
+        return to_typed(pd.concat(frames, ignore_index=True))
+
+    def raw_rows(self,
+                 event_type: str | None = None,
+                 start=None,
+                 end=None,
+                 reference_month: str | None = None) -> pd.DataFrame:
+        """Fetcher rows, newest first within each event type."""
+        types = EVENT_TYPES if event_type is None else (event_type,)
+        frames = []
+        for t in types:
+            where, args = self._where(t, start, end, reference_month)
+            frames.append(pd.read_sql_query(
+                f"SELECT * FROM raw_rows WHERE {where} ORDER BY release_date DESC", self.conn, params=args))
+        return pd.concat(frames, ignore_index=True)
+
+    def prices(self, ticker: str, start=None, end=None) -> pd.DataFrame:
+        """Date (NY midnight) + Close for a ticker, sorted by Date (same shape as returns.load_prices)."""
+        clauses, args = ["ticker = ?"], [ticker]
+        if start is not None:
+            clauses.append("session_date >= ?")
+            args.append(pd.Timestamp(start).date().isoformat())
+        if end is not None:
+            clauses.append("session_date <= ?")
+            args.append(pd.Timestamp(end).date().isoformat())
+        df = pd.read_sql_query(
+            f"SELECT session_date AS Date, close AS Close FROM price_sessions "
+            f"WHERE {' AND '.join(clauses)} ORDER BY session_date",
+            self.conn, params=args,
+        )
+        df["Date"] = pd.to_datetime(df["Date"]).dt.tz_localize("America/New_York")
+        return df.dropna().reset_index(drop=True)
+
+    def summaries(self, event_type: str, limit: int | None = None) -> pd.DataFrame:
+        """Stored summaries, newest first, as a frame."""
+        rows = self.newest(event_type, limit)
+        return pd.DataFrame(rows, columns=list(rows[0].keys()) if rows else None)
+
+    def query(self, sql: str, params=()) -> pd.DataFrame:
+        """Ad-hoc SQL against the database, e.g. joins of event_returns with price_sessions."""
+        return pd.read_sql_query(sql, self.conn, params=params)
@@ -0,0 +1,76 @@
+# logic/impact/event_windows.py
+import numpy as np
+import pandas as pd
+from .trading_calendar import to_ny_date
+from data_fetchers.session_store import SessionPrices
+from .returns import session_closes
+
+# name -> (first, last) session relative to t0, inclusive.
+# The window return runs from the close *before* `first` to the close at `last`,
+# so (0, 0) is the same-day return and (-5, -1) is the pre-release drift.
+DEFAULT_HORIZONS = {
+    "m5_m1": (-5, -1),
+    "d0": (0, 0),
+    "d0_p1": (0, 1),
+    "d0_p5": (0, 5),
+    "d0_p20": (0, 20),
+}
+
+def window_returns(t0_ord: np.ndarray, closes: np.ndarray, horizons: dict = DEFAULT_HORIZONS) -> np.ndarray:
+    """
+    Event x horizon matrix of window returns in one gather over `closes`.
+    t0_ord holds each event's session ordinal (-1 = unpriced); windows that
+    run off either end of the price history are NaN.
+    A 2-D closes array (sessions x tickers) gives an event x horizon x ticker array.
+    """
+    t0_ord = np.asarray(t0_ord, dtype="int64")[:, None]
+    bounds = np.array(list(horizons.values()), dtype="int64").reshape(-1, 2)
+    n = len(closes)
+
+    base = t0_ord + bounds[:, 0] - 1   # close before the window opens
+    end = t0_ord + bounds[:, 1]        # close at the end of the window
+    valid = (t0_ord >= 0) & (base >= 0) & (end < n)
+
+    out = closes[np.clip(end, 0, n - 1)] / closes[np.clip(base, 0, n - 1)] - 1
+    if closes.ndim == 2:
+        valid = valid[..., None]
+    return np.where(valid, out, np.nan)
+
+def cumulative_returns(t0_ord: np.ndarray, closes: np.ndarray, before: int = 5, after: int = 20) -> np.ndarray:
+    """
+    Event x (before + after + 1) matrix: column j is the cumulative return from the
+    close before t0-before to the close at t0-before+j, i.e. the path over [-before, +after].
+    """
+    offsets = np.arange(-before, after + 1)
+    horizons = {int(k): (-before, int(k)) for k in offsets}
+    return window_returns(t0_ord, closes, horizons)
+
+def event_window_matrix(events: pd.DataFrame,
+                        ivv_df: pd.DataFrame | SessionPrices,
+                        horizons: dict = DEFAULT_HORIZONS,
+                        release_col: str = "release_date") -> np.ndarray:
+    """
+    Window returns for every event row, in row order. Uses the t0 column when
+    present (attach_returns_df output), otherwise maps release_col to sessions.
+    """
+    calendar, closes = session_closes(ivv_df)
+    if "t0" in events.columns:
+        dates = pd.to_datetime(events["t0"], errors="coerce", utc=True)
+    else:
+        dates = to_ny_date(events[release_col])
+    return window_returns(calendar.next_session_ordinal(dates), closes, horizons)
+
+def attach_window_returns(events: pd.DataFrame,
+                          ivv_df: pd.DataFrame | SessionPrices,
+                          horizons: dict = DEFAULT_HORIZONS,
+                          prefix: str = "ivv",
+                          release_col: str = "release_date") -> pd.DataFrame:
+    """
+    Join the window-return matrix onto an events frame (e.g. a *_with_returns.csv)
+    as columns named '<prefix>_ret_<horizon>'.
+    """
+    matrix = event_window_matrix(events, ivv_df, horizons, release_col=release_col)
+    out = events.copy()
+    for j, name in enumerate(horizons):
+        out[f"{prefix}_ret_{name}"] = matrix[:, j]
+    return out
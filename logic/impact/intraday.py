@@ -0,0 +1,151 @@
+# logic/impact/intraday.py
+"""
+Reaction returns around the actual release timestamp, from minute bars
+(data_fetchers/minute_bar_store.py).
+
+A window is (start, end). Each end is either
+  - an int: minutes relative to the release (-5 = five minutes before), priced at
+    the close of the last bar finished by then (bar m covers [m, m+1)), or
+  - "open" / "close": the release day's regular session (09:30-16:00 New York),
+    priced at the first bar's open / the last bar's close.
+The window return is price(end) / price(start) - 1. It is NaN when an end has no
+price: no bar closed within max_stale minutes, no session bars that day, or the
+release time is unknown. With regular-hours bars only, an 08:30 release has NaN
+minute windows but still gets its [open, close] return.
+
+Each distinct window end is priced for every event with one np.searchsorted over
+the minute column plus a gather, so the cost grows with events x ends x log(bars)
+and does not depend on how many years of bars are mapped.
+"""
+
+import numpy as np
+import pandas as pd
+import config
+from data_fetchers.minute_bar_store import MinuteBars
+from utils.summary_store import release_day
+from .trading_calendar import NY_TZ
+
+# name -> (start, end); ints are minutes from the release, "open"/"close" the release day's session
+INTRADAY_WINDOWS = {
+    "m5m_p5m": (-5, 5),
+    "m5m_p30m": (-5, 30),
+    "open_close": ("open", "close"),
+}
+
+SESSION_OPEN = pd.Timedelta(hours=9, minutes=30)
+SESSION_CLOSE = pd.Timedelta(hours=16)
+
+# Oldest bar (minutes between its close and the anchor) that still prices an anchor
+MAX_STALE = 15
+
+_NS_PER_MIN = 60_000_000_000
+
+def _utc_offset(text: str) -> pd.Timedelta:
+    """'-04:00' -> Timedelta(-4h)."""
+    sign = -1 if text.startswith("-") else 1
+    hours, minutes = text.lstrip("+-").split(":")
+    return sign * pd.Timedelta(hours=int(hours), minutes=int(minutes))
+
+def release_timestamps(dates, times, utc_offset: str | None = None) -> pd.Series:
+    """
+    Page date + time ('Aug 01, 2025  (Jul)', '08:30') -> tz-aware New York timestamps.
+    Times are read on the page clock (config.INVESTING_UTC_OFFSET unless given).
+    NaT where either part is missing.
+    """
+    dates = pd.Series(dates).reset_index(drop=True)
+    days = pd.to_datetime(dates.astype(str).str.replace(r"\s*\(.*\)", "", regex=True), errors="coerce")
+    clock = pd.Series(times).reset_index(drop=True).fillna("").astype(str).str.strip()
+    clock = pd.to_timedelta(clock.where(clock.str.fullmatch(r"\d{1,2}:\d{2}")) + ":00", errors="coerce")
+    wall = days + clock
+    return (wall - _utc_offset(utc_offset or config.INVESTING_UTC_OFFSET)).dt.tz_localize("UTC").dt.tz_convert(NY_TZ)
+
+def attach_release_ts(events: pd.DataFrame,
+                      raw: pd.DataFrame,
+                      release_col: str = "release_date") -> pd.DataFrame:
+    """
+    Add a release_ts column to an events frame (summaries, *_with_returns, tidy rows),
+    matched on (event_type, release day) against fetcher rows with their release_time
+    (EventDatabase.raw_rows()).
+    """
+    times = pd.DataFrame({
+        "event_type": raw["event_type"].astype(str).to_numpy(),
+        "_day": raw["date"].map(release_day).to_numpy(),
+        "release_ts": release_timestamps(raw["date"], raw["release_time"]).to_numpy(),
+    }).dropna(subset=["_day"]).drop_duplicates(["event_type", "_day"], keep="first")
+
+    out = events.copy()
+    key = pd.DataFrame({"event_type": out["event_type"].astype(str).to_numpy(),
+                        "_day": out[release_col].map(release_day).to_numpy()})
+    out["release_ts"] = key.merge(times, on=["event_type", "_day"], how="left")["release_ts"].to_numpy()
+    return out
+
+def _session_minutes(release: pd.DatetimeIndex, at: pd.Timedelta) -> np.ndarray:
+    """Minute (since the epoch, UTC) of a New York wall-clock time on each release's day."""
+    day = release.tz_convert(NY_TZ).normalize().tz_localize(None)
+    return (day + at).tz_localize(NY_TZ).as_unit("ns").asi8 // _NS_PER_MIN
+
+def _price(bars: MinuteBars, end, release_min, open_min, close_min, max_stale: int) -> np.ndarray:
+    """Price of one window end for every event (NaN where there is none)."""
+    minute = bars.minute
+    n = len(minute)
+    if end == "open":
+        # first bar at or after the open, still before the close
+        i = np.searchsorted(minute, open_min.astype(minute.dtype), side="left")
+        j = np.clip(i, 0, n - 1)
+        ok = (i < n) & (minute[j] < close_min)
+        price = bars.open[j]
+    elif end == "close":
+        # last bar starting before the close, not before the open
+        i = np.searchsorted(minute, close_min.astype(minute.dtype), side="left") - 1
+        j = np.clip(i, 0, n - 1)
+        ok = (i >= 0) & (minute[j] >= open_min)
+        price = bars.close[j]
+    else:
+        # last bar finished by the anchor (bar m closes at m + 1), at most max_stale minutes old
+        t = release_min + int(end)
+        i = np.searchsorted(minute, t.astype(minute.dtype), side="left") - 1
+        j = np.clip(i, 0, n - 1)
+        ok = (i >= 0) & (t - (minute[j].astype("int64") + 1) <= max_stale)
+        price = bars.close[j]
+    return np.where(ok, price.astype("float64"), np.nan)
+
+def intraday_returns(release_ts,
+                     bars: MinuteBars,
+                     windows: dict = INTRADAY_WINDOWS,
+                     max_stale: int = MAX_STALE) -> np.ndarray:
+    """Event x window matrix of reaction returns (NaN for events without a release time)."""
+    release = pd.DatetimeIndex(pd.to_datetime(pd.Series(release_ts).to_numpy(), utc=True)).as_unit("ns")
+    known = ~release.isna()
+    out = np.full((len(release), len(windows)), np.nan)
+    if not len(bars) or not known.any():
+        return out
+
+    release = release[known]
+    release_min = release.asi8 // _NS_PER_MIN
+    open_min = _session_minutes(release, SESSION_OPEN)
+    close_min = _session_minutes(release, SESSION_CLOSE)
+
+    prices = {}
+    for bounds in windows.values():
+        for end in bounds:
+            if end not in prices:
+                prices[end] = _price(bars, end, release_min, open_min, close_min, max_stale)
+    for k, (start, end) in enumerate(windows.values()):
+        out[known, k] = prices[end] / prices[start] - 1
+    return out
+
+def attach_intraday_returns(events: pd.DataFrame,
+                            bars: MinuteBars,
+                            windows: dict = INTRADAY_WINDOWS,
+                            prefix: str = "ivv",
+                            ts_col: str = "release_ts",
+                            max_stale: int = MAX_STALE) -> pd.DataFrame:
+    """
+    Join the reaction-return matrix onto an events frame with a release timestamp
+    column (see attach_release_ts) as columns named '<prefix>_ret_<window>'.
+    """
+    matrix = intraday_returns(events[ts_col], bars, windows, max_stale=max_stale)
+    out = events.copy()
+    for k, name in enumerate(windows):
+        out[f"{prefix}_ret_{name}"] = matrix[:, k]
+    return out
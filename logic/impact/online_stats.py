@@ -0,0 +1,278 @@
+# logic/impact/online_stats.py
+"""
+Running statistics for the event_analysis buckets, updated one event at a time.
+
+Each (table, bucket, column) keeps a RunningStats: row count, Welford mean and
+variance, sign counts and a QuantileSketch for the median. Adding or removing
+an event touches only the buckets it belongs to, in O(1). Revising an event is
+a remove plus an add. EventDatabase persists the state next to event_returns
+and applies the changes on every write_event_returns (see event_db.py).
+
+The tables served from here use the raw returns. event_analysis.py winsorizes
+the 1% tails over the full history, and that cannot be maintained
+incrementally. Counts, means and percent-positive are exact here. Medians come
+from the sketch, with each order statistic within alpha (0.5%) relative error.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from utils.lazy import lazy_import
+from utils.value_parser import parse_value
+
+pd = lazy_import("pandas")   # only tables() builds frames
+
+RETURN_COLUMNS = ("same_day_return", "next_day_return")
+
+def revision_bucket(x: float) -> str:
+    """Jobs revision bucket used by event_analysis."""
+    if x <= -50: return "down_big(≤-50K)"
+    if x >=  50: return "up_big(≥+50K)"
+    return "small(>-50K & <+50K)"
+
+class QuantileSketch:
+    """
+    Relative-accuracy quantile sketch (DDSketch-style log buckets) that supports deletion:
+    every value x maps to the bucket ceil(log_gamma |x|), so add/remove is a counter update
+    and any quantile is within `alpha` relative error of a value in the data.
+    """
+
+    def __init__(self, alpha: float = 0.005, min_value: float = 1e-12):
+        self.alpha = alpha
+        self.min_value = min_value
+        self.log_gamma = math.log((1 + alpha) / (1 - alpha))
+        self.pos: dict[int, int] = {}
+        self.neg: dict[int, int] = {}
+        self.zero = 0
+
+    def _key(self, x: float) -> int:
+        return math.ceil(math.log(abs(x)) / self.log_gamma)
+
+    def _value(self, key: int) -> float:
+        gamma = math.exp(self.log_gamma)
+        return 2 * gamma ** key / (gamma + 1)
+
+    def _update(self, x: float, step: int) -> None:
+        if abs(x) < self.min_value:
+            self.zero += step
+            return
+        store = self.pos if x > 0 else self.neg
+        key = self._key(x)
+        n = store.get(key, 0) + step
+        if n:
+            store[key] = n
+        else:
+            store.pop(key, None)
+
+    def add(self, x: float) -> None:
+        self._update(x, 1)
+
+    def remove(self, x: float) -> None:
+        self._update(x, -1)
+
+    @property
+    def count(self) -> int:
+        return self.zero + sum(self.pos.values()) + sum(self.neg.values())
+
+    def _at_rank(self, rank: int) -> float:
+        seen = 0
+        for key in sorted(self.neg, reverse=True):   # most negative first
+            seen += self.neg[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self.zero
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.pos):
+            seen += self.pos[key]
+            if seen > rank:
+                return self._value(key)
+        return math.nan
+
+    def quantile(self, q: float) -> float:
+        """Quantile with linear-interpolation ranks like pandas (the median averages the middle pair)."""
+        n = self.count
+        if n == 0:
+            return math.nan
+        pos = q * (n - 1)
+        lo, hi = math.floor(pos), math.ceil(pos)
+        a, b = self._at_rank(lo), self._at_rank(hi)
+        return a + (b - a) * (pos - lo)
+
+    def to_dict(self) -> dict:
+        return {"alpha": self.alpha, "min_value": self.min_value, "zero": self.zero,
+                "pos": {str(k): v for k, v in self.pos.items()}, "neg": {str(k): v for k, v in self.neg.items()}}
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "QuantileSketch":
+        sk = cls(d["alpha"], d["min_value"])
+        sk.zero = d["zero"]
+        sk.pos = {int(k): v for k, v in d["pos"].items()}
+        sk.neg = {int(k): v for k, v in d["neg"].items()}
+        return sk
+
+@dataclass
+class RunningStats:
+    """Sufficient statistics of one bucket column. rows counts events, count the non-missing values."""
+    rows: int = 0
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    n_pos: int = 0
+    n_neg: int = 0
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+
+    def add(self, x: float | None) -> None:
+        self.rows += 1
+        if x is None:
+            return
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        self.n_pos += x > 0
+        self.n_neg += x < 0
+        self.sketch.add(x)
+
+    def remove(self, x: float | None) -> None:
+        """Inverse of add(x) for a value added earlier (Welford run backwards)."""
+        self.rows -= 1
+        if x is None:
+            return
+        self.count -= 1
+        if self.count == 0:
+            self.mean = self.m2 = 0.0
+        else:
+            delta = x - self.mean
+            self.mean -= delta / self.count
+            self.m2 = max(0.0, self.m2 - delta * (x - self.mean))
+        self.n_pos -= x > 0
+        self.n_neg -= x < 0
+        self.sketch.remove(x)
+
+    @property
+    def var(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def value_mean(self) -> float:
+        return self.mean if self.count else math.nan
+
+    @property
+    def median(self) -> float:
+        return self.sketch.quantile(0.5)
+
+    @property
+    def pct_pos(self) -> float:
+        return 100.0 * self.n_pos / self.count if self.count else math.nan
+
+    def to_dict(self) -> dict:
+        return {"rows": self.rows, "count": self.count, "mean": self.mean, "m2": self.m2,
+                "n_pos": self.n_pos, "n_neg": self.n_neg, "sketch": self.sketch.to_dict()}
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "RunningStats":
+        return cls(d["rows"], d["count"], d["mean"], d["m2"], d["n_pos"], d["n_neg"],
+                   QuantileSketch.from_dict(d["sketch"]))
+
+def _num(v) -> float | None:
+    if isinstance(v, str) or v is None:
+        return parse_value(v)
+    v = float(v)
+    return None if math.isnan(v) else v
+
+def stat_inputs(row: dict) -> tuple:
+    """
+    (event_type, surprise, revision, same-day, next-day) of an event_returns / tidy row,
+    None where missing (so equal rows give equal, hashable tuples).
+    """
+    def first(*names):
+        for n in names:
+            if _num(row.get(n)) is not None:
+                return row[n]
+        return None
+    return (str(row["event_type"]),
+            _num(first("surprise_num", "surprise")),
+            _num(first("revision_change_num", "revision_change")),
+            _num(first("same_day_return", "ivv_same_day_return")),
+            _num(first("next_day_return", "ivv_next_day_return")))
+
+def contributions(inputs: tuple) -> list[tuple[tuple[str, str, str], float | None]]:
+    """((table, bucket, column), value) pairs one event adds, using event_analysis's bucket rules."""
+    event_type, surprise, revision, same, nxt = inputs
+    values = dict(zip(RETURN_COLUMNS, (same, nxt)))
+    buckets = [("overall_summary", event_type)]
+    both = same is not None and nxt is not None
+    if both and surprise is not None and surprise != 0:
+        buckets.append(("surprise_buckets", f"{event_type}:{'pos' if surprise > 0 else 'neg'}"))
+    if both and event_type == "jobs" and revision is not None:
+        buckets.append(("jobs_revision_buckets", revision_bucket(revision)))
+    return [((table, bucket, col), values[col]) for table, bucket in buckets for col in RETURN_COLUMNS]
+
+class OnlineEventStats:
+    def __init__(self, stats: dict | None = None):
+        self.stats: dict[tuple[str, str, str], RunningStats] = stats or {}
+        self.touched: set = set()
+
+    def _apply(self, inputs: tuple, step: int) -> None:
+        for key, value in contributions(inputs):
+            st = self.stats.setdefault(key, RunningStats())
+            if step > 0:
+                st.add(value)
+            else:
+                st.remove(value)
+            self.touched.add(key)
+
+    def insert(self, inputs: tuple) -> None:
+        self._apply(inputs, 1)
+
+    def remove(self, inputs: tuple) -> None:
+        self._apply(inputs, -1)
+
+    def revise(self, old: tuple, new: tuple) -> None:
+        if old != new:
+            self.remove(old)
+            self.insert(new)
+
+    def _get(self, table: str, bucket: str, col: str) -> RunningStats:
+        return self.stats.get((table, bucket, col)) or RunningStats()
+
+    def _buckets(self, table: str) -> list[str]:
+        return sorted({b for t, b, _ in self.stats if t == table and self.stats[(t, b, RETURN_COLUMNS[0])].rows})
+
+    def tables(self) -> dict[str, pd.DataFrame]:
+        """overall_summary / surprise_buckets / jobs_revision_buckets shaped like the event_analysis tables."""
+        def describe(table: str, bucket: str) -> dict:
+            same, nxt = (self._get(table, bucket, c) for c in RETURN_COLUMNS)
+            return {"N": same.rows, "mean_same": same.value_mean, "mean_next": nxt.value_mean,
+                    "median_same": same.median, "median_next": nxt.median,
+                    "pct_pos_same": same.pct_pos, "pct_pos_next": nxt.pct_pos}
+
+        overall = pd.DataFrame([{"event_type": b, **describe("overall_summary", b)}
+                                for b in self._buckets("overall_summary")])
+        revisions = pd.DataFrame([{"rev_bucket": b, **describe("jobs_revision_buckets", b)}
+                                  for b in self._buckets("jobs_revision_buckets")])
+
+        signs = []
+        for event_type in sorted({b.split(":")[0] for b in self._buckets("surprise_buckets")}):
+            pos = [self._get("surprise_buckets", f"{event_type}:pos", c) for c in RETURN_COLUMNS]
+            neg = [self._get("surprise_buckets", f"{event_type}:neg", c) for c in RETURN_COLUMNS]
+            signs.append({
+                "event_type": event_type,
+                "N_pos": pos[0].rows, "mean_same_pos": pos[0].value_mean, "mean_next_pos": pos[1].value_mean,
+                "N_neg": neg[0].rows, "mean_same_neg": neg[0].value_mean, "mean_next_neg": neg[1].value_mean,
+                "diff_same_pos_minus_neg": pos[0].value_mean - neg[0].value_mean,
+                "diff_next_pos_minus_neg": pos[1].value_mean - neg[1].value_mean,
+            })
+        return {"overall_summary": overall, "surprise_buckets": pd.DataFrame(signs),
+                "jobs_revision_buckets": revisions}
+
+    @classmethod
+    def from_rows(cls, rows) -> "OnlineEventStats":
+        """Build from scratch over event rows (dicts), e.g. to seed or check the persisted state."""
+        out = cls()
+        for row in rows:
+            out.insert(stat_inputs(row))
+        out.touched = set(out.stats)
+        return out
@@ -0,0 +1,97 @@
+# logic/impact/price_panel.py
+import numpy as np
+import pandas as pd
+from .trading_calendar import to_ny_date, TradingCalendar
+from data_fetchers.session_store import SessionPrices, SessionStore
+from .returns import load_prices
+from .event_windows import window_returns
+
+# Same windows attach_returns_df reports for IVV: prior close -> t0, t0 -> t1
+DAILY_HORIZONS = {
+    "same_day": (0, 0),
+    "next_day": (1, 1),
+}
+
+class PricePanel:
+    """
+    Closes for N tickers aligned on one session index, held as a
+    (sessions x tickers) float64 array. Sessions where a ticker has no
+    price are NaN, so its returns over those windows come out NaN.
+    """
+
+    def __init__(self, calendar: TradingCalendar, tickers: list[str], closes: np.ndarray):
+        if closes.shape != (len(calendar), len(tickers)):
+            raise ValueError(f"closes shape {closes.shape} does not match {len(calendar)} sessions x {len(tickers)} tickers")
+        self.calendar = calendar
+        self.tickers = list(tickers)
+        self.closes = closes
+
+    @classmethod
+    def from_frames(cls, frames: dict[str, pd.DataFrame]) -> "PricePanel":
+        """Build from {ticker: Date/Close frame} (load_prices output); sessions are the union of all dates."""
+        tickers = list(frames)
+        calendar = TradingCalendar.from_index(pd.concat([f["Date"] for f in frames.values()], ignore_index=True))
+        closes = np.full((len(calendar), len(tickers)), np.nan)
+        for j, t in enumerate(tickers):
+            f = frames[t].drop_duplicates("Date", keep="last")
+            closes[calendar.next_session_ordinal(f["Date"]), j] = f["Close"].to_numpy(dtype="float64")
+        return cls(calendar, tickers, closes)
+
+    @classmethod
+    def from_csvs(cls, paths: dict[str, str]) -> "PricePanel":
+        """Build from {ticker: cached price CSV path}."""
+        return cls.from_frames({t: load_prices(p) for t, p in paths.items()})
+
+    @classmethod
+    def from_sessions(cls, prices: dict[str, SessionPrices]) -> "PricePanel":
+        """Build from mapped session store prices; sessions are the union of all session days."""
+        tickers = list(prices)
+        days = np.unique(np.concatenate([np.asarray(p.session) for p in prices.values()]))
+        calendar = TradingCalendar.from_days(days)
+        closes = np.full((len(days), len(tickers)), np.nan)
+        for j, t in enumerate(tickers):
+            closes[np.searchsorted(days, prices[t].session), j] = prices[t].close
+        return cls(calendar, tickers, closes)
+
+    @classmethod
+    def from_store(cls, tickers: list[str], store: SessionStore | None = None) -> "PricePanel":
+        """Build from tickers in the session store (see from_sessions)."""
+        store = store or SessionStore()
+        return cls.from_sessions({t: store.read(t) for t in tickers})
+
+    def close(self, ticker: str) -> np.ndarray:
+        return self.closes[:, self.tickers.index(ticker)]
+
+    def event_returns(self,
+                      events: pd.DataFrame,
+                      horizons: dict = DAILY_HORIZONS,
+                      release_col: str = "release_date",
+                      form: str = "wide") -> pd.DataFrame:
+        """
+        Returns of every ticker over every horizon for every event, in one gather.
+
+        wide: events plus one '<ticker>_<horizon>_return' column per pair
+              (so the default horizons give ivv_same_day_return, tlt_next_day_return, ...)
+        long: one row per (event, ticker) with the event columns, 'ticker' and
+              one '<horizon>_return' column per horizon
+        """
+        if form not in ("wide", "long"):
+            raise ValueError(f"form must be 'wide' or 'long', not {form!r}")
+
+        dates = to_ny_date(events[release_col])
+        t0_ord = self.calendar.next_session_ordinal(dates)
+        cube = window_returns(t0_ord, self.closes, horizons)  # events x horizons x tickers
+
+        if form == "wide":
+            out = events.copy()
+            for j, t in enumerate(self.tickers):
+                for h, name in enumerate(horizons):
+                    out[f"{t.lower()}_{name}_return"] = cube[:, h, j]
+            return out
+
+        n_events, n_tickers = len(events), len(self.tickers)
+        out = events.iloc[np.repeat(np.arange(n_events), n_tickers)].reset_index(drop=True)
+        out["ticker"] = np.tile(self.tickers, n_events)
+        for h, name in enumerate(horizons):
+            out[f"{name}_return"] = cube[:, h, :].reshape(-1)
+        return out
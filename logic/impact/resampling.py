@@ -0,0 +1,157 @@
+# logic/impact/resampling.py
+"""
+Bootstrap confidence intervals and permutation p-values for bucket statistics.
+
+A task is one bucket (or a pair of buckets for a difference) plus the statistics
+to test. Each task draws its resamples as a single (resamples x n) index matrix
+(in memory-bounded blocks) and reduces it with vectorized NumPy, so 10,000
+resamples of a bucket cost a few array passes rather than 10,000 Python calls.
+
+  - one-sample tasks: bootstrap CI of each statistic, and a sign-flip permutation
+    p-value against "no effect" (returns symmetric around zero)
+  - two-sample tasks: bootstrap CI of stat(a) - stat(b) (each side resampled
+    independently), and a label-permutation p-value for the difference
+
+Every task gets its own child of SeedSequence(seed), in task order, so results
+depend only on the seed and the task list, not on how many processes the tasks
+are sharded across.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+
+STATISTICS = ("mean", "median", "pct_pos")
+
+# Largest resample block (resamples x n elements) materialized at once
+BLOCK_ELEMENTS = 4_000_000
+
+@dataclass
+class ResampleTask:
+    labels: dict                      # identifies the row in the output (table, bucket, column, ...)
+    a: np.ndarray
+    b: np.ndarray | None = None       # set for a two-sample difference stat(a) - stat(b)
+    stats: tuple = ("mean",)
+
+def statistic(name: str, samples: np.ndarray) -> np.ndarray:
+    """Row-wise statistic of a (resamples x n) matrix."""
+    if name == "mean":
+        return samples.mean(axis=1)
+    if name == "median":
+        return np.median(samples, axis=1)
+    if name == "pct_pos":
+        return (samples > 0).mean(axis=1) * 100
+    raise ValueError(f"Unknown statistic {name!r} (expected one of {STATISTICS})")
+
+def _null_center(name: str, x: np.ndarray) -> float:
+    """Expected value of the statistic under random sign flips."""
+    return 50.0 * float((x != 0).mean()) if name == "pct_pos" else 0.0
+
+def _blocks(n_resamples: int, n: int):
+    step = max(1, BLOCK_ELEMENTS // max(n, 1))
+    for start in range(0, n_resamples, step):
+        yield min(step, n_resamples - start)
+
+def _two_sided_p(null: np.ndarray, observed: float, center: float) -> float:
+    """(1 + #null at least as extreme) / (1 + resamples); ties count as extreme."""
+    extreme = np.abs(null - center) >= abs(observed - center) - 1e-12
+    return float((1 + extreme.sum()) / (1 + len(null)))
+
+def _one_sample(task: ResampleTask, n_resamples: int, rng: np.random.Generator) -> dict:
+    x = task.a
+    n = len(x)
+    boot = {s: [] for s in task.stats}
+    null = {s: [] for s in task.stats}
+    for size in _blocks(n_resamples, n):
+        samples = x[rng.integers(0, n, size=(size, n))]
+        flipped = x * (rng.integers(0, 2, size=(size, n), dtype=np.int8) * 2 - 1)
+        for s in task.stats:
+            boot[s].append(statistic(s, samples))
+            null[s].append(statistic(s, flipped))
+    out = {}
+    for s in task.stats:
+        observed = float(statistic(s, x[None, :])[0])
+        out[s] = (observed, np.concatenate(boot[s]), _two_sided_p(np.concatenate(null[s]), observed, _null_center(s, x)))
+    return out
+
+def _two_sample(task: ResampleTask, n_resamples: int, rng: np.random.Generator) -> dict:
+    a, b = task.a, task.b
+    na, nb = len(a), len(b)
+    pooled = np.concatenate([a, b])
+    boot = {s: [] for s in task.stats}
+    null = {s: [] for s in task.stats}
+    for size in _blocks(n_resamples, na + nb):
+        sa = a[rng.integers(0, na, size=(size, na))]
+        sb = b[rng.integers(0, nb, size=(size, nb))]
+        shuffled = pooled[rng.permuted(np.tile(np.arange(na + nb), (size, 1)), axis=1)]
+        for s in task.stats:
+            boot[s].append(statistic(s, sa) - statistic(s, sb))
+            null[s].append(statistic(s, shuffled[:, :na]) - statistic(s, shuffled[:, na:]))
+    out = {}
+    for s in task.stats:
+        observed = float(statistic(s, a[None, :])[0] - statistic(s, b[None, :])[0])
+        out[s] = (observed, np.concatenate(boot[s]), _two_sided_p(np.concatenate(null[s]), observed, 0.0))
+    return out
+
+def run_task(task: ResampleTask, n_resamples: int, seed_seq: np.random.SeedSequence, ci: float) -> list[dict]:
+    """
+    Output rows for one task: labels, stat, n (n_b for the second sample), value, ci_lo, ci_hi, p_value.
+    NaNs are dropped first; a sample with fewer than 2 values has no spread to resample, so its
+    CI and p-value are NaN.
+    """
+    a = np.asarray(task.a, dtype="float64")
+    a = a[~np.isnan(a)]
+    b = None if task.b is None else np.asarray(task.b, dtype="float64")
+    b = None if b is None else b[~np.isnan(b)]
+    sizes = {"n": len(a), "n_b": None if b is None else len(b)}
+
+    if len(a) < 2 or (b is not None and len(b) < 2):
+        rows = []
+        for s in task.stats:
+            value = np.nan
+            if len(a) and (b is None or len(b)):
+                value = float(statistic(s, a[None, :])[0] - (0 if b is None else statistic(s, b[None, :])[0]))
+            rows.append({**task.labels, "stat": s, **sizes, "value": value,
+                         "ci_lo": np.nan, "ci_hi": np.nan, "p_value": np.nan})
+        return rows
+
+    rng = np.random.default_rng(seed_seq)
+    task = ResampleTask(task.labels, a, b, task.stats)
+    results = (_one_sample if b is None else _two_sample)(task, n_resamples, rng)
+    tail = (1 - ci) / 2
+    rows = []
+    for s, (observed, boot, p) in results.items():
+        lo, hi = np.quantile(boot, [tail, 1 - tail])
+        rows.append({**task.labels, "stat": s, **sizes, "value": observed,
+                     "ci_lo": float(lo), "ci_hi": float(hi), "p_value": p})
+    return rows
+
+def _run_shard(args) -> list[list[dict]]:
+    tasks, n_resamples, seeds, ci = args
+    return [run_task(t, n_resamples, s, ci) for t, s in zip(tasks, seeds)]
+
+def resample(tasks: list[ResampleTask],
+             n_resamples: int = 10_000,
+             seed: int = 0,
+             ci: float = 0.95,
+             workers: int = 1) -> pd.DataFrame:
+    """
+    Run every task; one output row per (task, statistic), in task order.
+    workers > 1 shards the tasks across a process pool; results are identical either way.
+    """
+    seeds = np.random.SeedSequence(seed).spawn(len(tasks))
+    if workers <= 1 or len(tasks) < 2:
+        per_task = _run_shard((tasks, n_resamples, seeds, ci))
+    else:
+        k = min(workers, len(tasks))
+        shards = [(tasks[i::k], n_resamples, seeds[i::k], ci) for i in range(k)]
+        with ProcessPoolExecutor(max_workers=k) as pool:
+            done = list(pool.map(_run_shard, shards))
+        per_task = [None] * len(tasks)
+        for i, rows in enumerate(done):
+            per_task[i::k] = rows
+    out = pd.DataFrame([row for rows in per_task for row in rows])
+    if "n_b" in out.columns:
+        out["n_b"] = out["n_b"].astype("Int64")
+    return out
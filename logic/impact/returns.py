@@ -1,71 +1,78 @@
 # logic/impact/returns.py
+import numpy as np
 import pandas as pd
-from .trading_calendar import to_ny_date, next_trading_day
+from data_fetchers.price_cache import read_price_cache
+from data_fetchers.session_store import SessionPrices
+from utils.metrics import timed
+from .trading_calendar import to_ny_date, TradingCalendar
 
-def load_ivv_prices(ivv_csv_path: str) -> pd.DataFrame:
-    df = pd.read_csv(ivv_csv_path)
-    df["Date"] = pd.to_datetime(df["Date"], errors="coerce", utc=True)
-    df = df.dropna(subset=["Date"])
-    df["Date"] = df["Date"].dt.tz_convert("America/New_York").dt.normalize()
-    if "Close" not in df.columns:
-        raise ValueError("IVV CSV missing 'Close' column after parsing.")
-    df["Close"] = pd.to_numeric(df["Close"], errors="coerce")
-    df = df[["Date", "Close"]].dropna().sort_values("Date").reset_index(drop=True)
+def load_prices(csv_path: str) -> pd.DataFrame:
+    """
+    Load a cached daily price CSV (any ticker) as Date (NY midnight) + Close, sorted by Date.
+    Accepts clean and legacy cache files (see data_fetchers.price_cache.read_price_cache).
+    """
+    prices = read_price_cache(csv_path)
+    df = pd.DataFrame({
+        "Date": prices.index.tz_localize("America/New_York"),
+        "Close": prices["Close"].to_numpy(),
+    })
+    df = df.dropna().sort_values("Date").reset_index(drop=True)
     return df
 
-def attach_returns_df(events: pd.DataFrame, ivv_df: pd.DataFrame, release_col: str = "release_date") -> pd.DataFrame:
-    ivv = ivv_df.copy().set_index("Date")
-    events = events.copy()
+def load_ivv_prices(ivv_csv_path: str) -> pd.DataFrame:
+    return load_prices(ivv_csv_path)
 
-    events[release_col] = to_ny_date(events[release_col])
-    ivv_index = ivv.index
+def session_closes(ivv_df: pd.DataFrame | SessionPrices) -> tuple[TradingCalendar, np.ndarray]:
+    """
+    Calendar over the price dates plus the Close array aligned to it,
+    so closes[ordinal] is the close of calendar.sessions[ordinal].
+    Session store prices (data_fetchers.session_store) are used as mapped:
+    the calendar is built from the session column and closes is the close map itself.
+    """
+    if isinstance(ivv_df, SessionPrices):
+        return TradingCalendar.from_days(ivv_df.session), ivv_df.close
+    ivv = ivv_df.sort_values("Date").drop_duplicates("Date", keep="last")
+    return TradingCalendar.from_index(ivv["Date"]), ivv["Close"].to_numpy(dtype="float64")
 
-    t0_list, t1_list, same_list, next_list = [], [], [], []
-    for d in events[release_col]:
-        t0 = next_trading_day(d, ivv_index)
-        t0_list.append(t0)
+def attach_returns_df(events: pd.DataFrame, ivv_df: pd.DataFrame | SessionPrices, release_col: str = "release_date") -> pd.DataFrame:
+    """
+    Add ivv_same_day_return (prior close -> t0 close), ivv_next_day_return (t0 -> t1 close),
+    t0 and t1 for every event, where t0 is the first trading session on/after the release date.
 
-        if t0 is None:
-            # Future event beyond available prices
-            t1_list.append(None)
-            same_list.append(None)
-            next_list.append(None)
-            continue
+    All events are mapped to sessions in one TradingCalendar lookup and closes are
+    gathered by session ordinal, so there is no per-row Python.
+    Events after the last available session (future releases) are dropped.
+    """
+    with timed("returns", rows=len(events)) as m:
+        events = events.copy()
 
-        # prior close
-        try:
-            prev_idx = ivv_index.get_loc(t0) - 1
-            prev_close = ivv.iloc[prev_idx]["Close"]
-        except Exception:
-            prev_close = None
+        events[release_col] = to_ny_date(events[release_col])
 
-        # next trading day
-        t1 = next_trading_day(t0 + pd.Timedelta(days=1), ivv_index)
-        t1_list.append(t1)
+        calendar, closes = session_closes(ivv_df)
+        n = len(calendar)
 
-        # same-day and next-day returns
-        try:
-            close_t0 = ivv.loc[t0, "Close"]
-            same_ret = (close_t0 / prev_close) - 1 if prev_close is not None else None
-        except Exception:
-            same_ret = None
+        # t0 = first session >= release date (-1 for NaT / future releases)
+        t0_ord = calendar.next_session_ordinal(events[release_col])
+        has_t0 = t0_ord >= 0
+        has_prev = has_t0 & (t0_ord >= 1)
+        has_t1 = has_t0 & (t0_ord + 1 < n)
 
-        try:
-            close_t1 = ivv.loc[t1, "Close"] if t1 is not None else None
-            next_ret = (close_t1 / close_t0) - 1 if (close_t1 is not None and close_t0 is not None) else None
-        except Exception:
-            next_ret = None
+        # Clip so the gathers stay in bounds; masked-out slots become NaN/NaT below
+        t0_idx = np.clip(t0_ord, 0, n - 1)
+        prev_idx = np.clip(t0_ord - 1, 0, n - 1)
+        t1_idx = np.clip(t0_ord + 1, 0, n - 1)
 
-        same_list.append(same_ret)
-        next_list.append(next_ret)
+        close_t0 = closes[t0_idx]
+        same_ret = np.where(has_prev, close_t0 / closes[prev_idx] - 1, np.nan)
+        next_ret = np.where(has_t1, closes[t1_idx] / close_t0 - 1, np.nan)
 
-    events["ivv_same_day_return"] = same_list
-    events["ivv_next_day_return"] = next_list
-    events["t0"] = t0_list
-    events["t1"] = t1_list
+        events["ivv_same_day_return"] = same_ret
+        events["ivv_next_day_return"] = next_ret
+        events["t0"] = calendar.sessions[t0_idx].where(has_t0)
+        events["t1"] = calendar.sessions[t1_idx].where(has_t1)
 
-    # Optional: drop rows we couldn’t price (future events)
-    events = events[events["t0"].notna()].reset_index(drop=True)
+        # Optional: drop rows we couldn’t price (future events)
+        events = events[events["t0"].notna()].reset_index(drop=True)
+        m["priced"] = len(events)
 
     return events
-
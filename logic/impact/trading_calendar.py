@@ -1,30 +1,146 @@
 # logic/impact/trading_calendar.py
+import numpy as np
 import pandas as pd
 
+NY_TZ = "America/New_York"
+
 def to_ny_date(series: pd.Series) -> pd.Series:
     cleaned = series.astype(str).str.replace(r"\s*\(.*\)", "", regex=True)
-    return pd.to_datetime(cleaned, errors="coerce").dt.tz_localize("America/New_York").dt.normalize()
+    return pd.to_datetime(cleaned, errors="coerce").dt.tz_localize(NY_TZ).dt.normalize()
+
+def _ny_wall(dates) -> pd.DatetimeIndex:
+    """Any date-likes -> naive NY wall-clock DatetimeIndex (tz-aware input is converted first)."""
+    idx = pd.DatetimeIndex(pd.to_datetime(dates))
+    if idx.tz is not None:
+        idx = idx.tz_convert(NY_TZ).tz_localize(None)
+    return idx
 
-def next_trading_day(d: pd.Timestamp, ivv_index: pd.DatetimeIndex) -> pd.Timestamp | None:
+def _day_numbers(idx: pd.DatetimeIndex) -> np.ndarray:
+    """Days since 1970-01-01 of each (naive) timestamp; NaT stays as the int64 NaT sentinel."""
+    return idx.values.astype("datetime64[D]").astype("int64")
+
+class TradingCalendar:
     """
-    Map a datetime to the next trading day present in ivv_index.
-    Returns None if d is after the last available trading day.
+    Trading sessions (NY midnight timestamps) plus a dense lookup table over every
+    calendar day from the first to the last session, so date -> session mapping
+    is an O(1) array lookup for scalars and whole arrays alike.
+
+    Sessions are addressed by ordinal (0 .. len-1); the *_ordinal methods return
+    int64 arrays with -1 where no session exists (NaT input, or out of range).
     """
-    if pd.isna(d):
-        return None
 
-    if d.tzinfo is None:
-        d = d.tz_localize("America/New_York").normalize()
-    else:
-        d = d.tz_convert("America/New_York").normalize()
+    def __init__(self, sessions):
+        wall = _ny_wall(sessions)
+        wall = wall[~wall.isna()].normalize().unique().sort_values()
+        if len(wall) == 0:
+            raise ValueError("TradingCalendar needs at least one session.")
 
-    # If the requested date is beyond our price history, bail out
-    last = ivv_index.max()
-    if d > last:
-        return None
+        self.sessions = wall.tz_localize(NY_TZ).rename(None)
+        self._build(_day_numbers(wall))
+
+    def _build(self, days: np.ndarray) -> None:
+        """Lookup tables over sorted, unique session day numbers."""
+        self._origin = int(days[0])
+
+        is_session = np.zeros(int(days[-1]) - self._origin + 1, dtype=bool)
+        is_session[days - self._origin] = True
+        sessions_through = np.cumsum(is_session)  # sessions on or before each day
+
+        # day offset -> ordinal of first session on/after it / last session on/before it
+        self._next = sessions_through - is_session
+        self._prev = sessions_through - 1
+
+    @classmethod
+    def from_index(cls, index) -> "TradingCalendar":
+        """Build from the dates of a price series (e.g. the IVV 'Date' column)."""
+        return cls(index)
+
+    @classmethod
+    def from_days(cls, days) -> "TradingCalendar":
+        """
+        Build from sorted, unique session day numbers (days since 1970-01-01, e.g. a
+        session store's session column), skipping date parsing.
+        """
+        days = np.asarray(days, dtype="int64")
+        if len(days) == 0:
+            raise ValueError("TradingCalendar needs at least one session.")
+        cal = cls.__new__(cls)
+        cal.sessions = pd.DatetimeIndex(days.astype("datetime64[D]")).as_unit("ns").tz_localize(NY_TZ)
+        cal._build(days)
+        return cal
+
+    @classmethod
+    def from_rules(cls, start, end, holidays=(), weekmask: str = "Mon Tue Wed Thu Fri") -> "TradingCalendar":
+        """Build from exchange rules: weekdays in weekmask, minus the given holiday dates."""
+        return cls(pd.bdate_range(start, end, freq="C", weekmask=weekmask, holidays=list(holidays)))
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    # ---- ordinal lookups (bulk) ----
 
-    while d not in ivv_index:
-        d = (d + pd.Timedelta(days=1)).normalize()
-        if d > last:
-            return None
-    return d
+    def _offsets(self, dates) -> tuple[np.ndarray, np.ndarray]:
+        wall = _ny_wall(np.atleast_1d(dates) if np.ndim(dates) == 0 else dates)
+        valid = ~np.asarray(wall.isna())
+        offsets = np.where(valid, _day_numbers(wall) - self._origin, 0)
+        return offsets, valid
+
+    def next_session_ordinal(self, dates) -> np.ndarray:
+        """Ordinal of the first session on/after each date; -1 past the last session."""
+        offsets, valid = self._offsets(dates)
+        inside = offsets < len(self._next)
+        out = np.where(offsets < 0, 0, self._next[np.clip(offsets, 0, len(self._next) - 1)])
+        return np.where(valid & inside, out, -1)
+
+    def previous_session_ordinal(self, dates) -> np.ndarray:
+        """Ordinal of the last session on/before each date; -1 before the first session."""
+        offsets, valid = self._offsets(dates)
+        out = np.where(offsets >= len(self._prev), len(self) - 1, self._prev[np.clip(offsets, 0, len(self._prev) - 1)])
+        return np.where(valid & (offsets >= 0), out, -1)
+
+    def session_offset_ordinal(self, dates, k: int) -> np.ndarray:
+        """Ordinal of the session k sessions away from next_session(date); -1 if out of range."""
+        base = self.next_session_ordinal(dates)
+        shifted = base + k
+        return np.where((base >= 0) & (shifted >= 0) & (shifted < len(self)), shifted, -1)
+
+    # ---- timestamp lookups (scalar in -> Timestamp/None out, array in -> DatetimeIndex with NaT) ----
+
+    def _to_sessions(self, ordinals: np.ndarray, scalar: bool):
+        out = self.sessions[np.clip(ordinals, 0, len(self) - 1)].where(ordinals >= 0)
+        if scalar:
+            return None if pd.isna(out[0]) else out[0]
+        return out
+
+    def next_session(self, dates):
+        return self._to_sessions(self.next_session_ordinal(dates), np.ndim(dates) == 0)
+
+    def previous_session(self, dates):
+        return self._to_sessions(self.previous_session_ordinal(dates), np.ndim(dates) == 0)
+
+    def session_offset(self, dates, k: int):
+        return self._to_sessions(self.session_offset_ordinal(dates, k), np.ndim(dates) == 0)
+
+# Last calendar built by next_trading_day, so repeated calls with the same index don't rebuild it
+_calendar_memo: tuple | None = None
+
+def calendar_for(ivv_index) -> TradingCalendar:
+    """Return ivv_index if it is already a TradingCalendar, else a (memoized) one built from it."""
+    global _calendar_memo
+    if isinstance(ivv_index, TradingCalendar):
+        return ivv_index
+    if _calendar_memo is not None and _calendar_memo[0] is ivv_index:
+        return _calendar_memo[1]
+    cal = TradingCalendar.from_index(ivv_index)
+    _calendar_memo = (ivv_index, cal)
+    return cal
+
+def next_trading_day(d: pd.Timestamp, ivv_index) -> pd.Timestamp | None:
+    """
+    Map a datetime to the next trading day present in ivv_index
+    (a DatetimeIndex of sessions or a TradingCalendar).
+    Returns None if d is after the last available trading day.
+    """
+    if pd.isna(d):
+        return None
+    return calendar_for(ivv_index).next_session(d)
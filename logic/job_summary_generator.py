@@ -1,33 +1,25 @@
 # logic/jobs_summary_generator.py
 
-from typing import List, Dict, Any
-from models.job_report import JobReportRow
-
-def generate_jobs_summary(job_reports: List[JobReportRow]) -> Dict[str, Any]:
-    # Filter only rows with actual values
-    valid_reports = [row for row in job_reports if row.actual and row.actual.lower() != ""]
-    
-    # Reverse order since Investing.com lists most recent first
-    valid_reports = list(reversed(valid_reports))
+from __future__ import annotations
 
-    if len(valid_reports) < 2:
-        return {"error": "Not enough data to calculate revisions or surprise."}
+from typing import List, Dict, Any, Optional
+from models.job_report import JobReportRow
+from utils.value_parser import parse_value, parse_values
 
-    latest = valid_reports[-1]     # Now truly the latest (bottom of the original table)
-    previous = valid_reports[-2]   # Second-to-last in reversed list
+_NOT_ENOUGH = {"error": "Not enough data to calculate revisions or surprise."}
 
-    def parse_jobs(value: str) -> int:
-        value = value.upper().replace("K", "").replace(",", "").strip()
-        try:
-            return int(float(value))
-        except ValueError:
-            return None
+def parse_jobs(value: str) -> Optional[int]:
+    """Job count in thousands, truncated to a whole number: '73K' -> 73, '1.2M' -> 1200, 'N/A' -> None."""
+    num = parse_value(value)
+    return int(num) if num is not None else None
 
-    actual = parse_jobs(latest.actual)
-    consensus = parse_jobs(latest.consensus)
-    prev_actual = parse_jobs(previous.actual)
-    revised = parse_jobs(latest.previous)
+def _parse_jobs_column(values: List[str]) -> List[Optional[int]]:
+    """parse_jobs over a whole column, parsed once by parse_values."""
+    return [int(num) if num is not None else None for num in parse_values(values)]
 
+def _jobs_summary(latest: JobReportRow, previous: JobReportRow, actual: Optional[int], consensus: Optional[int],
+                  prev_actual: Optional[int], revised: Optional[int]) -> Dict[str, Any]:
+    """Summary of one report from its parsed counts; the single and batch forms both end here."""
     surprise = actual - consensus if actual is not None and consensus is not None else None
     revision_change = revised - prev_actual if revised is not None and prev_actual is not None else None
 
@@ -69,3 +61,38 @@ def generate_jobs_summary(job_reports: List[JobReportRow]) -> Dict[str, Any]:
         "revision_commentary": revision_comment,
         "meta_commentary": meta_comment
     }
+
+
+def generate_jobs_summary(job_reports: List[JobReportRow]) -> Dict[str, Any]:
+    # Filter only rows with actual values
+    valid_reports = [row for row in job_reports if row.actual and row.actual.lower() != ""]
+    
+    # Reverse order since Investing.com lists most recent first
+    valid_reports = list(reversed(valid_reports))
+
+    if len(valid_reports) < 2:
+        return dict(_NOT_ENOUGH)
+
+    latest = valid_reports[-1]     # Now truly the latest (bottom of the original table)
+    previous = valid_reports[-2]   # Second-to-last in reversed list
+    return _jobs_summary(latest, previous, parse_jobs(latest.actual), parse_jobs(latest.consensus),
+                         parse_jobs(previous.actual), parse_jobs(latest.previous))
+
+
+def generate_jobs_summaries(job_reports: List[JobReportRow]) -> List[Dict[str, Any]]:
+    """
+    Batch generate_jobs_summary over every [i, i+1] window of newest -> oldest rows:
+    entry i equals generate_jobs_summary(job_reports[i:i+2]) (the error dict when either
+    row has no actual). Each column is parsed once.
+    """
+    if len(job_reports) < 2:
+        return []
+
+    valid = [bool(r.actual and r.actual.lower() != "") for r in job_reports]
+    actual = _parse_jobs_column([r.actual for r in job_reports])
+    consensus = _parse_jobs_column([r.consensus for r in job_reports[:-1]])
+    revised = _parse_jobs_column([r.previous for r in job_reports[:-1]])
+
+    return [_jobs_summary(latest, previous, actual[i], consensus[i], actual[i + 1], revised[i])
+            if valid[i] and valid[i + 1] else dict(_NOT_ENOUGH)
+            for i, (latest, previous) in enumerate(zip(job_reports, job_reports[1:]))]
@@ -2,30 +2,11 @@
 
 from typing import List, Dict, Any, Optional
 from models.unemp_row import UnempRow
+from utils.value_parser import parse_value, parse_values
 
-def _parse_pct(val: Optional[str]) -> Optional[float]:
-    if not val:
-        return None
-    try:
-        return float(val.replace("%", "").strip())
-    except Exception:
-        return None
-
-def generate_unemp_summary(rows: List[UnempRow]) -> Dict[str, Any]:
-    """
-    Expects newest -> oldest rows.
-    Compares latest vs previous month, computes surprise vs forecast.
-    """
-    if not rows or len(rows) < 2:
-        raise ValueError("Need at least two rows of data")
-
-    latest = rows[0]
-    prev = rows[1]
-
-    actual = _parse_pct(latest.actual)
-    forecast = _parse_pct(latest.forecast)
-    prev_actual = _parse_pct(prev.actual)
-
+def _unemp_summary(latest: UnempRow, prev: UnempRow, actual: Optional[float], forecast: Optional[float],
+                   prev_actual: Optional[float]) -> Dict[str, Any]:
+    """Summary of one release from its parsed values; the single and batch forms both end here."""
     change_val = (actual - prev_actual) if (actual is not None and prev_actual is not None) else None
     surprise_val = (actual - forecast) if (actual is not None and forecast is not None) else None
 
@@ -68,3 +49,31 @@ def generate_unemp_summary(rows: List[UnempRow]) -> Dict[str, Any]:
         "change_from_previous": f"{change_val:+.1f}%" if change_val is not None else "N/A",
         "meta_commentary": commentary
     }
+
+
+def generate_unemp_summary(rows: List[UnempRow]) -> Dict[str, Any]:
+    """
+    Expects newest -> oldest rows.
+    Compares latest vs previous month, computes surprise vs forecast.
+    """
+    if not rows or len(rows) < 2:
+        raise ValueError("Need at least two rows of data")
+
+    latest = rows[0]
+    prev = rows[1]
+    return _unemp_summary(latest, prev, parse_value(latest.actual), parse_value(latest.forecast),
+                          parse_value(prev.actual))
+
+
+def generate_unemp_summaries(rows: List[UnempRow]) -> List[Dict[str, Any]]:
+    """
+    Batch generate_unemp_summary over every [i, i+1] window of newest -> oldest rows:
+    entry i equals generate_unemp_summary(rows[i:i+2]), with each column parsed once.
+    """
+    if len(rows) < 2:
+        return []
+
+    actual = parse_values([r.actual for r in rows])
+    forecast = parse_values([r.forecast for r in rows[:-1]])
+    return [_unemp_summary(latest, prev, actual[i], forecast[i], actual[i + 1])
+            for i, (latest, prev) in enumerate(zip(rows, rows[1:]))]
@@ -1,91 +1,132 @@
 # main.py
 
-import csv
+import argparse
+import contextlib
+import io
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Callable, Optional
+from utils.summary_store import SummaryStore
+from logic.impact.event_db import EventDatabase
+from utils.lazy import resolve
+from utils import metrics
+from utils.metrics import timed
+from utils.profiling import profiled
 
-# === CPI imports ===
-from data_fetchers.cpi_fetcher import fetch_cpi_rows                 # historic CPI (from saved HTML)
-from data_fetchers.cpi_latest_fetcher import fetch_latest_cpi_row    # live CPI (requests)
-from logic.cpi_summary_generator import generate_cpi_summary
-
-# === Jobs imports ===
-from data_fetchers.jobs_fetcher import fetch_all_jobs_reports        # historic Jobs (from saved HTML)
-from data_fetchers.jobs_latest_fetcher import fetch_latest_job_row   # live Jobs (requests)
-from logic.job_summary_generator import generate_jobs_summary
-
-# === Fed imports ===
-from data_fetchers.fed_fetcher import fetch_fed_rows                 # historic Fed (from saved HTML)
-from data_fetchers.fed_latest_fetcher import fetch_latest_fed_row    # live Fed (requests)
-from logic.fed_summary_generator import generate_fed_rate_summary
-
-# === Unemployment imports ===
-from data_fetchers.unemp_fetcher import fetch_unemp_rows             # historic Unemp (from saved HTML)
-from data_fetchers.unemp_latest_fetcher import fetch_latest_unemp_row# live Unemp (requests)
-from logic.unemp_summary_generator import generate_unemp_summary
+# Fetchers and summarizers are named "module:function" (see INDICATORS) and imported
+# only when an indicator runs, so the CLI starts without loading every parser,
+# requests, numpy and pandas.
 
 
 # ------------------------------
 # Helpers
 # ------------------------------
 
+# Daily IVV closes the returns stages read (data_fetchers/ivv_fetcher.py keeps it current)
+IVV_PRICES = "data/ivv_prices.csv"
+
+# Batch forms: one call summarizes every window, identical to calling the summarizer per window
+BATCH_SUMMARIZERS = {
+    "logic.cpi_summary_generator:generate_cpi_summary": "logic.cpi_summary_generator:generate_cpi_summaries",
+    "logic.job_summary_generator:generate_jobs_summary": "logic.job_summary_generator:generate_jobs_summaries",
+    "logic.fed_summary_generator:generate_fed_rate_summary": "logic.fed_summary_generator:generate_fed_rate_summaries",
+    "logic.unemp_summary_generator:generate_unemp_summary": "logic.unemp_summary_generator:generate_unemp_summaries",
+}
+
+def _target(fn) -> str:
+    return f"{getattr(fn, '__module__', '')}:{getattr(fn, '__qualname__', '')}"
+
 def _pairwise_summaries(items: List, summarizer: Callable[[List], dict]) -> List[dict]:
     """
     Build summaries using [current, previous] windows, assuming items are newest -> oldest.
+    Summarizers with a batch form (BATCH_SUMMARIZERS) do every window in one pass.
     """
-    out = []
-    for i in range(len(items) - 1):
-        try:
-            s = summarizer(items[i:i+2])
-            if isinstance(s, dict) and "error" not in s:
-                out.append(s)
-        except Exception as e:
-            print(f"⚠️ Skipping window at {i}: {e}")
-    return out
-
-def _write_csv(filename: str, rows: List[dict]) -> None:
-    if not rows:
-        print(f"⚠️ No rows to write for {filename}")
-        return
-    with open(filename, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
-        writer.writeheader()
-        writer.writerows(rows)
-    print(f"📄 Wrote {len(rows)} rows to {filename}")
-
-def insert_latest_at_top(filename: str, new_row: dict, label: str, unique_key: str) -> None:
+    with timed("summarize", summarizer=_target(summarizer), rows=len(items)):
+        batch = BATCH_SUMMARIZERS.get(_target(summarizer))
+        if batch is not None:
+            try:
+                return [s for s in resolve(batch)(items) if "error" not in s]
+            except (ValueError, TypeError) as e:
+                # A column the batch parse cannot take: the per-window path below builds the same
+                # summaries and reports bad windows one by one. Anything else is a bug.
+                print(f"⚠️ Batch summarizer {batch} fell back to per-window summaries: {e}")
+
+        out = []
+        for i in range(len(items) - 1):
+            try:
+                s = summarizer(items[i:i+2])
+                if isinstance(s, dict) and "error" not in s:
+                    out.append(s)
+            except Exception as e:
+                print(f"⚠️ Skipping window at {i}: {e}")
+        return out
+
+def _event_type(label: str) -> str:
+    """Store key for a label: CPI -> cpi, Jobs -> jobs, Fed -> fed, Unemployment -> unemployment."""
+    return label.lower()
+
+def upsert_latest(store: SummaryStore, filename: str, new_row: dict, label: str, unique_key: str) -> bool:
     """
-    Inserts the latest row at the top of the CSV file.
-    Removes any existing row with the same unique_key to avoid duplicates.
-    Creates the file if it doesn't exist.
+    Upsert the latest summary into the store, keyed by (event type, new_row[unique_key]).
+    An existing summary with the same key is replaced, so re-polling never duplicates.
+    The first upsert for an event type imports the existing CSV, if any, as its history.
+    Returns False when the store already had this exact summary.
     """
-    if os.path.isfile(filename):
-        with open(filename, "r", encoding="utf-8") as f:
-            existing = list(csv.DictReader(f))
-
-        # Remove duplicates based on the provided key (e.g., published_date, release_date)
-        existing = [row for row in existing if row.get(unique_key) != new_row.get(unique_key)]
-
-        # Insert latest at the top
-        existing.insert(0, new_row)
-
-        with open(filename, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=new_row.keys())
-            writer.writeheader()
-            writer.writerows(existing)
-
-        print(f"✅ Inserted latest {label} summary at the top of {filename} (duplicates removed by {unique_key})")
+    event_type = _event_type(label)
+    seeded = store.seed_from_csv(event_type, filename, unique_key)
+    if seeded:
+        print(f"📥 Imported {seeded} existing {label} summaries from {filename}")
+    if not store.upsert(event_type, new_row, unique_key):
+        print(f"✔️ Latest {label} summary unchanged (key {unique_key}={new_row.get(unique_key)!r})")
+        return False
+    print(f"✅ Upserted latest {label} summary (key {unique_key}={new_row.get(unique_key)!r})")
+    return True
+
+def export_summaries(store: SummaryStore, filename: str, label: str) -> None:
+    """Write the newest-first CSV view of a label's summaries."""
+    n = store.export_csv(_event_type(label), filename)
+    if n:
+        print(f"📄 Wrote {n} rows to {filename}")
     else:
-        with open(filename, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=new_row.keys())
-            writer.writeheader()
-            writer.writerow(new_row)
-        print(f"✅ Created {filename} with the latest {label} summary")
+        print(f"⚠️ No rows to write for {filename}")
 
-def rebuild_historic(csv_file: str, fetch_historic_func: Callable[[], List], summarizer, label: str) -> List[dict]:
+def store_latest_returns(store: EventDatabase, summary: dict, label: str, prices_path: str = IVV_PRICES) -> bool:
+    """
+    Price one new summary against the IVV sessions (as the *_returns_demo stages do) and
+    upsert it into event_returns, revising the running statistics in the same transaction,
+    so live_tables() and event_analysis.py --live include the release right away.
+    Returns False when it cannot be priced yet (no prices, or its session has not closed);
+    the returns stages pick it up on their next run.
     """
-    Rebuild the full historic CSV from saved HTML (skipping placeholder rows),
+    if not os.path.isfile(prices_path):
+        return False
+    import pandas as pd
+    from data_fetchers.session_store import SessionStore
+    from logic.impact.event_windows import attach_window_returns
+    from logic.impact.returns import attach_returns_df
+    from utils.storage import to_typed
+
+    # The loaders' view of a summary CSV row: typed columns, release_date, event_type
+    event = to_typed(pd.DataFrame([summary]))
+    event = event.rename(columns={"published_date": "release_date", "decision_date": "release_date"})
+    event["event_type"] = _event_type(label)
+    ivv = SessionStore().sync("IVV", prices_path)
+    priced = attach_returns_df(event, ivv, release_col="release_date")
+    if priced.empty:
+        return False
+    store.upsert_event_returns(attach_window_returns(priced, ivv))
+    return True
+
+def rebuild_historic(csv_file: str,
+                     fetch_historic_func: Callable[[], List],
+                     summarizer,
+                     label: str,
+                     unique_key: str = "published_date",
+                     store: EventDatabase | None = None) -> List[dict]:
+    """
+    Rebuild the full historic summaries from saved HTML (skipping placeholder rows),
+    replace them (and the raw rows) in the event database, export the CSV,
     and return the list of summary dicts (newest -> oldest).
     """
     try:
@@ -99,7 +140,10 @@ def rebuild_historic(csv_file: str, fetch_historic_func: Callable[[], List], sum
         return []
 
     summaries = _pairwise_summaries(rows, summarizer)
-    _write_csv(csv_file, summaries)
+    store = store or EventDatabase()
+    store.write_raw_rows(_event_type(label), rows)
+    store.replace_all(_event_type(label), summaries, unique_key)
+    export_summaries(store, csv_file, label)
     return summaries
 
 def _get_reference(obj) -> Optional[str]:
@@ -113,10 +157,14 @@ def add_latest(csv_file: str,
                fetch_historic_func,
                summarizer,
                label: str,
-               unique_key: str) -> dict | None:
+               unique_key: str,
+               store: EventDatabase | None = None,
+               export: bool = True) -> dict | None:
     """
     Fetch latest live row, pair with the most recent *different-month* historic row,
-    summarize, and insert at top of the CSV. Removes duplicates by unique_key.
+    summarize, and upsert it into the store by unique_key (so it lands at the top of the
+    newest-first view). The CSV view is rewritten only when the summary changed (or the CSV
+    is missing); export=False never rewrites it.
     """
     latest_live = fetch_latest_func()
     if not latest_live:
@@ -147,86 +195,196 @@ def add_latest(csv_file: str,
         prev_row = historic_rows[0]
 
     try:
-        latest_summary = summarizer([latest_live, prev_row])
+        with timed("summarize", summarizer=_target(summarizer), rows=2):
+            latest_summary = summarizer([latest_live, prev_row])
     except Exception as e:
         print(f"❌ Failed to generate latest {label} summary: {e}")
         return None
 
-    insert_latest_at_top(csv_file, latest_summary, label, unique_key=unique_key)
+    store = store or EventDatabase()
+    store.upsert_raw_row(_event_type(label), latest_live)
+    changed = upsert_latest(store, csv_file, latest_summary, label, unique_key=unique_key)
+    try:
+        if store_latest_returns(store, latest_summary, label):
+            print(f"📈 Added the latest {label} release to the live event statistics")
+        else:
+            print(f"⏳ Latest {label} release not priced yet; live statistics update on the next returns run")
+    except Exception as e:
+        print(f"❌ Failed to attach returns for the latest {label} release: {e}")
+    if export and (changed or not os.path.isfile(csv_file)):
+        export_summaries(store, csv_file, label)
     print(f"\n📊 Latest {label} Summary:\n")
     print(json.dumps(latest_summary, indent=2))
     return latest_summary
 
 
+def _latest_source(prefetched: dict | None, label: str, fetch_latest_func):
+    """
+    Use the row fetched concurrently up front (see fetch_all_latest) when available,
+    otherwise fall back to fetching it on demand.
+    """
+    if prefetched is None:
+        return fetch_latest_func
+    return lambda: prefetched.get(label)
+
+
+# ------------------------------
+# Indicators
+# ------------------------------
+
+# label -> how to rebuild and extend its summaries; main() runs them in this order.
+# Functions are "module:function" targets, resolved when the indicator runs.
+INDICATORS = {
+    "CPI": dict(csv_file="cpi_summary.csv",
+                fetch_historic_func="data_fetchers.cpi_fetcher:fetch_cpi_rows",               # saved HTML
+                fetch_latest_func="data_fetchers.cpi_latest_fetcher:fetch_latest_cpi_row",   # live (requests)
+                summarizer="logic.cpi_summary_generator:generate_cpi_summary",
+                unique_key="published_date"),
+    "Jobs": dict(csv_file="jobs_summary.csv",
+                 fetch_historic_func="data_fetchers.jobs_fetcher:fetch_all_jobs_reports",
+                 fetch_latest_func="data_fetchers.jobs_latest_fetcher:fetch_latest_job_row",
+                 summarizer="logic.job_summary_generator:generate_jobs_summary",
+                 unique_key="published_date"),
+    "Fed": dict(csv_file="fed_summary.csv",
+                fetch_historic_func="data_fetchers.fed_fetcher:fetch_fed_rows",
+                fetch_latest_func="data_fetchers.fed_latest_fetcher:fetch_latest_fed_row",
+                summarizer="logic.fed_summary_generator:generate_fed_rate_summary",
+                unique_key="release_date"),   # Fed uses release_date
+    "Unemployment": dict(csv_file="unemp_summary.csv",
+                         fetch_historic_func="data_fetchers.unemp_fetcher:fetch_unemp_rows",
+                         fetch_latest_func="data_fetchers.unemp_latest_fetcher:fetch_latest_unemp_row",
+                         summarizer="logic.unemp_summary_generator:generate_unemp_summary",
+                         unique_key="published_date"),
+}
+
+# Steps an indicator run can do, in the order they run
+STEPS = ("rebuild", "latest")
+
+def indicator_labels(names: List[str] | None = None) -> List[str]:
+    """
+    INDICATORS labels for names given as labels or event types, any case ('cpi', 'Jobs',
+    'unemployment'), in INDICATORS order; None means all of them. Raises KeyError on unknown names.
+    """
+    if names is None:
+        return list(INDICATORS)
+    by_key = {_event_type(label): label for label in INDICATORS}
+    wanted = set()
+    for name in names:
+        if _event_type(name) not in by_key:
+            raise KeyError(f"unknown indicator {name!r} (choose from {', '.join(by_key)})")
+        wanted.add(by_key[_event_type(name)])
+    return [label for label in INDICATORS if label in wanted]
+
+def _spec(label: str) -> dict:
+    """INDICATORS entry with its functions imported."""
+    return {k: resolve(v) if k.endswith(("_func", "summarizer")) else v for k, v in INDICATORS[label].items()}
+
+def run_indicator(label: str,
+                  prefetched: dict | None = None,
+                  store: EventDatabase | None = None,
+                  steps=STEPS,
+                  export: bool = True,
+                  profile_dir: str | None = None) -> None:
+    """
+    Rebuild the historic summaries for one indicator, then add its latest release at the top.
+    With profile_dir set, each step is sampled into <event type>_<step>.* files there.
+    """
+    spec = _spec(label)
+    store = store or EventDatabase()
+    if "rebuild" in steps:
+        with profiled(f"{_event_type(label)}_rebuild", profile_dir):
+            rebuild_historic(
+                csv_file=spec["csv_file"],
+                fetch_historic_func=spec["fetch_historic_func"],
+                summarizer=spec["summarizer"],
+                label=label,
+                unique_key=spec["unique_key"],
+                store=store,
+            )
+    if "latest" in steps:
+        with profiled(f"{_event_type(label)}_latest", profile_dir):
+            add_latest(
+                csv_file=spec["csv_file"],
+                fetch_latest_func=_latest_source(prefetched, label, spec["fetch_latest_func"]),
+                fetch_historic_func=spec["fetch_historic_func"],
+                summarizer=spec["summarizer"],
+                label=label,
+                unique_key=spec["unique_key"],
+                store=store,
+                export=export,
+            )
+
+def _run_indicator_logged(label: str, prefetched: dict | None, steps=STEPS, export: bool = True,
+                          profile_dir: str | None = None) -> tuple[str, dict]:
+    """
+    Process-pool entry point: run one indicator with its own DB connection; returns its
+    log and its metrics sums (the parent merges them, since workers never write the metrics file).
+    """
+    metrics.reset()   # a reused or forked worker may still hold earlier sums
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        try:
+            with EventDatabase() as store:
+                run_indicator(label, prefetched, store, steps, export, profile_dir)
+        except Exception as e:
+            print(f"❌ {label} {'/'.join(steps)} failed: {e}")
+    return buf.getvalue(), metrics.snapshot()
+
 # ------------------------------
 # Main
 # ------------------------------
 
-def main():
-    # === Rebuild historic CPI, then add latest CPI at top ===
-    rebuild_historic(
-        csv_file="cpi_summary.csv",
-        fetch_historic_func=fetch_cpi_rows,
-        summarizer=generate_cpi_summary,
-        label="CPI"
-    )
-    add_latest(
-        csv_file="cpi_summary.csv",
-        fetch_latest_func=fetch_latest_cpi_row,
-        fetch_historic_func=fetch_cpi_rows,
-        summarizer=generate_cpi_summary,
-        label="CPI",
-        unique_key="published_date",
-    )
-
-    # === Rebuild historic Jobs, then add latest Jobs at top ===
-    rebuild_historic(
-        csv_file="jobs_summary.csv",
-        fetch_historic_func=fetch_all_jobs_reports,
-        summarizer=generate_jobs_summary,
-        label="Jobs"
-    )
-    add_latest(
-        csv_file="jobs_summary.csv",
-        fetch_latest_func=fetch_latest_job_row,
-        fetch_historic_func=fetch_all_jobs_reports,
-        summarizer=generate_jobs_summary,
-        label="Jobs",
-        unique_key="published_date",
-    )
-
-    # === Rebuild historic Fed, then add latest Fed at top ===
-    rebuild_historic(
-        csv_file="fed_summary.csv",
-        fetch_historic_func=fetch_fed_rows,
-        summarizer=generate_fed_rate_summary,
-        label="Fed"
-    )
-    add_latest(
-        csv_file="fed_summary.csv",
-        fetch_latest_func=fetch_latest_fed_row,
-        fetch_historic_func=fetch_fed_rows,
-        summarizer=generate_fed_rate_summary,
-        label="Fed",
-        unique_key="release_date",   # Fed uses release_date
-    )
-
-    # === Rebuild historic Unemployment, then add latest Unemployment at top ===
-    rebuild_historic(
-        csv_file="unemp_summary.csv",
-        fetch_historic_func=fetch_unemp_rows,
-        summarizer=generate_unemp_summary,
-        label="Unemployment"
-    )
-    add_latest(
-        csv_file="unemp_summary.csv",
-        fetch_latest_func=fetch_latest_unemp_row,
-        fetch_historic_func=fetch_unemp_rows,
-        summarizer=generate_unemp_summary,
-        label="Unemployment",
-        unique_key="published_date",
-    )
+def main(concurrent_latest: bool = False,
+         workers: int = 1,
+         labels: List[str] | None = None,
+         steps=STEPS,
+         export: bool = True,
+         profile_dir: str | None = None):
+    """
+    Rebuild every indicator (or just `labels`) and add its latest release; `steps`
+    limits a run to ("rebuild",) or ("latest",), and export=False leaves the CSV views alone.
+    profile_dir samples every indicator step into flame-graph files (see utils/profiling.py).
+
+    workers > 1 runs the indicators in separate processes (HTML parsing is CPU-bound,
+    so threads would serialize on the GIL); wall time then tracks the slowest indicator.
+    Each indicator writes only its own CSV and event-type rows, so the output matches a
+    sequential run, and each indicator's log is printed as one block in INDICATORS order.
+    """
+    labels = indicator_labels(labels)
+
+    # Optionally fetch all live rows in parallel before any rebuild work
+    prefetched = None
+    if concurrent_latest and "latest" in steps:
+        from data_fetchers.latest_pool import fetch_all_latest
+        prefetched = fetch_all_latest(labels)
+
+    if workers <= 1 or len(labels) <= 1:
+        with EventDatabase() as store:
+            for label in labels:
+                run_indicator(label, prefetched, store, steps, export, profile_dir)
+        return
 
+    n = len(labels)
+    with ProcessPoolExecutor(max_workers=min(workers, n)) as pool:
+        # map() yields in submission order, so logs come out in a fixed order
+        for log, sums in pool.map(_run_indicator_logged, labels, [prefetched] * n, [steps] * n, [export] * n,
+                                  [profile_dir] * n):
+            print(log, end="")
+            metrics.merge(sums)
 
-if __name__ == "__main__":
+
+def stage(read=None) -> None:
+    """Pipeline stage (scripts/run_pipeline.py --with-main): writes the summary CSVs itself."""
     main()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild historic summaries and add the latest live releases.")
+    parser.add_argument("--concurrent-latest", action="store_true",
+                        help="fetch all latest releases in parallel over one pooled session")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="rebuild indicators in this many processes (default 1: sequential)")
+    parser.add_argument("--profile", nargs="?", const="profiles", metavar="DIR",
+                        help="sample each indicator step; flame-graph and top-N files go to DIR (default: profiles)")
+    args = parser.parse_args()
+    main(concurrent_latest=args.concurrent_latest, workers=args.workers, profile_dir=args.profile)
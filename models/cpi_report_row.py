@@ -8,3 +8,4 @@ class CpiReportRow:
     previous: str
     consensus: str
     forecast: str
+    time: str = ""  # release time as shown on the page, e.g. "08:30" (see config.INVESTING_UTC_OFFSET)
@@ -10,3 +10,4 @@ class JobReportRow:
     previous: str         # e.g., "14K"
     consensus: str        # e.g., "110K"
     forecast: str         # e.g., "110K"
+    time: str = ""        # e.g., "08:30" (page clock, see config.INVESTING_UTC_OFFSET)
@@ -9,3 +9,4 @@ class UnempRow:
     forecast: str
     previous: str
     consensus: str  # same as forecast
+    time: str = ""  # release time as shown on the page, e.g. "08:30" (see config.INVESTING_UTC_OFFSET)
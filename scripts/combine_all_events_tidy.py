@@ -1,7 +1,14 @@
 import sys, os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+import re
 import pandas as pd
+from utils.storage import read_table, write_table
+from logic.impact.event_db import EventDatabase, WITH_RETURNS_PATHS
+
+# Per-ticker / per-window return columns (ivv_same_day_return, tlt_next_day_return,
+# ivv_ret_d0_p5, ...) are carried into the tidy table as-is, for every ticker.
+RETURN_COL_RE = re.compile(r"^[a-z0-9]+_(same_day_return|next_day_return|ret_\w+)$")
 
 
 def _first_nonnull(df, cols):
@@ -46,8 +53,13 @@ def _select_and_rename_common(df, mappings, event_type_fixed=None):
     ref_cols = [c for c in ["reference_month", "latest_reference_month"] if c in df.columns]
     out["reference_month"] = _first_nonnull(df, ref_cols) if ref_cols else None
 
+    for col in df.columns:
+        if RETURN_COL_RE.match(col):
+            out[col] = df[col]
+
     # Ensure proper dtypes
-    out["release_date"] = pd.to_datetime(out["release_date"], errors="coerce")
+    # (release dates carry -04:00/-05:00 offsets; go through UTC so mixed offsets parse)
+    out["release_date"] = pd.to_datetime(out["release_date"], errors="coerce", utc=True).dt.tz_convert("America/New_York")
     out = out.sort_values("release_date").reset_index(drop=True)
 
     return out
@@ -58,9 +70,10 @@ def load_and_tidy_all(
     jobs_path="data/jobs_with_returns.csv",
     unemp_path="data/unemp_with_returns.csv",
     fed_path="data/fed_with_returns.csv",
+    read=read_table,
 ):
     # --- CPI ---
-    cpi = pd.read_csv(cpi_path)
+    cpi = read(cpi_path)
     cpi_map = {
         "release_date": ["release_date", "published_date"],
         "event_type": "event_type",
@@ -77,7 +90,7 @@ def load_and_tidy_all(
     cpi_tidy = _select_and_rename_common(cpi, cpi_map, event_type_fixed="cpi")
 
     # --- Jobs ---
-    jobs = pd.read_csv(jobs_path)
+    jobs = read(jobs_path)
     jobs_map = {
         "release_date": ["release_date", "published_date"],
         "event_type": "event_type",
@@ -94,7 +107,7 @@ def load_and_tidy_all(
     jobs_tidy = _select_and_rename_common(jobs, jobs_map, event_type_fixed="jobs")
 
     # --- Unemployment ---
-    unemp = pd.read_csv(unemp_path)
+    unemp = read(unemp_path)
     unemp_map = {
         "release_date": ["release_date", "published_date"],
         "event_type": "event_type",
@@ -111,7 +124,7 @@ def load_and_tidy_all(
     unemp_tidy = _select_and_rename_common(unemp, unemp_map, event_type_fixed="unemployment")
 
     # --- Fed ---
-    fed = pd.read_csv(fed_path)
+    fed = read(fed_path)
     fed_map = {
         "release_date": ["release_date"],
         "event_type": "event_type",
@@ -135,11 +148,19 @@ def load_and_tidy_all(
     return combined
 
 
+OUT_PATH = "data/all_events_tidy.csv"
+
+def stage(read=read_table) -> dict:
+    """Pipeline stage: the four *_with_returns tables -> {OUT_PATH: tidy table}."""
+    return {OUT_PATH: load_and_tidy_all(read=read)}
+
+
 def main():
-    out_path = "data/all_events_tidy.csv"
-    combined = load_and_tidy_all()
-    combined.to_csv(out_path, index=False)
-    print(f"✅ Wrote {len(combined)} rows to {out_path}")
+    with EventDatabase() as db:
+        db.seed_event_returns(WITH_RETURNS_PATHS)
+        combined = stage(db.reader())[OUT_PATH]
+    write_table(combined, OUT_PATH)
+    print(f"✅ Wrote {len(combined)} rows to {OUT_PATH}")
 
 
 if __name__ == "__main__":
@@ -2,29 +2,28 @@ import sys, os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import pandas as pd
+from logic.impact.event_db import EventDatabase, WITH_RETURNS_PATHS
+from utils.storage import read_table, write_table
 
-def main():
-    # Load each dataset
-    cpi = pd.read_csv("data/cpi_with_returns.csv")
-    jobs = pd.read_csv("data/jobs_with_returns.csv")
-    unemp = pd.read_csv("data/unemp_with_returns.csv")
-    fed = pd.read_csv("data/fed_with_returns.csv")
+OUT_PATH = "data/all_events_with_returns.csv"
 
-    # Standardize column names if needed
-    datasets = [cpi, jobs, unemp, fed]
-    for df in datasets:
-        df["release_date"] = pd.to_datetime(df["release_date"], errors="coerce")
-        # Keep only key columns
-        df = df.dropna(subset=["release_date"])
-    
-    # Combine them
-    combined = pd.concat(datasets, ignore_index=True)
+def stage(read=read_table) -> dict:
+    """Pipeline stage: the four *_with_returns tables -> {OUT_PATH: combined}."""
+    combined = pd.concat([read(p) for p in WITH_RETURNS_PATHS.values()], ignore_index=True)
 
     # Sort by release date
     combined = combined.sort_values("release_date").reset_index(drop=True)
+    return {OUT_PATH: combined}
+
+def main():
+    # Every event type's rows from the event database, one indexed read per type
+    # (CSVs are imported once for types the returns demos haven't written yet)
+    with EventDatabase() as db:
+        db.seed_event_returns(WITH_RETURNS_PATHS)
+        combined = stage(db.reader())[OUT_PATH]
 
     # Save master dataset
-    combined.to_csv("data/all_events_with_returns.csv", index=False)
+    write_table(combined, OUT_PATH)
     print(f"✅ Combined dataset saved with {len(combined)} rows.")
 
 if __name__ == "__main__":
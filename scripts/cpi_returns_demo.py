@@ -1,14 +1,30 @@
 import pandas as pd
 from logic.impact.loaders import load_cpi
-from logic.impact.returns import load_ivv_prices, attach_returns_df
+from logic.impact.returns import attach_returns_df
+from logic.impact.event_windows import attach_window_returns
+from logic.impact.event_db import EventDatabase
+from data_fetchers.session_store import SessionStore
+from utils.storage import read_table, write_table
 
-def main():
-    ivv = load_ivv_prices("data/ivv_prices.csv")
-    cpi = load_cpi("data/cpi_summary.csv")
+OUT_PATH = "data/cpi_with_returns.csv"
+
+def stage(read=read_table) -> dict:
+    """Pipeline stage: cpi summaries + IVV sessions -> {OUT_PATH: cpi_with_returns} (also stored in the event DB)."""
+    with EventDatabase() as db:
+        db.sync_prices("IVV", "data/ivv_prices.csv")
+        ivv = SessionStore().sync("IVV", "data/ivv_prices.csv")  # mapped sessions, re-read only when the CSV changes
+        cpi = load_cpi("data/cpi_summary.csv", read=read)
 
-    cpi_with_returns = attach_returns_df(cpi, ivv, release_col="release_date")
-    cpi_with_returns.to_csv("data/cpi_with_returns.csv", index=False)
-    print(f"✅ Wrote {len(cpi_with_returns)} rows to data/cpi_with_returns.csv")
+        cpi_with_returns = attach_returns_df(cpi, ivv, release_col="release_date")
+        # Pre-drift / multi-day windows alongside the same-day and next-day returns
+        cpi_with_returns = attach_window_returns(cpi_with_returns, ivv)
+        db.write_event_returns(cpi_with_returns)
+    return {OUT_PATH: cpi_with_returns}
+
+def main():
+    cpi_with_returns = stage()[OUT_PATH]
+    write_table(cpi_with_returns, OUT_PATH)
+    print(f"✅ Wrote {len(cpi_with_returns)} rows to {OUT_PATH}")
 
 if __name__ == "__main__":
     main()
@@ -1,40 +1,55 @@
+import argparse
+import time
 import pandas as pd
-import numpy as np
-from typing import Union
-
-def parse_magnitude(val: object) -> Union[float, None]:
-    if val is None or (isinstance(val, float) and np.isnan(val)):
-        return np.nan
-    s = str(val).strip()
-    if s == "" or s.upper() == "N/A":
-        return np.nan
-    sign = -1.0 if s.startswith("-") else 1.0
-    s_clean = s.replace("+", "").replace("-", "")
-    try:
-        if s_clean.endswith("pp"):
-            return sign * float(s_clean[:-2].strip())
-        if s_clean.endswith("%"):
-            return sign * float(s_clean[:-1].strip())
-        if s_clean.endswith(("K","k")):
-            return sign * float(s_clean[:-1].strip())      # thousands
-        if s_clean.endswith(("M","m")):
-            return sign * float(s_clean[:-1].strip())*1000 # millions -> thousands
-        return sign * float(s_clean)
-    except Exception:
-        return np.nan
+from logic.impact.event_db import EventDatabase
+from logic.impact.online_stats import revision_bucket
+from logic.impact.resampling import ResampleTask, STATISTICS, resample
+from utils.metrics import record
+from utils.profiling import profiled
+from utils.storage import read_table, write_table
+from utils.value_parser import parse_series
+
+RETURN_COLUMNS = ["same_day_return", "next_day_return"]
 
 def winsorize(series: pd.Series, p=0.01):
     lo, hi = series.quantile(p), series.quantile(1-p)
     return series.clip(lo, hi)
 
-def main():
-    df = pd.read_csv("data/all_events_tidy.csv")
-    # Parse numerics
-    df["surprise_num"] = df["surprise"].apply(parse_magnitude)
-    df["revision_change_num"] = df["revision_change"].apply(parse_magnitude)
+def significance_tasks(signed: pd.DataFrame, jobs: pd.DataFrame, trimmed: pd.DataFrame) -> list[ResampleTask]:
+    """One resampling task per bucket statistic reported in the three tables above."""
+    tasks = []
+    for event_type, g in signed.groupby("event_type", sort=True, observed=True):
+        pos, neg = g[g["surprise_num"] > 0], g[g["surprise_num"] < 0]
+        for col in RETURN_COLUMNS:
+            labels = {"table": "surprise_buckets", "column": col}
+            tasks.append(ResampleTask({**labels, "bucket": f"{event_type}:pos"}, pos[col].to_numpy()))
+            tasks.append(ResampleTask({**labels, "bucket": f"{event_type}:neg"}, neg[col].to_numpy()))
+            tasks.append(ResampleTask({**labels, "bucket": f"{event_type}:pos-neg"}, pos[col].to_numpy(), neg[col].to_numpy()))
+    if "rev_bucket" in jobs.columns:
+        for bucket, g in jobs.groupby("rev_bucket", sort=True):
+            for col in RETURN_COLUMNS:
+                tasks.append(ResampleTask({"table": "jobs_revision_buckets", "column": col, "bucket": bucket},
+                                          g[col].to_numpy(), stats=STATISTICS))
+    for event_type, g in trimmed.groupby("event_type", sort=True, observed=True):
+        for col in RETURN_COLUMNS:
+            tasks.append(ResampleTask({"table": "overall_summary", "column": col, "bucket": str(event_type)},
+                                      g[col].to_numpy(), stats=STATISTICS))
+    return tasks
+
+def stage(read=read_table, n_resamples: int = 10_000, seed: int = 0, workers: int = 1) -> dict:
+    """
+    Pipeline stage: the tidy table -> {out_* path: report table}; prints the reports.
+    out_significance.csv adds a bootstrap CI and permutation p-value for every bucket statistic.
+    """
+    started = time.perf_counter()
+    out = {}
+    df = read("data/all_events_tidy.csv")
+    # Numerics: storage already parses value columns into *_num (older tables are parsed here)
+    for col in ["surprise", "revision_change"]:
+        if col + "_num" not in df.columns:
+            df[col + "_num"] = parse_series(df[col])
     df["same_day_return"] = pd.to_numeric(df.get("same_day_return", df.get("ivv_same_day_return")), errors="coerce")
     df["next_day_return"] = pd.to_numeric(df.get("next_day_return", df.get("ivv_next_day_return")), errors="coerce")
-    df["release_date"] = pd.to_datetime(df["release_date"], errors="coerce")
 
     # Optional: trim crazy outliers to make averages interpretable
     trimmed = df.copy()
@@ -59,19 +74,14 @@ def main():
 
     print("\n=== Surprise buckets (surprise > 0 vs < 0) — means by event type ===")
     print(sign_table.round(4))
-    sign_table.to_csv("data/out_surprise_buckets.csv")
+    out["data/out_surprise_buckets.csv"] = sign_table.reset_index()
 
     # --- 2) Jobs revisions: big down vs big up
     jobs = trimmed[trimmed["event_type"] == "jobs"].copy()
     jobs = jobs.dropna(subset=["revision_change_num","same_day_return","next_day_return"])
 
-    def cut_revision(x):
-        if x <= -50: return "down_big(≤-50K)"
-        if x >=  50: return "up_big(≥+50K)"
-        return "small(>-50K & <+50K)"
-
     if not jobs.empty:
-        jobs["rev_bucket"] = jobs["revision_change_num"].apply(cut_revision)
+        jobs["rev_bucket"] = jobs["revision_change_num"].apply(revision_bucket)
         rev_table = jobs.groupby("rev_bucket").agg(
             N=("revision_change_num","size"),
             mean_same=("same_day_return","mean"),
@@ -83,14 +93,14 @@ def main():
         ).sort_index()
         print("\n=== Jobs revisions — bucketed impact ===")
         print(rev_table.round(4))
-        rev_table.to_csv("data/out_jobs_revision_buckets.csv")
+        out["data/out_jobs_revision_buckets.csv"] = rev_table.reset_index()
 
         # Show top 10 biggest absolute revisions with returns
         top10 = jobs.reindex(jobs["revision_change_num"].abs().sort_values(ascending=False).index).head(10)
         cols = [c for c in ["release_date","reference_month","revision_change","surprise","same_day_return","next_day_return","meta_commentary"] if c in top10.columns]
         print("\n=== Jobs — top 10 absolute revisions ===")
         print(top10[cols].to_string(index=False))
-        top10.to_csv("data/out_jobs_top10_revisions.csv", index=False)
+        out["data/out_jobs_top10_revisions.csv"] = top10
     else:
         print("\n(No jobs rows with revision data.)")
 
@@ -106,7 +116,44 @@ def main():
     )
     print("\n=== Overall summary (winsorized 1% tails) ===")
     print(overall.round(4))
-    overall.to_csv("data/out_overall_summary.csv")
+    out["data/out_overall_summary.csv"] = overall.reset_index()
+
+    # --- 4) Significance: bootstrap CIs and permutation p-values for each bucket statistic
+    signed = trimmed.dropna(subset=["event_type", "surprise_num", "same_day_return", "next_day_return"])
+    t = time.perf_counter()
+    sig = resample(significance_tasks(signed, jobs, trimmed), n_resamples=n_resamples, seed=seed, workers=workers)
+    print(f"\n=== Significance ({n_resamples:,} resamples, 95% bootstrap CI, two-sided permutation p; "
+          f"{time.perf_counter() - t:.1f}s) ===")
+    print(sig.round(4).to_string(index=False))
+    out["data/out_significance.csv"] = sig
+    record("analysis", time.perf_counter() - started, rows=len(df), resamples=n_resamples)
+    return out
+
+def live_reports(db: EventDatabase | None = None) -> dict:
+    """The bucket tables from the event database's running statistics (raw, un-winsorized returns)."""
+    if db is None:
+        with EventDatabase() as db:
+            return live_reports(db)
+    tables = db.live_tables()
+    for name, table in tables.items():
+        print(f"\n=== Live {name.replace('_', ' ')} (running stats, raw returns) ===")
+        print(table.round(4).to_string(index=False) if not table.empty else "(no events yet)")
+    return {f"data/out_live_{name}.csv": table for name, table in tables.items()}
+
+def main():
+    ap = argparse.ArgumentParser(description="Bucketed event-return reports with resampled significance.")
+    ap.add_argument("--live", action="store_true",
+                    help="serve the bucket tables from the database's running statistics instead of recomputing")
+    ap.add_argument("--resamples", type=int, default=10_000, help="bootstrap / permutation resamples per bucket")
+    ap.add_argument("--seed", type=int, default=0, help="seed for reproducible resamples")
+    ap.add_argument("--workers", type=int, default=1, help="processes to shard the resampling tasks across")
+    ap.add_argument("--profile", nargs="?", const="profiles", metavar="DIR",
+                    help="sample the run; flame-graph and top-N files go to DIR (default: profiles)")
+    args = ap.parse_args()
+    with profiled("event_analysis", args.profile):
+        out = live_reports() if args.live else stage(n_resamples=args.resamples, seed=args.seed, workers=args.workers)
+    for path, table in out.items():
+        write_table(table, path)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,292 @@
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import argparse
+import functools
+import numpy as np
+import pandas as pd
+import config
+from data_fetchers.price_cache import write_price_cache
+from logic.impact.intraday import _utc_offset
+
+NY = "America/New_York"
+
+# Earliest release the generator will schedule: sessions must stay inside pandas' nanosecond range
+EARLIEST = pd.Timestamp("1680-01-01")
+
+# indicator -> saved page it stands in for, table/event id, New York release clock
+PAGES = {
+    "cpi": dict(file="cpi_investing.html", event_id=733, clock="08:30"),
+    "jobs": dict(file="nfp_investing.html", event_id=227, clock="08:30"),
+    "fed": dict(file="fed_investing.html", event_id=168, clock="14:00"),
+    "unemployment": dict(file="unemp_investing.html", event_id=300, clock="08:30"),
+}
+
+# Months with an FOMC decision (eight meetings a year)
+FED_MONTHS = (1, 3, 5, 6, 7, 9, 11, 12)
+
+_HEAD = """<table class="genTbl openTbl ecHistoryTbl" id="eventHistoryTable{event_id}">
+		<thead>
+			<tr>
+				<th class="left symbol noWrap">Release Date</th>
+				<th class="left time noWrap">Time</th>
+                                    <th class="act noWrap">Actual</th>
+                    <th class="for noWrap">Forecast</th>
+                    <th class="pre noWrap">Previous</th>
+                    <th></th>
+                			</tr>
+		</thead>
+		<tbody>
+"""
+
+_ROW = """<tr id="historicEvent_{row_id}" event_attr_id="{event_id}" event_timestamp="{utc:%Y-%m-%d %H:%M:%S}">
+            <td class="left">{date}</td>
+            <td class="left">{time}</td>
+                            <td class="noWrap"><span class="{actual_class}" title="{actual_title}">{actual}</span></td>
+                <td class="noWrap">{forecast}</td>
+                <td class="{previous_class} noWrap">{previous}</td>
+                <td class="icon center"><i class="{icon}"{icon_title}></i></td>
+                    </tr>
+"""
+
+_TAIL = """</tbody>
+	</table>"""
+
+BLANK = "&nbsp;"
+
+# ------------------------------
+# Release schedule
+# ------------------------------
+
+def release_days(kind: str, n: int, end, freq: str | None = None) -> pd.DatetimeIndex:
+    """
+    The last n release days on or before `end`, oldest first. The default follows each
+    indicator's calendar (CPI mid-month, jobs/unemployment first Friday, Fed eight
+    meetings a year); freq (e.g. "B") packs releases closer so more fit.
+    """
+    end = pd.Timestamp(end).normalize()
+    if freq:
+        days = pd.date_range(end=end, periods=n, freq=freq)
+    else:
+        per_year = len(FED_MONTHS) if kind == "fed" else 12
+        months = pd.period_range(end=end.to_period("M"), periods=(n // per_year + 2) * 12, freq="M")
+        if kind == "fed":
+            months = months[months.month.isin(FED_MONTHS)]
+        starts = months.to_timestamp()
+        if kind == "cpi":
+            days = starts + pd.Timedelta(days=11) + pd.offsets.BDay(0)              # ~12th, next weekday
+        elif kind == "fed":
+            days = starts + pd.Timedelta(days=14) + pd.offsets.Week(0, weekday=2)   # third Wednesday
+        else:
+            days = starts + pd.offsets.Week(0, weekday=4)                           # first Friday
+        days = days[days <= end][-n:]
+    if len(days) < n or days[0] < EARLIEST:
+        raise ValueError(f"{n} {kind} releases do not fit between {EARLIEST.date()} and {end.date()}; "
+                         "pass a denser freq such as 'B'")
+    return pd.DatetimeIndex(days)
+
+def release_clock(days: pd.DatetimeIndex, clock: str) -> tuple[pd.DatetimeIndex, list[str]]:
+    """New York release clock -> (naive UTC timestamps, times as the page shows them: config.INVESTING_UTC_OFFSET)."""
+    utc = (days + pd.Timedelta(clock + ":00")).tz_localize(NY).tz_convert("UTC").tz_localize(None)
+    page = utc + _utc_offset(config.INVESTING_UTC_OFFSET)
+    return utc, [f"{t:%H:%M}" for t in page]
+
+def _date_text(kind: str, day: pd.Timestamp) -> str:
+    """'Aug 01, 2025  (Jul)' with the reference month; Fed rows have none ('Sep 17, 2025 ')."""
+    if kind == "fed":
+        return f"{day:%b %d, %Y} "
+    return f"{day:%b %d, %Y}  ({(day.to_period('M') - 1).strftime('%b')})"
+
+# ------------------------------
+# Values
+# ------------------------------
+
+def _walk(rng, n: int, start: float, mean: float, keep: float, step: float) -> np.ndarray:
+    """Mean-reverting random walk (AR(1))."""
+    out = np.empty(n)
+    x = start
+    shocks = rng.normal(0, step, n)
+    for i in range(n):
+        x = keep * x + (1 - keep) * mean + shocks[i]
+        out[i] = x
+    return out
+
+def release_values(kind: str, n: int, rng) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (actual, forecast, revised previous) for n releases, oldest first. The revised array
+    is what the next release shows as Previous; it differs from actual where revised.
+    """
+    if kind == "jobs":
+        actual = np.round(_walk(rng, n, 180, 170, 0.6, 90))
+        shock = rng.random(n) < 0.01                      # COVID-sized months: "-20,500K", "4,800K"
+        actual[shock] = np.round(rng.choice([-1, 1], shock.sum()) * rng.uniform(1000, 20000, shock.sum()))
+        forecast = np.round(actual + rng.normal(0, 70, n))
+        revised = actual + np.where(rng.random(n) < 0.8, np.round(rng.normal(0, 30, n)), 0)
+    elif kind == "fed":
+        moves = rng.choice([-0.25, 0.0, 0.25], n, p=[0.12, 0.76, 0.12])
+        actual = np.empty(n)
+        rate = 2.0
+        for i, m in enumerate(moves):
+            rate = min(max(rate + m, 0.25), 10.0)
+            actual[i] = rate
+        forecast = np.where(rng.random(n) < 0.9, actual, actual - moves)
+        revised = actual.copy()
+    else:
+        if kind == "cpi":
+            actual = np.clip(np.round(_walk(rng, n, 2.5, 2.5, 0.97, 0.25), 1), -3.0, 15.0)
+        else:
+            actual = np.clip(np.round(_walk(rng, n, 5.5, 5.5, 0.98, 0.12), 1), 2.5, 20.0)
+        forecast = np.round(actual + rng.normal(0, 0.12, n), 1)
+        revised = actual + np.where(rng.random(n) < 0.03, rng.choice([-0.1, 0.1], n), 0)
+    return actual, forecast, np.round(revised, 2)
+
+def display(kind: str, x: float) -> str:
+    """Page format: '2.7%', '4.50%', '-33K', '4,800K'."""
+    if kind == "jobs":
+        return f"{int(x):,}K"
+    return f"{x:.2f}%" if kind == "fed" else f"{x:.1f}%"
+
+def _verdict(kind: str, actual: float, expected: float) -> tuple[str, str]:
+    """Span class and title Investing.com gives an actual against its forecast."""
+    diff = (actual - expected) * (-1 if kind == "unemployment" else 1)   # lower unemployment is better
+    if abs(diff) < 1e-9:
+        return "blackFont", "In Line with Expectation"
+    return ("greenFont", "Better Than Expected") if diff > 0 else ("redFont", "Worse Than Expected")
+
+# ------------------------------
+# Pages
+# ------------------------------
+
+def investing_page(kind: str, n: int, seed: int = 0, end="2025-08-31", freq: str | None = None,
+                   upcoming: int = 1) -> str:
+    """
+    A page shaped like the saved eventHistoryTable<id> snapshots: n released rows plus
+    `upcoming` placeholder rows on top (blank actual), newest first. About 2% of
+    forecasts are blank and 1% "N/A", and 0.2% of releases are "N/A" placeholders
+    that the fetchers skip.
+    """
+    page = PAGES[kind]
+    rng = np.random.default_rng(seed)
+    days = release_days(kind, n + upcoming, end, freq)
+    utc, times = release_clock(days, page["clock"])
+    actual, forecast, revised = release_values(kind, n, rng)
+    forecast_gap = rng.random(n)
+    placeholder = rng.random(n) < 0.002
+    higher_better = kind != "unemployment"
+
+    rows = []
+    for i in range(n + upcoming):
+        row = dict(row_id=300000 + i, event_id=page["event_id"], utc=utc[i], date=_date_text(kind, days[i]),
+                   time=times[i], icon="diamondNewEmptyIcon", icon_title="", previous_class="blackFont")
+        if i:
+            shown, original = revised[i - 1], actual[i - 1]
+            row["previous"] = display(kind, shown)
+            if shown != original:
+                up = (shown > original) == higher_better
+                row.update(previous_class="greenFont" if up else "redFont", icon="diamondNewIcon",
+                           icon_title=f' title="Revised From {display(kind, original)}"')
+        else:
+            row["previous"] = display(kind, actual[0])
+        if i >= n:   # upcoming release
+            row.update(actual=BLANK, actual_class="blackFont", actual_title="", forecast=BLANK)
+        elif placeholder[i]:
+            row.update(actual="N/A", actual_class="blackFont", actual_title="", forecast=BLANK)
+        else:
+            gap = forecast_gap[i]
+            row["forecast"] = BLANK if gap < 0.02 else "N/A" if gap < 0.03 else display(kind, forecast[i])
+            cls, title = _verdict(kind, actual[i], forecast[i]) if gap >= 0.03 else ("blackFont", "")
+            row.update(actual=display(kind, actual[i]), actual_class=cls, actual_title=title)
+        rows.append(_ROW.format(**row))
+    rows.reverse()   # the pages list newest first
+    return _HEAD.format(event_id=page["event_id"]) + "".join(rows) + _TAIL
+
+def synthetic_sessions(start, end, seed: int = 0) -> pd.DataFrame:
+    """Random-walk daily OHLCV on every weekday in [start, end], in the price cache shape."""
+    days = pd.bdate_range(start, end)
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.011, len(days))))
+    open_ = close * (1 + rng.normal(0, 0.003, len(days)))
+    wick = np.abs(rng.normal(0, 0.004, (2, len(days))))
+    return pd.DataFrame({
+        "Open": open_,
+        "High": np.maximum(open_, close) * (1 + wick[0]),
+        "Low": np.minimum(open_, close) * (1 - wick[1]),
+        "Close": close,
+        "Volume": rng.integers(1_000_000, 10_000_000, len(days)).astype("float64"),
+    }, index=pd.DatetimeIndex(days, name="Date"))
+
+# ------------------------------
+# Fixture directory
+# ------------------------------
+
+def write_fixtures(root: str, events: int, seed: int = 0, end="2025-08-31", freq: str | None = None,
+                   summaries: bool = True) -> dict[str, str]:
+    """
+    Write a self-contained fixture tree:
+
+      root/pages/*_investing.html      one page per indicator, `events` releases each
+      root/data/ivv_prices.csv         sessions covering every release (+ a week)
+      root/data/*_summary.csv          the historic summaries (summaries=True), as main.py builds them,
+      root/data/stockwatch.db          along with their raw rows in the event database
+
+    Scripts then run from root with STOCKWATCH_HTML_DIR=root/pages (see fixture_env).
+    Returns {name: path} of what was written.
+    """
+    pages = os.path.join(root, "pages")
+    data = os.path.join(root, "data")
+    os.makedirs(pages, exist_ok=True)
+    os.makedirs(data, exist_ok=True)
+
+    written = {}
+    first = pd.Timestamp(end)
+    for k, (kind, page) in enumerate(PAGES.items()):
+        path = os.path.join(pages, page["file"])
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(investing_page(kind, events, seed + k, end, freq))
+        written[kind] = path
+        first = min(first, release_days(kind, events + 1, end, freq)[0])
+
+    written["ivv_prices"] = os.path.join(data, "ivv_prices.csv")
+    write_price_cache(written["ivv_prices"],
+                      synthetic_sessions(first - pd.Timedelta(days=14), pd.Timestamp(end) + pd.Timedelta(days=14), seed))
+
+    if summaries:
+        import main
+        from logic.impact.event_db import EventDatabase
+        with EventDatabase(os.path.join(data, "stockwatch.db")) as store:
+            for label, kind in zip(main.INDICATORS, PAGES):
+                spec = main._spec(label)
+                csv_path = os.path.join(data, spec["csv_file"])
+                main.rebuild_historic(csv_path, functools.partial(spec["fetch_historic_func"], written[kind]),
+                                      spec["summarizer"], label, spec["unique_key"], store)
+                written[f"{kind}_summary"] = csv_path
+    return written
+
+def fixture_env(root: str) -> dict[str, str]:
+    """Environment that points the fetchers (and the stand-in latest server) at root/pages."""
+    return {"STOCKWATCH_HTML_DIR": os.path.abspath(os.path.join(root, "pages"))}
+
+def main():
+    ap = argparse.ArgumentParser(description="Write synthetic Investing.com pages, IVV sessions and summaries for offline load tests.")
+    ap.add_argument("root", help="fixture directory to create or overwrite")
+    ap.add_argument("--events", type=int, default=1000, help="released rows per indicator page")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--end", default="2025-08-31", help="latest release day")
+    ap.add_argument("--freq", help="pandas frequency for the releases (e.g. B) instead of each indicator's calendar; "
+                                   "needed beyond ~4,000 monthly releases")
+    ap.add_argument("--no-summaries", dest="summaries", action="store_false",
+                    help="pages and prices only; skip building data/*_summary.csv")
+    args = ap.parse_args()
+
+    try:
+        written = write_fixtures(args.root, args.events, args.seed, args.end, args.freq, args.summaries)
+    except ValueError as e:
+        ap.error(str(e))
+    for name, path in written.items():
+        print(f"📄 {name:<22} {path} ({os.path.getsize(path) / 1e6:.1f} MB)")
+    env = " ".join(f"{k}={v}" for k, v in fixture_env(args.root).items())
+    repo = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    print(f"\nRun against it:\n  cd {args.root} && {env} python {repo}/scripts/run_pipeline.py")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import argparse
+import hashlib
+import threading
+import time
+from collections import Counter
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import config
+from data_fetchers.latest_pool import LATEST_FETCHERS, fetch_all_latest
+
+# label -> (path on the stand-in server, saved snapshot it serves)
+PAGES = {
+    "CPI": ("/economic-calendar/cpi-733", "cpi_investing.html"),
+    "Jobs": ("/economic-calendar/nonfarm-payrolls-227", "nfp_investing.html"),
+    "Fed": ("/economic-calendar/interest-rate-decision-168", "fed_investing.html"),
+    "Unemployment": ("/economic-calendar/unemployment-rate-300", "unemp_investing.html"),
+}
+
+def start_standin_server(latency: float = 0.0, port: int = 0) -> ThreadingHTTPServer:
+    """
+    Serve the saved *_investing.html snapshots under their Investing.com paths,
+    sleeping `latency` seconds before each response. Runs on a daemon thread.
+
+    Responses carry ETag/Last-Modified and honour If-None-Match with a 304.
+    server.status_counts tallies the status codes sent.
+    """
+    bodies = {}
+    for path, html_file in PAGES.values():
+        with open(os.path.join(config.HTML_DIR, html_file), "rb") as f:
+            bodies[path] = f.read()
+    etags = {path: '"%s"' % hashlib.sha1(body).hexdigest() for path, body in bodies.items()}
+    last_modified = formatdate(usegmt=True)
+    status_counts = Counter()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, so connection reuse is exercised
+
+        def do_GET(self):
+            time.sleep(latency)
+            body = bodies.get(self.path)
+            if body is None:
+                status_counts[404] += 1
+                self.send_error(404)
+                return
+            if self.headers.get("If-None-Match") == etags[self.path]:
+                status_counts[304] += 1
+                self.send_response(304)
+                self.send_header("ETag", etags[self.path])
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            status_counts[200] += 1
+            self.send_response(200)
+            self.send_header("ETag", etags[self.path])
+            self.send_header("Last-Modified", last_modified)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    server.status_counts = status_counts
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def main():
+    ap = argparse.ArgumentParser(description="Sequential vs concurrent latest fetch against a local stand-in server")
+    ap.add_argument("--latency", type=float, default=0.5, help="seconds of injected latency per response")
+    ap.add_argument("--polls", type=int, default=5,
+                    help="follow-up polls (TTL 0) that should all be answered by 304s")
+    args = ap.parse_args()
+
+    server = start_standin_server(latency=args.latency)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    urls = {label: base + path for label, (path, _) in PAGES.items()}
+
+    try:
+        t = time.perf_counter()
+        sequential = {label: fetch(urls[label], ttl=0) for label, fetch in LATEST_FETCHERS.items()}
+        t_seq = time.perf_counter() - t
+
+        t = time.perf_counter()
+        concurrent = fetch_all_latest(urls=urls, ttl=0)
+        t_par = time.perf_counter() - t
+
+        # High-frequency polling: revalidate every time, nothing changed on the server
+        server.status_counts.clear()
+        t = time.perf_counter()
+        for _ in range(args.polls):
+            polled = {label: fetch(urls[label], ttl=0) for label, fetch in LATEST_FETCHERS.items()}
+            assert polled == concurrent, "cached poll returned different rows"
+        t_poll = time.perf_counter() - t
+    finally:
+        server.shutdown()
+
+    assert sequential == concurrent, "concurrent fetch returned different rows"
+    for label, row in concurrent.items():
+        print(f"{label:<13} {row}")
+    print(f"\n⏱️ sequential: {t_seq:.2f}s   concurrent: {t_par:.2f}s   (latency {args.latency:.2f}s per request)")
+    print(f"🔁 {args.polls} revalidating polls: {t_poll:.2f}s, responses {dict(server.status_counts)}")
+
+if __name__ == "__main__":
+    main()
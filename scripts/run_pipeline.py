@@ -0,0 +1,99 @@
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import argparse
+import time
+import config
+from utils import metrics
+from utils.pipeline import Stage, run_pipeline
+
+STATE_PATH = "data/.pipeline_state.json"
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Library code every stage depends on; editing any of it re-runs the stages.
+# Anchored at the repo so the pipeline can run from a fixture directory (scripts/generate_fixtures.py).
+CODE = [os.path.join(ROOT, p) for p in ("logic", "utils", "data_fetchers", "models", "config.py")]
+
+WITH_RETURNS = {
+    "cpi": "data/cpi_with_returns.csv",
+    "jobs": "data/jobs_with_returns.csv",
+    "unemp": "data/unemp_with_returns.csv",
+    "fed": "data/fed_with_returns.csv",
+}
+
+def _returns_stage(name: str) -> Stage:
+    return Stage(
+        name=f"{name}_returns",
+        fn=f"scripts.{name}_returns_demo:stage",
+        inputs=[f"data/{name}_summary.csv", "data/ivv_prices.csv"],
+        outputs=[WITH_RETURNS[name]],
+        code=CODE,
+    )
+
+STAGES = [
+    *(_returns_stage(n) for n in WITH_RETURNS),
+    Stage(
+        name="combine_returns",
+        fn="scripts.combine_all_returns:stage",
+        inputs=list(WITH_RETURNS.values()),
+        outputs=["data/all_events_with_returns.csv"],
+        code=CODE,
+    ),
+    Stage(
+        name="tidy",
+        fn="scripts.combine_all_events_tidy:stage",
+        inputs=list(WITH_RETURNS.values()),
+        outputs=["data/all_events_tidy.csv"],
+        code=CODE,
+    ),
+    Stage(
+        name="event_analysis",
+        fn="scripts.event_analysis:stage",
+        inputs=["data/all_events_tidy.csv"],
+        outputs=[
+            "data/out_surprise_buckets.csv",
+            "data/out_jobs_revision_buckets.csv",
+            "data/out_jobs_top10_revisions.csv",
+            "data/out_overall_summary.csv",
+            "data/out_significance.csv",
+        ],
+        code=CODE,
+    ),
+]
+
+# main.py fetches live releases, which cannot be hashed, so it always runs when included.
+# It writes the root-level *_summary.csv exports, not the data/ copies the returns stages read.
+MAIN_STAGE = Stage(
+    name="summaries",
+    fn="main:stage",
+    inputs=[os.path.join(config.HTML_DIR, f) for f in ("cpi_investing.html", "nfp_investing.html",
+                                           "fed_investing.html", "unemp_investing.html")],
+    outputs=["cpi_summary.csv", "jobs_summary.csv", "fed_summary.csv", "unemp_summary.csv"],
+    code=CODE,
+    volatile=True,
+)
+
+def main():
+    ap = argparse.ArgumentParser(description="Run the returns -> combine -> tidy -> analysis stages, skipping unchanged ones.")
+    ap.add_argument("--with-main", action="store_true", help="also run main.py (live fetches) first")
+    ap.add_argument("--force", action="store_true", help="run every stage even if its inputs are unchanged")
+    ap.add_argument("--workers", type=int, default=4, help="stages run at the same time")
+    ap.add_argument("--metrics-log", metavar="PATH", help="append a JSON line per timed stage (default: $STOCKWATCH_METRICS_LOG)")
+    ap.add_argument("--metrics-prom", metavar="PATH", help="write Prometheus text metrics here at exit (default: $STOCKWATCH_METRICS_PROM)")
+    ap.add_argument("--profile", nargs="?", const="profiles", metavar="DIR",
+                    help="sample each stage that runs; flame-graph and top-N files go to DIR (default: profiles)")
+    args = ap.parse_args()
+    metrics.configure(args.metrics_log, args.metrics_prom)
+
+    stages = ([MAIN_STAGE] if args.with_main else []) + STAGES
+    t = time.perf_counter()
+    status = run_pipeline(stages, STATE_PATH, max_workers=args.workers, force=args.force,
+                          profile_dir=args.profile)
+    counts = {s: list(status.values()).count(s) for s in ("ran", "skipped", "failed", "blocked")}
+    print(f"🏁 Pipeline finished in {time.perf_counter() - t:.2f}s: "
+          + ", ".join(f"{n} {s}" for s, n in counts.items() if n))
+    if counts["failed"] or counts["blocked"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -2,15 +2,31 @@ import sys, os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from logic.impact.loaders import load_unemp
-from logic.impact.returns import load_ivv_prices, attach_returns_df
+from logic.impact.returns import attach_returns_df
+from logic.impact.event_windows import attach_window_returns
+from logic.impact.event_db import EventDatabase
+from data_fetchers.session_store import SessionStore
+from utils.storage import read_table, write_table
 
-def main():
-    ivv = load_ivv_prices("data/ivv_prices.csv")
-    unemp = load_unemp("data/unemp_summary.csv")
+OUT_PATH = "data/unemp_with_returns.csv"
+
+def stage(read=read_table) -> dict:
+    """Pipeline stage: unemp summaries + IVV sessions -> {OUT_PATH: unemp_with_returns} (also stored in the event DB)."""
+    with EventDatabase() as db:
+        db.sync_prices("IVV", "data/ivv_prices.csv")
+        ivv = SessionStore().sync("IVV", "data/ivv_prices.csv")  # mapped sessions, re-read only when the CSV changes
+        unemp = load_unemp("data/unemp_summary.csv", read=read)
 
-    unemp_with_returns = attach_returns_df(unemp, ivv, release_col="release_date")
-    unemp_with_returns.to_csv("data/unemp_with_returns.csv", index=False)
-    print(f"✅ Wrote {len(unemp_with_returns)} rows to data/unemp_with_returns.csv")
+        unemp_with_returns = attach_returns_df(unemp, ivv, release_col="release_date")
+        # Pre-drift / multi-day windows alongside the same-day and next-day returns
+        unemp_with_returns = attach_window_returns(unemp_with_returns, ivv)
+        db.write_event_returns(unemp_with_returns)
+    return {OUT_PATH: unemp_with_returns}
+
+def main():
+    unemp_with_returns = stage()[OUT_PATH]
+    write_table(unemp_with_returns, OUT_PATH)
+    print(f"✅ Wrote {len(unemp_with_returns)} rows to {OUT_PATH}")
 
 if __name__ == "__main__":
     main()
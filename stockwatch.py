@@ -0,0 +1,76 @@
+# stockwatch.py
+"""
+Command line for the summary jobs in main.py, split by step:
+
+  python stockwatch.py rebuild --only cpi          rebuild CPI summaries from the saved pages
+  python stockwatch.py latest --all --no-export    poll every latest release into the database
+  python stockwatch.py run                         both steps for every indicator (= python main.py)
+
+Indicators are named by event type (cpi, jobs, fed, unemployment). Only argparse is
+imported before the arguments are parsed, and main.py imports an indicator's fetchers
+and summarizers when it runs, so --help and bad arguments return immediately.
+`python benchmarks/bench_startup.py` measures the import cost of each entry point.
+"""
+
+import argparse
+import sys
+
+# Kept in step with main.INDICATORS, so building the parser does not import main
+INDICATOR_NAMES = ("cpi", "jobs", "fed", "unemployment")
+
+def _add_selection(p: argparse.ArgumentParser, default_all: bool) -> None:
+    group = p.add_mutually_exclusive_group(required=not default_all)
+    group.add_argument("--only", nargs="+", metavar="NAME", type=str.lower, choices=INDICATOR_NAMES,
+                       help=f"indicators to process ({', '.join(INDICATOR_NAMES)})")
+    group.add_argument("--all", action="store_true", help="process every indicator"
+                       + (" (the default)" if default_all else ""))
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="stockwatch", description="Rebuild and extend the macro event summaries.")
+    parser.add_argument("--metrics-log", metavar="PATH",
+                        help="append a JSON line per timed stage (default: $STOCKWATCH_METRICS_LOG)")
+    parser.add_argument("--metrics-prom", metavar="PATH",
+                        help="write Prometheus text metrics here at exit (default: $STOCKWATCH_METRICS_PROM)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = sub.add_parser("rebuild", help="rebuild historic summaries from the saved HTML pages")
+    _add_selection(rebuild, default_all=True)
+    rebuild.add_argument("--workers", type=int, default=1,
+                         help="rebuild indicators in this many processes (default 1: sequential)")
+
+    latest = sub.add_parser("latest", help="fetch the latest live releases and upsert their summaries")
+    _add_selection(latest, default_all=False)
+    latest.add_argument("--concurrent", action="store_true",
+                        help="fetch all latest releases in parallel over one pooled session")
+    latest.add_argument("--no-export", dest="export", action="store_false",
+                        help="update the database only; leave the summary CSVs alone")
+
+    run = sub.add_parser("run", help="rebuild, then add the latest release (what main.py does)")
+    _add_selection(run, default_all=True)
+    run.add_argument("--workers", type=int, default=1)
+    run.add_argument("--concurrent-latest", action="store_true")
+
+    for p in (rebuild, latest, run):
+        p.add_argument("--profile", nargs="?", const="profiles", metavar="DIR",
+                       help="sample each indicator step; flame-graph and top-N files go to DIR (default: profiles)")
+    return parser
+
+def run(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    import main   # only now: the parse above may have exited (--help, bad arguments)
+    from utils import metrics
+    metrics.configure(args.metrics_log, args.metrics_prom)
+
+    labels = args.only   # None (all) unless --only
+    if args.command == "rebuild":
+        main.main(labels=labels, workers=args.workers, steps=("rebuild",), profile_dir=args.profile)
+    elif args.command == "latest":
+        main.main(labels=labels, concurrent_latest=args.concurrent, steps=("latest",), export=args.export,
+                  profile_dir=args.profile)
+    else:
+        main.main(labels=labels, workers=args.workers, concurrent_latest=args.concurrent_latest,
+                  profile_dir=args.profile)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(run())
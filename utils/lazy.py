@@ -0,0 +1,38 @@
+# utils/lazy.py
+"""
+Deferred imports for the command-line entry points.
+
+pandas and numpy cost ~0.45 s to import, which used to be paid by every
+`python main.py` / `python stockwatch.py` run before argument parsing, including
+--help and a `latest --no-export` poll that never touches a DataFrame.
+
+  lazy_import("pandas")   module stand-in that imports on first attribute access
+  resolve("pkg.mod:fn")   import a module and return one attribute (as the pipeline stages do)
+
+Modules that hold a lazy_import stand-in use `from __future__ import annotations`
+so their pd./np. annotations are not evaluated at definition time.
+"""
+
+import importlib
+
+class LazyModule:
+    """Stand-in for a module: the first attribute access imports it (through the normal import lock)."""
+
+    def __init__(self, name: str):
+        self.__name = name
+
+    def __getattr__(self, attr: str):
+        value = getattr(importlib.import_module(self.__name), attr)
+        setattr(self, attr, value)   # later lookups skip __getattr__
+        return value
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self.__name!r}>"
+
+def lazy_import(name: str) -> LazyModule:
+    return LazyModule(name)
+
+def resolve(target: str):
+    """'module:attribute' -> the attribute, importing the module now."""
+    module, name = target.split(":")
+    return getattr(importlib.import_module(module), name)
@@ -0,0 +1,153 @@
+# utils/metrics.py
+"""
+Stage timings and counters (stdlib only, safe to import from any module).
+
+    with timed("parse", page="cpi_investing.html") as m:
+        rows = ...
+        m["rows"], m["bytes"] = len(rows), len(html)
+
+Each timed block becomes one event, for example
+    {"ts": 1754051400.12, "stage": "parse", "seconds": 0.0121, "status": "ok",
+     "page": "cpi_investing.html", "rows": 84, "bytes": 44212}
+status is "error" (with the exception type) when the block raises, and the
+exception propagates.
+
+Stages recorded across the code: parse, http_fetch, summarize, write, read,
+store_write, returns, analysis, pipeline_stage. Events are appended as JSON lines
+to config.METRICS_LOG when it is set. They are also summed per stage in memory.
+write_prometheus renders those sums in the Prometheus text format. It runs at
+exit when config.METRICS_PROM is set, and can be called directly. Worker processes
+(main.py --workers) hand their sums back with snapshot() and the parent merge()s
+them, so the file covers multi-process runs too. The emoji
+progress lines on stdout stay; this is the machine-readable record next to them.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+import config
+
+_lock = threading.Lock()
+_log_path = config.METRICS_LOG
+_prom_path = config.METRICS_PROM
+
+# (stage, status) -> [count, seconds]; stage -> rows / bytes; (host, code) -> requests
+_seconds: dict = defaultdict(lambda: [0, 0.0])
+_rows: dict = defaultdict(int)
+_bytes: dict = defaultdict(int)
+_http: dict = defaultdict(int)
+
+def configure(log_path: str | None = None, prom_path: str | None = None) -> None:
+    """Override config.METRICS_LOG / METRICS_PROM for this process (None leaves a setting as it is)."""
+    global _log_path, _prom_path
+    if log_path is not None:
+        _log_path = log_path
+    if prom_path is not None:
+        _prom_path = prom_path
+
+def record(stage: str, seconds: float, status: str = "ok", **fields) -> None:
+    """Add one finished event (timed() calls this)."""
+    event = {"ts": round(time.time(), 3), "stage": stage, "seconds": round(seconds, 6), "status": status, **fields}
+    with _lock:
+        total = _seconds[(stage, status)]
+        total[0] += 1
+        total[1] += seconds
+        if isinstance(fields.get("rows"), int):
+            _rows[stage] += fields["rows"]
+        if isinstance(fields.get("bytes"), int):
+            _bytes[stage] += fields["bytes"]
+        if stage == "http_fetch":
+            _http[(fields.get("host", ""), str(fields.get("code", status)))] += 1
+        if _log_path:
+            os.makedirs(os.path.dirname(_log_path) or ".", exist_ok=True)
+            with open(_log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(event, default=str) + "\n")
+
+@contextmanager
+def timed(stage: str, **fields):
+    """Time the block and record it with `fields` plus whatever the block adds to the yielded dict."""
+    t = time.perf_counter()
+    try:
+        yield fields
+    except BaseException as e:
+        record(stage, time.perf_counter() - t, "error", error=type(e).__name__, **fields)
+        raise
+    record(stage, time.perf_counter() - t, **fields)
+
+def file_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+def totals() -> dict:
+    """In-process sums: {stage: {"count", "seconds", "errors", "rows", "bytes"}}."""
+    out = {}
+    with _lock:
+        for (stage, status), (count, seconds) in _seconds.items():
+            s = out.setdefault(stage, {"count": 0, "seconds": 0.0, "errors": 0, "rows": _rows[stage], "bytes": _bytes[stage]})
+            s["count"] += count
+            s["seconds"] += seconds
+            if status == "error":
+                s["errors"] += count
+    return out
+
+def reset() -> None:
+    with _lock:
+        for d in (_seconds, _rows, _bytes, _http):
+            d.clear()
+
+def snapshot() -> dict:
+    """The in-memory sums as plain picklable data, for a worker process to hand back (see merge)."""
+    with _lock:
+        return {"seconds": {k: list(v) for k, v in _seconds.items()}, "rows": dict(_rows),
+                "bytes": dict(_bytes), "http": dict(_http)}
+
+def merge(snap: dict) -> None:
+    """Add a worker's snapshot() to this process's sums, so write_prometheus covers its stages too."""
+    with _lock:
+        for key, (count, seconds) in snap["seconds"].items():
+            total = _seconds[key]
+            total[0] += count
+            total[1] += seconds
+        for name, target in (("rows", _rows), ("bytes", _bytes), ("http", _http)):
+            for key, n in snap[name].items():
+                target[key] += n
+
+def _label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def prometheus_text() -> str:
+    lines = ["# HELP stockwatch_stage_seconds Wall time spent in each stage.",
+             "# TYPE stockwatch_stage_seconds summary"]
+    with _lock:
+        for (stage, status), (count, seconds) in sorted(_seconds.items()):
+            labels = f'stage="{_label(stage)}",status="{_label(status)}"'
+            lines.append(f"stockwatch_stage_seconds_sum{{{labels}}} {seconds:.6f}")
+            lines.append(f"stockwatch_stage_seconds_count{{{labels}}} {count}")
+        for name, values, help_text in (("rows", _rows, "Rows handled by each stage."),
+                                        ("bytes", _bytes, "Bytes read or written by each stage.")):
+            lines += [f"# HELP stockwatch_stage_{name}_total {help_text}", f"# TYPE stockwatch_stage_{name}_total counter"]
+            lines += [f'stockwatch_stage_{name}_total{{stage="{_label(s)}"}} {v}' for s, v in sorted(values.items())]
+        lines += ["# HELP stockwatch_http_requests_total HTTP requests by host and status code.",
+                  "# TYPE stockwatch_http_requests_total counter"]
+        lines += [f'stockwatch_http_requests_total{{host="{_label(h)}",code="{_label(c)}"}} {n}'
+                  for (h, c), n in sorted(_http.items())]
+    return "\n".join(lines) + "\n"
+
+def write_prometheus(path: str | None = None) -> None:
+    """Write the sums so far (node_exporter textfile style: temp file + rename)."""
+    path = path or _prom_path
+    if not path:
+        return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(prometheus_text())
+    os.replace(tmp, path)
+
+atexit.register(write_prometheus)
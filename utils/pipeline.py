@@ -0,0 +1,216 @@
+# utils/pipeline.py
+"""
+Small DAG runner for the pipeline stages (see scripts/run_pipeline.py).
+
+A stage declares the files it reads and writes plus a "module:function" entry
+point. Dependencies come from matching one stage's outputs to another's inputs.
+Stages run in one process on a thread pool, as soon as their upstream stages
+finish, so independent ones (the four returns stages) overlap.
+
+Skipping: a stage is skipped when its input file hashes, its code hash (entry
+module plus Stage.code sources) and its output hashes all match the last
+successful run (recorded in the state file). File hashes are cached by (mtime, size), so a run where
+nothing changed only stats files and never imports the stage modules.
+
+Handoff: a stage is called as fn(read) and returns {output path: DataFrame}.
+The runner writes those with utils.storage.write_table and keeps the typed
+frames in memory, and read(path) hands them to downstream stages without
+re-reading the file (other paths fall back to read_table). A stage that writes its own outputs returns None.
+
+Profiling: with profile_dir set, each stage that runs is sampled by utils.profiling
+and leaves <stage>.collapsed.txt / .speedscope.json / .top.txt there.
+"""
+
+import hashlib
+import importlib.util
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from data_fetchers.row_cache import load_json, write_json_atomic
+from utils.lazy import resolve
+from utils.metrics import record, timed
+from utils.profiling import profiled
+
+@dataclass
+class Stage:
+    name: str
+    fn: str                                   # "module:function", imported only when the stage runs
+    inputs: list[str] = field(default_factory=list)
+    outputs: list[str] = field(default_factory=list)
+    code: list[str] = field(default_factory=list)  # extra source files/dirs whose changes force a re-run
+    volatile: bool = False                    # depends on something unhashable (live fetches): never skipped
+
+def _sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+class _Hasher:
+    """Content hashes, recomputed only when a file's (mtime_ns, size) changes."""
+
+    def __init__(self, known: dict):
+        self.known = dict(known)   # path -> [mtime_ns, size, sha256]
+        self.lock = threading.Lock()
+
+    def __call__(self, path: str) -> str | None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        with self.lock:
+            hit = self.known.get(path)
+        if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            return hit[2]
+        digest = _sha256(path)
+        with self.lock:
+            self.known[path] = [st.st_mtime_ns, st.st_size, digest]
+        return digest
+
+def _module_file(fn: str) -> str | None:
+    spec = importlib.util.find_spec(fn.split(":")[0])
+    return spec.origin if spec else None
+
+def _code_files(stage: Stage) -> list[str]:
+    """The entry module plus every .py file under stage.code, in a stable order."""
+    files = [f for f in [_module_file(stage.fn)] if f]
+    for entry in stage.code:
+        if os.path.isdir(entry):
+            for root, _dirs, names in sorted(os.walk(entry)):
+                files += [os.path.join(root, n) for n in sorted(names) if n.endswith(".py")]
+        else:
+            files.append(entry)
+    return files
+
+_print_lock = threading.Lock()
+
+def _log(msg: str) -> None:
+    with _print_lock:  # stages finish on worker threads; keep each line whole
+        print(msg, flush=True)
+
+def _check_graph(stages: list[Stage]) -> dict[str, set[str]]:
+    """stage name -> names of the stages producing its inputs; raises ValueError on duplicates or cycles."""
+    producer = {}
+    for s in stages:
+        for out in s.outputs:
+            if out in producer:
+                raise ValueError(f"{out} is produced by both {producer[out]} and {s.name}")
+            producer[out] = s.name
+    deps = {s.name: {producer[i] for i in s.inputs if i in producer} for s in stages}
+
+    done: set[str] = set()
+    pending = dict(deps)
+    while pending:
+        ready = [n for n, d in pending.items() if d <= done]
+        if not ready:
+            raise ValueError(f"Dependency cycle among stages: {sorted(pending)}")
+        for n in ready:
+            done.add(n)
+            del pending[n]
+    return deps
+
+def run_pipeline(stages: list[Stage],
+                 state_path: str,
+                 max_workers: int = 4,
+                 force: bool = False,
+                 profile_dir: str | None = None) -> dict[str, str]:
+    """
+    Run (or skip) every stage; returns {stage name: "ran" | "skipped" | "failed" | "blocked"}.
+    A failed stage blocks everything downstream of it; the rest still run.
+    profile_dir: sample each stage's function into flame-graph files there (None: off).
+    """
+    deps = _check_graph(stages)
+    by_name = {s.name: s for s in stages}
+    state = load_json(state_path) or {}
+    hasher = _Hasher(state.get("files", {}))
+    records = dict(state.get("stages", {}))
+
+    memory: dict = {}   # output path -> frame produced in this run
+    memory_lock = threading.Lock()
+
+    def read(path: str):
+        with memory_lock:
+            df = memory.get(path)
+        if df is not None:
+            return df.copy()  # stages may add columns; keep the shared frame intact
+        from utils.storage import read_table
+        return read_table(path)
+
+    def fingerprint(stage: Stage) -> dict:
+        code = hashlib.sha256()
+        for f in _code_files(stage):
+            code.update(f"{f}:{hasher(f)}\n".encode("utf-8"))
+        return {
+            "inputs": {p: hasher(p) for p in stage.inputs},
+            "code": code.hexdigest(),
+        }
+
+    def up_to_date(stage: Stage, fp: dict) -> bool:
+        rec = records.get(stage.name)
+        if force or stage.volatile or rec is None:
+            return False
+        if rec.get("inputs") != fp["inputs"] or rec.get("code") != fp["code"]:
+            return False
+        if None in fp["inputs"].values():
+            return False  # a missing input is never "unchanged"
+        return all(hasher(p) is not None and hasher(p) == rec.get("outputs", {}).get(p) for p in stage.outputs)
+
+    def execute(stage: Stage) -> str:
+        fp = fingerprint(stage)
+        if up_to_date(stage, fp):
+            _log(f"⏭️  {stage.name}: inputs unchanged, skipped")
+            record("pipeline_stage", 0.0, "skipped", name=stage.name)
+            return "skipped"
+
+        t = time.perf_counter()
+        with timed("pipeline_stage", name=stage.name) as m:
+            fn = resolve(stage.fn)
+            with profiled(stage.name, profile_dir):
+                produced = fn(read) or {}
+            m["outputs"] = len(produced)
+        if produced:
+            from utils.storage import write_table, to_typed
+            for path, df in produced.items():
+                write_table(df, path)
+                typed = to_typed(df)  # what read_table would return for the written file
+                with memory_lock:
+                    memory[path] = typed
+        missing = [p for p in stage.outputs if not os.path.exists(p)]
+        if missing:
+            raise RuntimeError(f"stage {stage.name} did not write {missing}")
+
+        fp["outputs"] = {p: hasher(p) for p in stage.outputs}
+        records[stage.name] = fp
+        _log(f"✅ {stage.name}: ran in {time.perf_counter() - t:.2f}s")
+        return "ran"
+
+    status: dict[str, str] = {}
+    running: dict = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while len(status) < len(stages):
+            for s in stages:
+                if s.name in status or s.name in running.values():
+                    continue
+                if any(status.get(d) in ("failed", "blocked") for d in deps[s.name]):
+                    status[s.name] = "blocked"
+                    _log(f"⛔ {s.name}: blocked by a failed upstream stage")
+                elif all(d in status for d in deps[s.name]):
+                    running[pool.submit(execute, s)] = s.name
+            if not running:
+                continue
+            finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for fut in finished:
+                name = running.pop(fut)
+                try:
+                    status[name] = fut.result()
+                except Exception as e:
+                    status[name] = "failed"
+                    records.pop(name, None)
+                    _log(f"❌ {name}: {e}")
+
+    write_json_atomic(state_path, {"files": hasher.known, "stages": {
+        n: r for n, r in records.items() if n in by_name}})
+    return status
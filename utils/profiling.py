@@ -0,0 +1,172 @@
+# utils/profiling.py
+"""
+Opt-in sampling profiler for pipeline stages and main.py steps (stdlib only).
+
+    with profiled("event_analysis", "profiles"):
+        stage(read)
+
+A background thread reads the calling thread's stack (sys._current_frames) every
+`interval` seconds until the block exits, then writes three files to the directory:
+
+    event_analysis.collapsed.txt    "frame;frame;frame count" lines (flamegraph.pl, speedscope, inferno)
+    event_analysis.speedscope.json  sampled profile, weighted by wall time (https://www.speedscope.app)
+    event_analysis.top.txt          top-N frames by self and total time
+
+Only the calling thread is sampled, so stages running side by side on the pipeline's
+thread pool get separate profiles. Work in other processes (the resampling pool,
+main.py --workers) is profiled only where that process enters profiled() itself.
+profiled(name, None) returns a nullcontext, so no thread is started and nothing is
+hooked when profiling is off.
+"""
+
+import json
+import os
+import sys
+import sysconfig
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STDLIB = sysconfig.get_paths()["stdlib"]
+DEFAULT_INTERVAL = 0.005
+DEFAULT_TOP = 25
+
+def _short_path(path: str) -> str:
+    """site-packages/pandas/core/frame.py -> pandas/core/frame.py; repo and stdlib files relative to their root."""
+    marker = "site-packages" + os.sep
+    if marker in path:
+        return path.split(marker, 1)[1]
+    for root in (ROOT, STDLIB):
+        if path.startswith(root + os.sep):
+            return os.path.relpath(path, root)
+    return path
+
+class StackSampler:
+    """Samples one thread's Python stack on a timer; stacks are root-first tuples of frame labels."""
+
+    def __init__(self, thread_id: int | None = None, interval: float = DEFAULT_INTERVAL):
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.interval = interval
+        self.counts: dict = defaultdict(int)      # stack -> samples
+        self.seconds: dict = defaultdict(float)   # stack -> wall time attributed to it
+        self.elapsed = 0.0
+        self._labels: dict = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            name = getattr(code, "co_qualname", code.co_name)
+            label = f"{name} ({_short_path(code.co_filename)}:{code.co_firstlineno})".replace(";", ",")
+            self._labels[code] = label
+        return label
+
+    def _run(self) -> None:
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+            if frame is None:
+                break
+            stack = []
+            while frame is not None:
+                stack.append(self._label(frame.f_code))
+                frame = frame.f_back
+            stack = tuple(reversed(stack))
+            self.counts[stack] += 1
+            self.seconds[stack] += now - last   # the actual gap, which grows when the GIL is busy
+            last = now
+
+    def start(self) -> "StackSampler":
+        self._started = time.perf_counter()
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.elapsed = time.perf_counter() - self._started
+
+# ------------------------------
+# Output formats
+# ------------------------------
+
+def collapsed_text(counts: dict) -> str:
+    return "".join(f"{';'.join(stack)} {n}\n" for stack, n in sorted(counts.items()))
+
+def speedscope_profile(name: str, seconds: dict, elapsed: float) -> dict:
+    frames, index = [], {}
+    samples, weights = [], []
+    for stack, s in sorted(seconds.items()):
+        ids = []
+        for label in stack:
+            if label not in index:
+                index[label] = len(frames)
+                func, _, where = label.rpartition(" (")
+                file, _, line = where.rstrip(")").rpartition(":")
+                frames.append({"name": func, "file": file, "line": int(line) if line.isdigit() else None})
+            ids.append(index[label])
+        samples.append(ids)
+        weights.append(round(s, 6))
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": frames},
+        "profiles": [{"type": "sampled", "name": name, "unit": "seconds", "startValue": 0,
+                      "endValue": round(max(elapsed, sum(weights)), 6), "samples": samples, "weights": weights}],
+        "name": name,
+        "exporter": "stockwatch utils/profiling.py",
+    }
+
+def hotspots(seconds: dict, top: int = DEFAULT_TOP) -> tuple[list, list]:
+    """([(frame, self seconds)], [(frame, total seconds)]) sorted by time, `top` of each."""
+    own, total = defaultdict(float), defaultdict(float)
+    for stack, s in seconds.items():
+        if not stack:
+            continue
+        own[stack[-1]] += s
+        for label in set(stack):   # recursion counts once per sample
+            total[label] += s
+    by_time = lambda d: sorted(d.items(), key=lambda kv: (-kv[1], kv[0]))[:top]
+    return by_time(own), by_time(total)
+
+def hotspot_text(name: str, sampler: StackSampler, top: int = DEFAULT_TOP) -> str:
+    sampled = sum(sampler.seconds.values()) or 1.0
+    own, total = hotspots(sampler.seconds, top)
+    lines = [f"{name}: {sum(sampler.counts.values()):,} samples every {sampler.interval * 1e3:g} ms "
+             f"over {sampler.elapsed:.2f}s"]
+    for title, rows in (("self", own), ("total", total)):
+        lines.append(f"\n{'seconds':>9} {'%':>6}  top {len(rows)} by {title} time")
+        lines += [f"{s:>9.3f} {100 * s / sampled:>5.1f}%  {label}" for label, s in rows]
+    return "\n".join(lines) + "\n"
+
+def write_profile(name: str, sampler: StackSampler, out_dir: str, top: int = DEFAULT_TOP) -> dict:
+    """Write the collapsed, speedscope and top-N files for one sampled block; returns {kind: path}."""
+    os.makedirs(out_dir, exist_ok=True)
+    paths = {kind: os.path.join(out_dir, f"{name}.{ext}") for kind, ext in
+             (("collapsed", "collapsed.txt"), ("speedscope", "speedscope.json"), ("top", "top.txt"))}
+    with open(paths["collapsed"], "w", encoding="utf-8") as f:
+        f.write(collapsed_text(sampler.counts))
+    with open(paths["speedscope"], "w", encoding="utf-8") as f:
+        json.dump(speedscope_profile(name, sampler.seconds, sampler.elapsed), f)
+    with open(paths["top"], "w", encoding="utf-8") as f:
+        f.write(hotspot_text(name, sampler, top))
+    return paths
+
+@contextmanager
+def _sampled(name: str, out_dir: str, interval: float, top: int):
+    sampler = StackSampler(interval=interval).start()
+    try:
+        yield sampler
+    finally:
+        sampler.stop()
+        paths = write_profile(name, sampler, out_dir, top)
+        print(f"🔥 {name}: {sum(sampler.counts.values()):,} samples -> {paths['top']}")
+
+def profiled(name: str, out_dir: str | None, interval: float = DEFAULT_INTERVAL, top: int = DEFAULT_TOP):
+    """Sample the block into out_dir/<name>.* when out_dir is set; a no-op context otherwise."""
+    if not out_dir:
+        return nullcontext()
+    return _sampled(name, out_dir, interval, top)
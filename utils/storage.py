@@ -0,0 +1,139 @@
+# utils/storage.py
+"""
+Typed table storage for pipeline artifacts.
+
+Stages keep naming artifacts by their CSV path (data/cpi_with_returns.csv, ...).
+With parquet storage the typed table is written next to it as .parquet and the
+CSV stays as an export view (config.CSV_EXPORT). read_table returns the same
+dtypes whichever file it ends up reading:
+  - release/published/decision dates and t0/t1 as tz-aware America/New_York timestamps
+    (display dates like "Aug 01, 2025  (Jul)" are left as text)
+  - event_type and the month-name columns as categoricals
+  - a float64 '<col>_num' column next to every display-value column
+    ("+0.1pp" -> 0.1, "-33K" -> -33.0, "4,800K" -> 4800.0, "4.50%" -> 4.5, "N/A" -> NaN)
+"""
+
+import importlib.util
+import os
+import pandas as pd
+import config
+from utils.metrics import timed, file_size
+from utils.value_parser import parse_value, parse_series, missing_mask
+
+NY_TZ = "America/New_York"
+DATE_COLUMNS = ("release_date", "published_date", "decision_date", "t0", "t1")
+CATEGORY_COLUMNS = ("event_type", "reference_month", "latest_reference_month", "previous_month_reference")
+NUM_SUFFIX = "_num"
+
+_warned_no_parquet = False
+
+def parquet_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+def parquet_path(csv_path: str) -> str:
+    return os.path.splitext(csv_path)[0] + ".parquet"
+
+def _is_text(s: pd.Series) -> bool:
+    return s.dtype == object or pd.api.types.is_string_dtype(s.dtype)
+
+def parse_value_column(s: pd.Series) -> pd.Series | None:
+    """
+    Numeric version of a display-value column (see utils.value_parser), or None if any
+    present value is not a number with an optional K/M/%/pp unit (i.e. it is not a value column).
+    """
+    if not _is_text(s):
+        return None
+    missing = missing_mask(s)
+    present = s[~missing]
+    if present.empty or parse_value(present.iloc[0]) is None:
+        return None  # cheap reject for commentary/label columns
+
+    num = parse_series(s)
+    if num[~missing].isna().any():
+        return None
+    return num
+
+def _date_column(s: pd.Series) -> pd.Series | None:
+    """s as tz-aware NY timestamps, or None if some present value is not an ISO timestamp."""
+    if isinstance(s.dtype, pd.DatetimeTZDtype):
+        return s.dt.tz_convert(NY_TZ)
+    if pd.api.types.is_datetime64_dtype(s.dtype):
+        return s.dt.tz_localize(NY_TZ)
+    if not _is_text(s):
+        return None
+    present = s.notna() & (s.astype(str).str.strip() != "")
+    parsed = pd.to_datetime(s.where(present), errors="coerce", utc=True, format="ISO8601")
+    if parsed[present].isna().any():
+        return None
+    return parsed.dt.tz_convert(NY_TZ)
+
+def to_typed(df: pd.DataFrame) -> pd.DataFrame:
+    """Typed copy of an artifact frame (see module docstring). Idempotent."""
+    df = df.copy()
+    for col in list(df.columns):
+        if col in DATE_COLUMNS:
+            dates = _date_column(df[col])
+            if dates is not None:
+                df[col] = dates
+        elif col in CATEGORY_COLUMNS:
+            df[col] = df[col].astype("category")
+        elif not col.endswith(NUM_SUFFIX):
+            num = parse_value_column(df[col])
+            if num is not None:
+                df[col] = df[col].where(num.notna())  # "N/A"/blank -> missing, as read_csv does
+                df[col + NUM_SUFFIX] = num
+    return df
+
+def _csv_view(df: pd.DataFrame) -> pd.DataFrame:
+    """The frame as it goes to CSV: derived '<col>_num' columns are dropped (readers re-derive them)."""
+    derived = [c for c in df.columns if c.endswith(NUM_SUFFIX) and c[:-len(NUM_SUFFIX)] in df.columns]
+    return df.drop(columns=derived)
+
+def write_table(df: pd.DataFrame,
+                csv_path: str,
+                fmt: str | None = None,
+                csv_export: bool | None = None) -> None:
+    """
+    Write an artifact in the configured format (config.STORAGE_FORMAT / CSV_EXPORT unless given).
+    Both files are replaced atomically; the parquet is written last so read_table prefers it.
+    """
+    global _warned_no_parquet
+    fmt = fmt or config.STORAGE_FORMAT
+    csv_export = config.CSV_EXPORT if csv_export is None else csv_export
+    if fmt not in ("parquet", "csv"):
+        raise ValueError(f"Unknown storage format {fmt!r} (expected 'parquet' or 'csv')")
+    if fmt == "parquet" and not parquet_available():
+        if not _warned_no_parquet:
+            print("⚠️ pyarrow is not installed; writing CSV artifacts only")
+            _warned_no_parquet = True
+        fmt = "csv"
+
+    os.makedirs(os.path.dirname(csv_path) or ".", exist_ok=True)
+    with timed("write", path=csv_path, format=fmt) as m:
+        m["rows"], m["bytes"] = len(df), 0
+        if fmt == "csv" or csv_export:
+            tmp = f"{csv_path}.{os.getpid()}.tmp"
+            _csv_view(df).to_csv(tmp, index=False)
+            os.replace(tmp, csv_path)
+            m["bytes"] += file_size(csv_path)
+        if fmt == "parquet":
+            pq = parquet_path(csv_path)
+            tmp = f"{pq}.{os.getpid()}.tmp"
+            to_typed(df).to_parquet(tmp, index=False)
+            os.replace(tmp, pq)
+            m["bytes"] += file_size(pq)
+
+def read_table(csv_path: str) -> pd.DataFrame:
+    """
+    Read an artifact by its CSV path: the .parquet sibling when it is at least as
+    new as the CSV (and pyarrow is available), otherwise the CSV, typed on load.
+    """
+    pq = parquet_path(csv_path)
+    with timed("read", path=csv_path) as m:
+        if os.path.isfile(pq) and parquet_available() and (
+                not os.path.isfile(csv_path) or os.stat(pq).st_mtime_ns >= os.stat(csv_path).st_mtime_ns):
+            df, m["format"], m["bytes"] = pd.read_parquet(pq), "parquet", file_size(pq)
+        else:
+            df, m["format"], m["bytes"] = to_typed(pd.read_csv(csv_path)), "csv", file_size(csv_path)
+        m["rows"] = len(df)
+    return df
@@ -0,0 +1,134 @@
+# utils/summary_store.py
+"""
+Keyed store of record for the generated summaries (SQLite, stdlib only).
+
+One row per (event_type, release_key), where release_key is the summary's
+unique_key value (e.g. published_date "Aug 01, 2025  (Jul)"). Upserts go
+through the primary-key B-tree, so adding the latest release is O(log n)
+no matter how much history is stored. Every write is a transaction, so a
+crash never leaves a half-written table. The summary CSVs are export views
+written from here (see export_csv).
+"""
+
+import csv
+import json
+import os
+import re
+import sqlite3
+from datetime import datetime
+import config
+from utils.lazy import lazy_import
+from utils.metrics import timed, file_size
+
+pd = lazy_import("pandas")   # only the CSV import below uses it
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS summaries (
+    event_type  TEXT NOT NULL,
+    release_key TEXT NOT NULL,
+    release_day TEXT,               -- ISO date parsed from release_key, for newest-first order
+    row_json    TEXT NOT NULL,      -- the summary dict, column order preserved
+    PRIMARY KEY (event_type, release_key)
+);
+CREATE INDEX IF NOT EXISTS summaries_newest ON summaries (event_type, release_day DESC);
+"""
+
+_DATE_FORMATS = ("%b %d, %Y", "%Y-%m-%d")
+
+def release_day(release_key: str) -> str | None:
+    """'Aug 01, 2025  (Jul)' / 'Sep 17, 2025' / '2025-08-01 ...' -> '2025-08-01' (None if unparseable)."""
+    s = re.sub(r"\s*\(.*\)", "", str(release_key)).strip()
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(s[:10] if fmt == "%Y-%m-%d" else s, fmt).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+class SummaryStore:
+    def __init__(self, path: str | None = None):
+        self.path = path or config.DB_PATH
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "SummaryStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @staticmethod
+    def _record(event_type: str, row: dict, unique_key: str) -> tuple:
+        key = str(row.get(unique_key))
+        return (event_type, key, release_day(key), json.dumps(row))
+
+    def upsert(self, event_type: str, row: dict, unique_key: str) -> bool:
+        """Insert or replace the summary with this row's unique_key value; False when it was already stored as-is."""
+        record = self._record(event_type, row, unique_key)
+        with timed("store_write", table="summaries", event_type=event_type, rows=1), self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO summaries (event_type, release_key, release_day, row_json) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (event_type, release_key) DO UPDATE SET "
+                "release_day = excluded.release_day, row_json = excluded.row_json "
+                "WHERE row_json IS NOT excluded.row_json OR release_day IS NOT excluded.release_day",
+                record,
+            )
+        return cur.rowcount > 0
+
+    def replace_all(self, event_type: str, rows: list[dict], unique_key: str) -> None:
+        """Swap in a full rebuild for one event type (rows newest -> oldest) in a single transaction."""
+        with timed("store_write", table="summaries", event_type=event_type, rows=len(rows)), self.conn:
+            self.conn.execute("DELETE FROM summaries WHERE event_type = ?", (event_type,))
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO summaries (event_type, release_key, release_day, row_json) VALUES (?, ?, ?, ?)",
+                [self._record(event_type, r, unique_key) for r in rows],
+            )
+
+    def count(self, event_type: str) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM summaries WHERE event_type = ?", (event_type,)).fetchone()[0]
+
+    def get(self, event_type: str, release_key: str) -> dict | None:
+        hit = self.conn.execute(
+            "SELECT row_json FROM summaries WHERE event_type = ? AND release_key = ?", (event_type, release_key)
+        ).fetchone()
+        return json.loads(hit[0]) if hit else None
+
+    def newest(self, event_type: str, limit: int | None = None) -> list[dict]:
+        """Summaries newest first (by release day; ties keep insertion order)."""
+        sql = "SELECT row_json FROM summaries WHERE event_type = ? ORDER BY release_day DESC, rowid ASC"
+        args: tuple = (event_type,)
+        if limit is not None:
+            sql += " LIMIT ?"
+            args += (limit,)
+        return [json.loads(r[0]) for r in self.conn.execute(sql, args)]
+
+    def seed_from_csv(self, event_type: str, csv_path: str, unique_key: str) -> int:
+        """One-time import of an existing summary CSV when the store has nothing for event_type yet."""
+        if self.count(event_type) or not os.path.isfile(csv_path):
+            return 0
+        rows = pd.read_csv(csv_path, dtype=str, keep_default_na=False).to_dict("records")
+        self.replace_all(event_type, rows, unique_key)
+        return len(rows)
+
+    def export_csv(self, event_type: str, csv_path: str) -> int:
+        """
+        Write the newest-first view of event_type to csv_path (columns from the newest row),
+        with csv.DictWriter as the summary CSVs have always been written (CRLF rows).
+        """
+        rows = self.newest(event_type)
+        if rows:
+            with timed("write", path=csv_path, format="csv", rows=len(rows)) as m:
+                tmp = f"{csv_path}.{os.getpid()}.tmp"
+                with open(tmp, "w", newline="", encoding="utf-8") as f:
+                    writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()), extrasaction="ignore")
+                    writer.writeheader()
+                    writer.writerows(rows)
+                os.replace(tmp, csv_path)
+                m["bytes"] = file_size(csv_path)
+        return len(rows)
@@ -0,0 +1,92 @@
+# utils/value_parser.py
+"""
+One parser for Investing.com display values and the summaries built from them.
+
+Grammar (surrounding whitespace ignored):
+    [+|-] digits[,digits...][.digits] [K | M | % | pp]
+K stays in thousands and M is scaled to thousands, so "4,800K" and "4.8M" both
+give 4800.0; "%" and "pp" just drop the unit ("-0.1pp" -> -0.1, "4.50%" -> 4.5).
+Blanks, "N/A" (any case) and None/NaN are missing. Anything else is not a value.
+
+parse_value is the scalar form (float, None when missing or not a value).
+parse_series is the column form: it returns float64 with NaN in the same places.
+parse_values returns that column as a list of parse_value results (None for NaN).
+It factorizes the column and runs one vectorized regex over the distinct
+strings, so its cost is a hash pass over n values plus work per distinct
+display string. Display columns repeat heavily.
+"""
+
+from __future__ import annotations
+
+import math
+import numbers
+import re
+from utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+VALUE_RE = r"^\s*([+-]?)\s*(\d[\d,]*\.?\d*|\.\d+)\s*(K|k|M|m|%|pp)?\s*$"
+_VALUE_PATTERN = re.compile(VALUE_RE)
+MISSING = ("", "N/A")
+
+def _is_number(val) -> bool:
+    # numpy registers its integer and floating scalars as numbers.Real, and np.bool_ is not
+    # one, so the scalar path (the latest-release summaries) never imports numpy
+    return isinstance(val, numbers.Real) and not isinstance(val, bool)
+
+def parse_value(val) -> float | None:
+    """'+0.1pp' -> 0.1, '-33K' -> -33.0, '4,800K' -> 4800.0, '1.2M' -> 1200.0, '4.50%' -> 4.5; else None."""
+    if val is None:
+        return None
+    if _is_number(val):
+        return float(val) if math.isfinite(val) else None
+    m = _VALUE_PATTERN.match(str(val))
+    if not m:
+        return None
+    sign, digits, unit = m.groups()
+    num = float(digits.replace(",", ""))
+    if unit in ("M", "m"):
+        num *= 1000
+    if not math.isfinite(num):
+        return None
+    return -num if sign == "-" else num
+
+def missing_mask(s: pd.Series) -> pd.Series:
+    """True where a value is missing (None/NaN, blank, 'N/A') rather than present."""
+    text = s.astype(str).str.strip().str.upper()
+    return s.isna() | text.isin(MISSING)
+
+def _parse_unique(uniques: np.ndarray) -> np.ndarray:
+    """Vectorized parse of distinct values (object array) -> float64 with NaN."""
+    text = pd.Series(uniques, dtype=object)
+    numeric = text.map(_is_number, na_action="ignore").fillna(False).astype(bool)
+    parts = text[~numeric].astype(str).str.extract(VALUE_RE)
+    num = parts[1].str.replace(",", "", regex=False).astype("float64")
+    num = num.where(~parts[2].isin(["M", "m"]), num * 1000)
+    num = num.where(parts[0] != "-", -num)
+
+    out = np.full(len(uniques), np.nan)
+    out[(~numeric).to_numpy()] = num.to_numpy()
+    if numeric.any():
+        out[numeric.to_numpy()] = text[numeric].astype("float64").to_numpy()
+    out[~np.isfinite(out)] = np.nan
+    return out
+
+def parse_series(values) -> pd.Series:
+    """Column form of parse_value: float64 Series (same index), NaN where parse_value gives None."""
+    s = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    if pd.api.types.is_numeric_dtype(s.dtype) and not pd.api.types.is_bool_dtype(s.dtype):
+        num = s.astype("float64")
+        return num.where(np.isfinite(num))
+    codes, uniques = pd.factorize(s, use_na_sentinel=True)
+    parsed = _parse_unique(np.asarray(uniques, dtype=object))
+    out = np.full(len(s), np.nan)
+    present = codes >= 0
+    out[present] = parsed[codes[present]]
+    return pd.Series(out, index=s.index, dtype="float64")
+
+def parse_values(values) -> list[float | None]:
+    """parse_value over a column, computed by parse_series: [parse_value(v) for v in values]."""
+    num = parse_series(values)
+    return [v if ok else None for v, ok in zip(num.tolist(), num.notna().tolist())]